@@ -1,110 +1,250 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-SRF2023 Scraping Results Analysis and Report Generator
+Scraping Results Analysis and Report Generator
 
 Author: Ming Liu
-Description: Analyzes and generates summary reports from SRF2023 scraping results.
-             Creates detailed statistics and CSV summaries for scraped conference data.
+Description: Analyzes the output of a scraper run in a single pass.
+             - Reads the master index (NAPAC2025_Complete_Index.json, or the
+               streaming NAPAC2025_All_Papers.jsonl) once
+             - Audits the Papers/, Presentations/ and Posters/ trees with one
+               os.scandir traversal per folder
+             - Reports download coverage, missing, zero-byte, corrupt, partial and
+               unexpected files, and per-session statistics
+             - Writes Sessions_Summary.csv (and optionally a JSON report)
+
+Usage:
+    python analyze_results.py [output_dir] [--conference NAPAC2025] [--papers] [--json report.json]
 """
+
+import argparse
+import csv
 import json
 import os
+import sys
 from pathlib import Path
+from typing import Dict, Iterator, Any
 
-def analyze_results():
-    results_dir = Path("SRF2023_Data")
-    sessions_dir = results_dir / "Sessions"
-    
-    print("🎯 SRF2023 Conference Scraping Results Analysis")
-    print("=" * 60)
-    
-    if not sessions_dir.exists():
-        print("❌ Results directory does not exist")
-        return
-    
-    total_papers = 0
-    total_available_pdfs = 0
-    session_stats = []
-    
-    # Analyze each Session
-    for session_folder in sessions_dir.iterdir():
-        if session_folder.is_dir():
-            json_file = session_folder / "papers_data.json"
-            if json_file.exists():
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                papers = data['papers']
-                available_pdfs = sum(1 for p in papers if p.get('pdf_available', False))
-                
-                session_stats.append({
-                    'name': data['session_info']['name'],
-                    'paper_count': len(papers),
-                    'available_pdfs': available_pdfs,
-                    'papers': papers
-                })
-                
-                total_papers += len(papers)
-                total_available_pdfs += available_pdfs
-    
-    # Sort and display results
-    session_stats.sort(key=lambda x: x['name'])
-    
-    print(f"📊 Overall Statistics:")
-    print(f"  ✅ Sessions processed: {len(session_stats)}")
-    print(f"  📄 Total papers: {total_papers}")
-    print(f"  💾 Available PDFs: {total_available_pdfs}")
+from catalogue import iter_index_sessions, iter_jsonl_sessions
+from download_manager import FILE_TYPES, MIN_FILE_SIZE, PDF_MAGIC, safe_filename
+
+
+def iter_sessions(output_dir: Path, conference: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read session data from the master index, or from the NDJSON export if there is no index.
+
+    Args:
+        output_dir: Scraper output directory
+        conference: Conference prefix of the master files (e.g. 'NAPAC2025')
+
+    Yields:
+        Session data dictionaries ('session_info', 'papers')
+    """
+    index_file = output_dir / f"{conference}_Complete_Index.json"
+    jsonl_file = output_dir / f"{conference}_All_Papers.jsonl"
+    if index_file.exists():
+        yield from iter_index_sessions(index_file)
+    elif jsonl_file.exists():
+        yield from iter_jsonl_sessions(jsonl_file)
+    else:
+        raise FileNotFoundError(f"No {index_file.name} or {jsonl_file.name} in {output_dir}")
+
+
+def scan_files(root: Path) -> Dict[str, Dict[str, os.DirEntry]]:
+    """
+    List the files of a download folder with os.scandir.
+
+    Args:
+        root: Download folder (e.g. 'Papers')
+
+    Returns:
+        Session folder name -> file name -> DirEntry
+    """
+    tree = {}
+    if not root.is_dir():
+        return tree
+    with os.scandir(root) as session_dirs:
+        for session_dir in session_dirs:
+            if not session_dir.is_dir():
+                continue
+            with os.scandir(session_dir.path) as files:
+                tree[session_dir.name] = {entry.name: entry for entry in files if entry.is_file()}
+    return tree
+
+
+def is_corrupt(entry: os.DirEntry) -> bool:
+    """True if a non-empty file is not a complete PDF (bad magic bytes or no '%%EOF' trailer)."""
+    size = entry.stat().st_size
+    if size < MIN_FILE_SIZE:
+        return True
+    with open(entry.path, 'rb') as f:
+        if f.read(len(PDF_MAGIC)) != PDF_MAGIC:
+            return True
+        f.seek(max(0, size - 1024))
+        return b'%%EOF' not in f.read()
+
+
+def analyze(output_dir: Path, conference: str) -> Dict[str, Any]:
+    """
+    Analyze a scraper output directory.
+
+    Args:
+        output_dir: Scraper output directory
+        conference: Conference prefix of the master files
+
+    Returns:
+        Report dictionary with 'totals', 'coverage', 'sessions' and file problem lists
+    """
+    trees = {file_type: scan_files(output_dir / folder) for file_type, folder, _ in FILE_TYPES}
+    expected = {file_type: set() for file_type, _, _ in FILE_TYPES}
+
+    report = {
+        'output_dir': str(output_dir),
+        'totals': {'sessions': 0, 'papers': 0, 'papers_with_abstract': 0, 'papers_without_authors': 0},
+        'coverage': {},
+        'sessions': [],
+        'missing': [], 'zero_byte': [], 'corrupt': [], 'partial': [], 'unexpected': []
+    }
+    coverage = {file_type: {'available': 0, 'present': 0} for file_type, _, _ in FILE_TYPES}
+
+    for session_data in iter_sessions(output_dir, conference):
+        session = session_data['session_info']
+        papers = session_data['papers']
+        session_dir = safe_filename(session['name'])
+        stats = {'id': session['id'], 'name': session['name'], 'papers': len(papers),
+                 'paper_ids': [paper['paper_id'] for paper in papers]}
+
+        for file_type, folder, suffix in FILE_TYPES:
+            files = trees[file_type].get(session_dir, {})
+            available = present = 0
+            for paper in papers:
+                if not paper.get(f'{file_type}_available'):
+                    continue
+                available += 1
+                name = f"{paper['paper_id']}{suffix}.pdf"
+                expected[file_type].add((session_dir, name))
+                rel_path = f"{folder}/{session_dir}/{name}"
+                entry = files.get(name)
+                if entry is None:
+                    report['missing'].append(rel_path)
+                elif entry.stat().st_size == 0:
+                    report['zero_byte'].append(rel_path)
+                elif is_corrupt(entry):
+                    report['corrupt'].append(rel_path)
+                else:
+                    present += 1
+            stats[f'{file_type}s_available'] = available
+            stats[f'{file_type}s_present'] = present
+            coverage[file_type]['available'] += available
+            coverage[file_type]['present'] += present
+
+        report['totals']['sessions'] += 1
+        report['totals']['papers'] += len(papers)
+        report['totals']['papers_with_abstract'] += sum(1 for p in papers if p.get('abstract'))
+        report['totals']['papers_without_authors'] += sum(1 for p in papers if not p.get('authors'))
+        report['sessions'].append(stats)
+
+    # Files on disk that no paper in the index accounts for
+    for file_type, folder, _ in FILE_TYPES:
+        for session_dir, files in trees[file_type].items():
+            for name in files:
+                rel_path = f"{folder}/{session_dir}/{name}"
+                if name.endswith(('.part', '.part.json')):
+                    report['partial'].append(rel_path)
+                elif (session_dir, name) not in expected[file_type]:
+                    report['unexpected'].append(rel_path)
+
+    for file_type, counts in coverage.items():
+        counts['coverage'] = counts['present'] / counts['available'] if counts['available'] else None
+    report['coverage'] = coverage
+    for key in ('missing', 'zero_byte', 'corrupt', 'partial', 'unexpected'):
+        report[key].sort()
+    report['sessions'].sort(key=lambda s: s['name'])
+    return report
+
+
+def print_report(report: Dict[str, Any], show_papers: bool = False, max_listed: int = 20):
+    """Print the analysis report."""
+    totals = report['totals']
+    print(f"📊 Overall Statistics ({report['output_dir']}):")
+    print(f"  ✅ Sessions: {totals['sessions']}")
+    print(f"  📄 Total papers: {totals['papers']}")
+    print(f"  📝 Papers with abstract: {totals['papers_with_abstract']}")
+    print(f"  👤 Papers without authors: {totals['papers_without_authors']}")
     print()
-    
-    print("📋 Detailed Session Results:")
+
+    print("💾 Download Coverage:")
+    for file_type, counts in report['coverage'].items():
+        if not counts['available']:
+            continue
+        print(f"  {file_type.title()}s: {counts['present']}/{counts['available']} ({counts['coverage']:.1%})")
+    for key, label in (('missing', 'Missing files'), ('zero_byte', 'Zero-byte files'), ('corrupt', 'Corrupt files'),
+                       ('partial', 'Partial downloads'), ('unexpected', 'Files not in index')):
+        files = report[key]
+        icon = "✅" if not files else "⚠️"
+        print(f"  {icon} {label}: {len(files)}")
+        for path in files[:max_listed]:
+            print(f"      {path}")
+        if len(files) > max_listed:
+            print(f"      ... and {len(files) - max_listed} more")
+    print()
+
+    print("📋 Session Statistics:")
     print("-" * 50)
-    
-    for session in session_stats:
-        print(f"📂 {session['name']}")
-        print(f"   📄 Paper count: {session['paper_count']}")
-        print(f"   💾 Available PDFs: {session['available_pdfs']}")
-        
-        if session['papers']:
-            print("   📝 Paper list:")
-            for i, paper in enumerate(session['papers'], 1):
-                pdf_icon = "📄" if paper.get('pdf_available', False) else "❌"
-                title = paper['title'][:60] + "..." if len(paper['title']) > 60 else paper['title']
-                print(f"     {pdf_icon} {paper['paper_id']}: {title}")
-                
-                # Show abstract preview
-                if paper.get('abstract'):
-                    abstract_preview = paper['abstract'][:100] + "..." if len(paper['abstract']) > 100 else paper['abstract']
-                    print(f"        Abstract: {abstract_preview}")
-        print()
-    
-    # Generate CSV summary
-    print("📈 Generating CSV summary file...")
-    csv_summary = results_dir / "Sessions_Summary.csv"
-    with open(csv_summary, 'w', encoding='utf-8-sig') as f:
-        f.write("Session Name,Paper Count,Available PDFs,Paper ID List\n")
-        for session in session_stats:
-            paper_ids = '; '.join([p['paper_id'] for p in session['papers']])
-            f.write(f'"{session["name"]}",{session["paper_count"]},{session["available_pdfs"]},"{paper_ids}"\n')
-    
-    print(f"✅ CSV summary saved to: {csv_summary}")
-    
-    # Check PDF download status
-    pdf_dir = results_dir / "PDFs"
-    if pdf_dir.exists():
-        print("\n📁 PDF Download Status:")
-        for session_pdf_dir in pdf_dir.iterdir():
-            if session_pdf_dir.is_dir():
-                pdf_files = list(session_pdf_dir.glob("*.pdf"))
-                print(f"  📂 {session_pdf_dir.name}: {len(pdf_files)} PDF files")
-                
-                # Check file sizes
-                zero_size_count = 0
-                for pdf_file in pdf_files:
-                    if pdf_file.stat().st_size == 0:
-                        zero_size_count += 1
-                
-                if zero_size_count > 0:
-                    print(f"    ⚠️ {zero_size_count} files with 0 bytes")
+    for session in report['sessions']:
+        files = ', '.join(f"{session[f'{file_type}s_present']}/{session[f'{file_type}s_available']} {file_type}s"
+                          for file_type, _, _ in FILE_TYPES if session[f'{file_type}s_available'])
+        print(f"📂 {session['name']}: {session['papers']} papers" + (f", {files}" if files else ""))
+        if show_papers and session['paper_ids']:
+            print(f"   {', '.join(session['paper_ids'])}")
+
+
+def write_summary_csv(report: Dict[str, Any], csv_path: Path):
+    """Write per-session statistics as CSV."""
+    with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Session ID', 'Session Name', 'Paper Count'] +
+                        [f"{file_type.title()}s {kind}" for file_type, _, _ in FILE_TYPES
+                         for kind in ('Available', 'Present')] + ['Paper ID List'])
+        for session in report['sessions']:
+            writer.writerow([session['id'], session['name'], session['papers']] +
+                            [session[f'{file_type}s_{kind}'] for file_type, _, _ in FILE_TYPES
+                             for kind in ('available', 'present')] + ['; '.join(session['paper_ids'])])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze scraper results")
+    parser.add_argument('output_dir', nargs='?', default='NAPAC2025_Data', type=Path, help="Scraper output directory")
+    parser.add_argument('--conference', default='NAPAC2025', help="Conference prefix of the master files")
+    parser.add_argument('--papers', action='store_true', help="List paper IDs per session")
+    parser.add_argument('--json', type=Path, help="Also write the report as JSON to this file")
+    args = parser.parse_args()
+
+    print(f"🎯 {args.conference} Conference Scraping Results Analysis")
+    print("=" * 60)
+
+    if not args.output_dir.exists():
+        print("❌ Results directory does not exist")
+        return 1
+    try:
+        report = analyze(args.output_dir, args.conference)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_report(report, show_papers=args.papers)
+
+    csv_summary = args.output_dir / "Sessions_Summary.csv"
+    write_summary_csv(report, csv_summary)
+    print(f"\n✅ CSV summary saved to: {csv_summary}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ JSON report saved to: {args.json}")
+
+    problems = sum(len(report[key]) for key in ('missing', 'zero_byte', 'corrupt'))
+    return 1 if problems else 0
+
 
 if __name__ == "__main__":
-    analyze_results()
\ No newline at end of file
+    sys.exit(main())
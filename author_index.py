@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Author and Institution Index for NAPAC2025
+
+Author: Ming Liu
+Description: Precomputed people index of the scraped proceedings, written next
+             to the master exports as '<conference>_Author_Index.json'.
+             - Author names are normalized to 'surname|initials' keys: diacritics,
+               case, trailing commas, full given names vs. initials ('Hans-Jürgen
+               Müller', 'H.J. Muller,' and 'Muller, H.-J.' are one author) and name
+               particles ('J. van der Berg') are handled
+             - Institution names are normalized for diacritics, case, punctuation
+               and a leading 'The'
+             - Every author and institution gets a stable ID derived from its key,
+               so IDs do not change between runs or with the crawl order
+             - Precomputed author -> papers, institution -> papers and co-author
+               adjacency (with shared paper counts): a lookup is one dictionary access
+
+Usage:
+    python author_index.py author "H. Alamprese"
+    python author_index.py institution "Fermi National Accelerator Laboratory"
+    python author_index.py coauthors "J. Mendez"
+    python author_index.py top --institutions -n 20
+    python author_index.py build --index NAPAC2025_Data/NAPAC2025_Complete_Index.json
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+from catalogue import iter_index_sessions, iter_jsonl_sessions
+from records import SCHEMA_VERSION, Serializer, create_serializer
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_FILE = Path("NAPAC2025_Data") / "NAPAC2025_Author_Index.json"
+DEFAULT_JSONL = Path("NAPAC2025_Data") / "NAPAC2025_All_Papers.jsonl"
+
+# Lower-case name particles that belong to the surname ('van der Berg', 'de la Cruz')
+NAME_PARTICLES = frozenset({'da', 'das', 'de', 'del', 'della', 'den', 'der', 'di', 'do', 'dos', 'du', 'la', 'le',
+                            'st', 'ten', 'ter', 'van', 'von', 'zu'})
+NON_WORD = re.compile(r'[^\w]+')
+INITIAL_SPLIT = re.compile(r'[\s.\-‐‑]+')
+
+
+def fold(text: str) -> str:
+    """Case-fold text and strip diacritics ('Núñez' -> 'nunez')."""
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+
+
+def clean_name(name: str) -> str:
+    """Collapse whitespace and strip the separators left around a name ('M. Liu,' -> 'M. Liu')."""
+    return ' '.join(name.split()).strip(' ,;')
+
+
+def author_key(name: str) -> str:
+    """
+    Normalized key of an author name.
+
+    Args:
+        name: Author name as listed (e.g. 'H.-J. Müller', 'Hans-Jürgen Muller', 'Muller, H.J.')
+
+    Returns:
+        'surname|initials' key (e.g. 'muller|hj')
+    """
+    name = clean_name(name)
+    if ',' in name:
+        # 'Surname, Given' order
+        surname, given = (part.strip() for part in name.split(',', 1))
+    else:
+        tokens = name.split(' ')
+        start = len(tokens) - 1
+        # Particles in front of the surname belong to it; keep at least one given-name token
+        while start > 1 and fold(tokens[start - 1]).rstrip('.') in NAME_PARTICLES:
+            start -= 1
+        surname, given = ' '.join(tokens[start:]), ' '.join(tokens[:start])
+    surname = NON_WORD.sub(' ', fold(surname)).strip()
+    initials = ''.join(part[0] for part in INITIAL_SPLIT.split(fold(given)) if part)
+    return f"{surname}|{initials}"
+
+
+def institution_key(name: str) -> str:
+    """
+    Normalized key of an institution name.
+
+    Args:
+        name: Institution as listed (e.g. 'The Université Paris-Saclay,')
+
+    Returns:
+        Key of lower-case words (e.g. 'universite paris saclay')
+    """
+    key = NON_WORD.sub(' ', fold(clean_name(name)).replace('&', ' and ')).strip()
+    return key[4:] if key.startswith('the ') else key
+
+
+def stable_id(prefix: str, key: str) -> str:
+    """ID derived from a normalized key ('a' for authors, 'i' for institutions)."""
+    return prefix + hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]
+
+
+def author_id(name: str) -> str:
+    """Stable ID of an author name."""
+    return stable_id('a', author_key(name))
+
+
+def institution_id(name: str) -> str:
+    """Stable ID of an institution name."""
+    return stable_id('i', institution_key(name))
+
+
+def _display_name(variants: Counter) -> str:
+    """Most frequent spelling of a name (the first one seen on ties)."""
+    return max(variants.items(), key=lambda item: item[1])[0]
+
+
+def build_author_index(sessions: Iterable[Dict[str, Any]], path: Path, conference: str = 'NAPAC2025',
+                       logger: Optional[logging.Logger] = None,
+                       serializer: Optional[Serializer] = None) -> Dict[str, int]:
+    """
+    Build and write the author and institution index.
+
+    Args:
+        sessions: Session data dictionaries ('session_info', 'papers'), consumed once
+        path: Index file to write
+        conference: Conference name stored in the index
+        logger: Logger for progress messages
+        serializer: JSON serializer of the index file (default: standard library json)
+
+    Returns:
+        Counts of papers, authors, institutions and co-author pairs
+    """
+    logger = logger or logging.getLogger(__name__)
+    serializer = create_serializer(serializer)
+
+    papers: Dict[str, Dict[str, Any]] = {}
+    people = {'authors': {}, 'institutions': {}}
+
+    def add(kind: str, prefix: str, key: str, name: str, paper_id: str) -> str:
+        entity_id = stable_id(prefix, key)
+        entry = people[kind].get(entity_id)
+        if entry is None:
+            entry = people[kind][entity_id] = {'key': key, 'variants': Counter(), 'papers': {}}
+        entry['variants'][name] += 1
+        entry['papers'][paper_id] = None
+        return entity_id
+
+    coauthors: Dict[str, Counter] = defaultdict(Counter)
+    for session_data in sessions:
+        session_id = session_data['session_info']['id']
+        for paper in session_data['papers']:
+            paper_id = paper['paper_id']
+            if paper_id in papers:
+                continue
+            author_ids = list(dict.fromkeys(
+                add('authors', 'a', author_key(name), clean_name(name), paper_id)
+                for name in paper.get('authors', []) if clean_name(name)))
+            institution_ids = list(dict.fromkeys(
+                add('institutions', 'i', institution_key(name), clean_name(name), paper_id)
+                for name in paper.get('institutions', []) if clean_name(name)))
+            papers[paper_id] = {'session_id': session_id, 'title': paper['title'], 'doi': paper.get('doi', ''),
+                                'authors': author_ids, 'institutions': institution_ids}
+            for first in author_ids:
+                for second in author_ids:
+                    if first != second:
+                        coauthors[first][second] += 1
+
+    def entries(kind: str) -> Dict[str, Dict[str, Any]]:
+        return {entity_id: {'name': _display_name(entry['variants']), 'key': entry['key'],
+                            'variants': sorted(entry['variants']), 'papers': list(entry['papers'])}
+                for entity_id, entry in sorted(people[kind].items())}
+
+    index = {
+        'version': INDEX_VERSION,
+        'schema_version': SCHEMA_VERSION,
+        'conference': conference,
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'authors': entries('authors'),
+        'institutions': entries('institutions'),
+        # author ID -> {co-author ID: number of shared papers}
+        'coauthors': {entity_id: dict(sorted(counts.items())) for entity_id, counts in sorted(coauthors.items())},
+        'papers': papers
+    }
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(serializer.dumps(index))
+    os.replace(tmp_path, path)
+
+    counts = {'papers': len(papers), 'authors': len(index['authors']), 'institutions': len(index['institutions']),
+              'coauthor_pairs': sum(len(counts) for counts in coauthors.values()) // 2}
+    logger.info(f"Author index written: {path} ({counts['authors']} authors, {counts['institutions']} institutions, "
+                f"{counts['coauthor_pairs']} co-author pairs)")
+    return counts
+
+
+class AuthorIndex:
+    """Read access to a written author and institution index."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.authors: Dict[str, Dict[str, Any]] = data['authors']
+        self.institutions: Dict[str, Dict[str, Any]] = data['institutions']
+        self.papers: Dict[str, Dict[str, Any]] = data['papers']
+        self.coauthor_counts: Dict[str, Dict[str, int]] = data['coauthors']
+
+    @classmethod
+    def load(cls, path: Path, serializer: Optional[Serializer] = None) -> 'AuthorIndex':
+        """
+        Load an index file.
+
+        Args:
+            path: '<conference>_Author_Index.json' file
+            serializer: JSON serializer (default: standard library json)
+
+        Returns:
+            AuthorIndex instance
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(create_serializer(serializer).loads(f.read()))
+
+    def author(self, name: str) -> Optional[Dict[str, Any]]:
+        """Index entry of an author, by any spelling of the name (None if unknown)."""
+        return self.authors.get(author_id(name))
+
+    def institution(self, name: str) -> Optional[Dict[str, Any]]:
+        """Index entry of an institution, by any spelling of the name (None if unknown)."""
+        return self.institutions.get(institution_id(name))
+
+    def find_institutions(self, text: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Institutions whose normalized name contains the normalized ``text`` (a scan; for partial names)."""
+        key = institution_key(text)
+        return [(entity_id, entry) for entity_id, entry in self.institutions.items() if key in entry['key']]
+
+    def papers_of(self, entry: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Paper entries ('paper_id', 'session_id', 'title', 'doi') of an author or institution entry."""
+        if not entry:
+            return []
+        return [{'paper_id': paper_id, **{k: v for k, v in self.papers[paper_id].items()
+                                          if k not in ('authors', 'institutions')}}
+                for paper_id in entry['papers']]
+
+    def coauthors(self, name: str) -> List[Tuple[Dict[str, Any], int]]:
+        """
+        Co-authors of an author.
+
+        Args:
+            name: Author name (any spelling)
+
+        Returns:
+            (author entry, shared papers) pairs, most shared papers first
+        """
+        counts = self.coauthor_counts.get(author_id(name), {})
+        return sorted(((self.authors[other], shared) for other, shared in counts.items()),
+                      key=lambda item: (-item[1], item[0]['name']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up authors and institutions in the NAPAC2025 author index")
+    parser.add_argument('--file', type=Path, default=DEFAULT_INDEX_FILE, help="Author index file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    author_cmd = commands.add_parser('author', help="Papers of an author")
+    author_cmd.add_argument('name', help="Author name (any spelling, e.g. 'H. Muller' or 'Hans Müller')")
+    institution_cmd = commands.add_parser('institution', help="Papers of an institution")
+    institution_cmd.add_argument('name', help="Institution name (partial names list all matches)")
+    coauthors_cmd = commands.add_parser('coauthors', help="Co-authors of an author")
+    coauthors_cmd.add_argument('name', help="Author name")
+    top_cmd = commands.add_parser('top', help="Authors (or institutions) with the most papers")
+    top_cmd.add_argument('--institutions', action='store_true', help="Rank institutions instead of authors")
+    top_cmd.add_argument('-n', type=int, default=10, help="Number of entries")
+
+    build_cmd = commands.add_parser('build', help="Rebuild the index from the NDJSON export")
+    build_cmd.add_argument('--jsonl', type=Path, default=DEFAULT_JSONL, help="NAPAC2025_All_Papers.jsonl file")
+    build_cmd.add_argument('--index', type=Path, help="Build from a NAPAC2025_Complete_Index.json file instead")
+    build_cmd.add_argument('--conference', default='NAPAC2025', help="Conference name stored in the index")
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        sessions = iter_index_sessions(args.index) if args.index else iter_jsonl_sessions(args.jsonl)
+        build_author_index(sessions, args.file, args.conference)
+        return 0
+
+    if not args.file.exists():
+        print(f"Author index not found: {args.file} (run the scraper or 'author_index.py build' first)")
+        return 2
+    index = AuthorIndex.load(args.file)
+
+    def print_papers(entry: Dict[str, Any]):
+        print(f"{entry['name']} ({len(entry['papers'])} papers)")
+        if len(entry['variants']) > 1:
+            print(f"    also listed as: {', '.join(v for v in entry['variants'] if v != entry['name'])}")
+        for paper in index.papers_of(entry):
+            print(f"  [{paper['session_id']}] {paper['paper_id']}: {paper['title']}")
+
+    if args.command == 'author':
+        entry = index.author(args.name)
+        if not entry:
+            print(f"No author matching '{args.name}'")
+            return 1
+        print_papers(entry)
+    elif args.command == 'institution':
+        entry = index.institution(args.name)
+        matches = [entry] if entry else [match for _, match in index.find_institutions(args.name)]
+        if not matches:
+            print(f"No institution matching '{args.name}'")
+            return 1
+        for entry in matches:
+            print_papers(entry)
+    elif args.command == 'coauthors':
+        if not index.author(args.name):
+            print(f"No author matching '{args.name}'")
+            return 1
+        for entry, shared in index.coauthors(args.name):
+            print(f"  {entry['name']:<40} {shared} shared papers")
+    else:
+        entries = index.institutions if args.institutions else index.authors
+        for entry in sorted(entries.values(), key=lambda e: (-len(e['papers']), e['name']))[:args.n]:
+            print(f"  {len(entry['papers']):>4}  {entry['name']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
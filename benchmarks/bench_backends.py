@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parser Backend Benchmark
+
+Author: Ming Liu
+Description: Reports parse time, paper extraction time and peak memory of every
+             available parser backend (html.parser, lxml, selectolax) on saved
+             session pages, and checks that all backends extract the same records.
+
+Usage:
+    python benchmarks/bench_backends.py [page_dir] [--repeat N]
+
+Each backend runs in a fresh subprocess so its peak resident memory (which
+includes the C parsers' own allocations) can be measured independently.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from parsers import PARSER_BACKENDS  # noqa: E402
+from bench_parser import make_parser, read_page, saved_pages  # noqa: E402
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_backend(backend: str, pages, repeat: int) -> dict:
+    """Benchmark one backend in the current process."""
+    scraper = make_parser(backend)
+    htmls = [read_page(page) for page in pages]
+    baseline_kb = peak_rss_kb()
+
+    parse_time = extract_time = 0.0
+    records = {}
+    for _ in range(repeat):
+        for session_id, html in htmls:
+            start = time.perf_counter()
+            doc = scraper.parser.parse(html)
+            parsed = time.perf_counter()
+            papers = scraper.extract_papers_from_session(doc, session_id)
+            parse_time += parsed - start
+            extract_time += time.perf_counter() - parsed
+            records[session_id] = [paper.to_dict() for paper in papers]
+
+    return {
+        'backend': backend,
+        'parse_ms': parse_time / repeat * 1000,
+        'extract_ms': extract_time / repeat * 1000,
+        'peak_rss_delta_kb': peak_rss_kb() - baseline_kb,
+        'papers': sum(len(papers) for papers in records.values()),
+        'records': records
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parser backends on saved session pages")
+    parser.add_argument('page_dir', nargs='?', default='NAPAC2025_Data/Debug',
+                        help="Directory with saved '<session>_page.html(.gz)' files")
+    parser.add_argument('--repeat', type=int, default=5, help="Passes over all pages per backend")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    pages = saved_pages(args.page_dir)
+    if not pages:
+        print(f"No saved session pages in {args.page_dir}; run the scraper first")
+        return 2
+
+    if args.worker:
+        print(json.dumps(run_backend(args.worker, pages, args.repeat)))
+        return 0
+
+    total_kb = sum(len(read_page(page)[1].encode('utf-8')) for page in pages) // 1024
+    print(f"{len(pages)} pages, {total_kb} KiB of HTML, {args.repeat} passes\n")
+    print(f"{'Backend':<12} {'Papers':>6} {'Parse':>10} {'Extract':>10} {'Total':>10} {'Peak RSS':>10}")
+
+    results = []
+    for backend in PARSER_BACKENDS:
+        proc = subprocess.run([sys.executable, __file__, args.page_dir, '--repeat', str(args.repeat),
+                               '--worker', backend], capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{backend:<12} unavailable: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        result = json.loads(proc.stdout)
+        results.append(result)
+        print(f"{backend:<12} {result['papers']:>6} {result['parse_ms']:>8.2f}ms {result['extract_ms']:>8.2f}ms "
+              f"{result['parse_ms'] + result['extract_ms']:>8.2f}ms {result['peak_rss_delta_kb'] / 1024:>7.1f}MiB")
+
+    # Every backend must extract the same records as the first one
+    mismatches = 0
+    if results:
+        reference = results[0]
+        for result in results[1:]:
+            if result['records'] != reference['records']:
+                mismatches += 1
+                print(f"✗ {result['backend']} records differ from {reference['backend']}")
+    print("\nParity: OK" if not mismatches else f"\nParity: {mismatches} backends differ")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Session Page Parser Benchmark
+
+Author: Ming Liu
+Description: Times the single-pass structural parser against the original
+             regex-over-get_text parser on saved session pages and checks that
+             both produce identical paper records.
+
+Usage:
+    python benchmarks/bench_parser.py [page_dir] [--repeat N]
+
+Saved pages are the 'Debug/<session>_page.html.gz' files written by the scraper
+with debug artifacts enabled (uncompressed '<session>_page.html' files of older
+runs are read as well).
+The regex parser is the original one; on NAPAC2025 session pages it differs from
+the structural parser in ways that are defects of the regex parser
+(REGEX_DEFECTS): it takes ID-like tokens such as 'HEPS26' (title 'Commissioning
+of the HEPS', page 26) for papers, misses papers whose title starts with a digit
+or whose line holds no later ID-like token, lets titles run into the page number
+and abstract (or cuts them at a cross-listing code), and drops the abstract and
+authors of papers without a contrib-subheader. tests/fixtures/session_pages
+holds pages rebuilt from the 'Debug/<session>_page_text.txt' dumps of the
+original scraper, on which every difference falls into these classes. Pages with
+identical records are reported as such; any other difference is a parity
+mismatch and makes the script exit with status 1.
+"""
+
+import argparse
+import gzip
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scraper import NAPAC2025Scraper  # noqa: E402
+
+
+def make_parser(backend: str = 'html.parser') -> NAPAC2025Scraper:
+    """
+    Create a scraper instance for parsing only.
+
+    The instance replays from an archive that does not exist and writes below a
+    directory that is never created, so an accidental request fails instead of
+    reaching the network, and nothing is written.
+
+    Args:
+        backend: HTML parser backend name
+
+    Returns:
+        Scraper instance
+    """
+    logger = logging.getLogger('bench_parser')
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    scratch = Path(tempfile.gettempdir()) / "bench_parser"
+    return NAPAC2025Scraper(output_dir=str(scratch / "output"), replay_archive=str(scratch / "no_archive.zip"),
+                            use_http_cache=False, parser=backend, collect_metrics=False, logger=logger)
+
+
+def saved_pages(page_dir) -> List[Path]:
+    """Saved session pages of a Debug directory, compressed or not."""
+    return sorted(Path(page_dir).glob('*_page.html')) + sorted(Path(page_dir).glob('*_page.html.gz'))
+
+
+def read_page(page: Path) -> Tuple[str, str]:
+    """Session ID and HTML of a saved session page."""
+    if page.suffix == '.gz':
+        with gzip.open(page, 'rt', encoding='utf-8') as f:
+            return page.name[:-len('_page.html.gz')], f.read()
+    return page.name[:-len('_page.html')], page.read_text(encoding='utf-8')
+
+
+def parity_problems(structural: List[Dict[str, Any]], legacy: List[Dict[str, Any]]) -> List[str]:
+    """
+    Differences between the records of the structural and the regex parser.
+
+    Args:
+        structural: Records from extract_papers_from_session
+        legacy: Records from extract_papers_from_session_regex
+
+    Returns:
+        One message per paper found by only one parser, per differing record and
+        for a different paper order (empty if the outputs are identical)
+    """
+    problems = []
+    by_id = {p['paper_id']: p for p in structural}
+    legacy_by_id = {p['paper_id']: p for p in legacy}
+    only_regex = sorted(legacy_by_id.keys() - by_id.keys())
+    only_structural = sorted(by_id.keys() - legacy_by_id.keys())
+    if only_regex:
+        problems.append(f"regex only ({len(only_regex)} IDs): {', '.join(only_regex)}")
+    if only_structural:
+        problems.append(f"structural only ({len(only_structural)} IDs): {', '.join(only_structural)}")
+    for paper_id in sorted(by_id.keys() & legacy_by_id.keys()):
+        if dict(by_id[paper_id]) != dict(legacy_by_id[paper_id]):
+            fields = [k for k in by_id[paper_id] if by_id[paper_id][k] != legacy_by_id[paper_id].get(k)]
+            problems.append(f"{paper_id}: fields differ: {', '.join(fields)}")
+    if not problems and [p['paper_id'] for p in structural] != [p['paper_id'] for p in legacy]:
+        problems.append("papers are in a different order")
+    return problems
+
+
+# Known defects of the regex parser, by the difference they cause
+REGEX_DEFECTS = {
+    'phantom': "ID-like token inside a title taken for a paper",
+    'missed': "paper not found (title starts with a digit or no later ID-like token on its line)",
+    'title': "title runs into the page number and abstract, or is cut at an ID-like token",
+    'details': "abstract and authors dropped for a paper without a contrib-subheader",
+}
+
+
+def anchor_ids(doc) -> List[str]:
+    """Paper IDs of the contrib-ancor blocks of a parsed session page."""
+    return [div.get('id').upper() for div in doc.find_all('div', classes=['contrib-ancor']) if div.get('id')]
+
+
+def classify_differences(structural: List[Dict[str, Any]], legacy: List[Dict[str, Any]],
+                         paper_ids: Iterable[str]) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Sort the differences between the structural and the regex parser into known
+    regex parser defects and unexplained mismatches.
+
+    Args:
+        structural: Records from extract_papers_from_session
+        legacy: Records from extract_papers_from_session_regex
+        paper_ids: Paper IDs of the page's contrib-ancor blocks
+
+    Returns:
+        Tuple of (paper IDs per REGEX_DEFECTS key, messages of unexplained differences)
+    """
+    paper_ids = set(paper_ids)
+    by_id = {p['paper_id']: p for p in structural}
+    legacy_by_id = {p['paper_id']: p for p in legacy}
+    defects = {kind: [] for kind in REGEX_DEFECTS}
+    unexplained = []
+    for paper_id in legacy_by_id.keys() - by_id.keys():
+        if paper_id in paper_ids:
+            unexplained.append(f"{paper_id}: found by the regex parser only")
+        else:
+            defects['phantom'].append(paper_id)
+    for paper_id in by_id.keys() - legacy_by_id.keys():
+        if paper_id in paper_ids:
+            defects['missed'].append(paper_id)
+        else:
+            unexplained.append(f"{paper_id}: found by the structural parser without a contrib-ancor block")
+    for paper_id in by_id.keys() & legacy_by_id.keys():
+        paper, old = by_id[paper_id], legacy_by_id[paper_id]
+        fields = {k for k in paper if paper[k] != old.get(k)}
+        if fields & {'title', 'page_number'}:
+            defects['title'].append(paper_id)
+        other = fields - {'title', 'page_number'}
+        if other & {'abstract', 'authors', 'institutions'} and \
+                not (old['abstract'] or old['authors'] or old['institutions']):
+            defects['details'].append(paper_id)
+            other -= {'abstract', 'authors', 'institutions'}
+        if other:
+            unexplained.append(f"{paper_id}: fields differ: {', '.join(sorted(other))}")
+    common = [p['paper_id'] for p in structural if p['paper_id'] in legacy_by_id]
+    if common != [p['paper_id'] for p in legacy if p['paper_id'] in by_id]:
+        unexplained.append("papers are in a different order")
+    return {kind: sorted(ids) for kind, ids in defects.items()}, sorted(unexplained)
+
+
+def best_time(fn, repeat: int) -> float:
+    """Best wall-clock time of ``repeat`` calls of ``fn``."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and parity check of the session page parsers")
+    parser.add_argument('page_dir', nargs='?', default='NAPAC2025_Data/Debug',
+                        help="Directory with saved '<session>_page.html(.gz)' files")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing repetitions per page")
+    args = parser.parse_args()
+
+    pages = saved_pages(args.page_dir)
+    if not pages:
+        print(f"No saved session pages in {args.page_dir}; run the scraper first")
+        return 2
+
+    scraper = make_parser()
+    total_structural = total_regex = 0.0
+    mismatches = 0
+
+    print(f"{'Session':<10} {'Papers':>6} {'Structural':>12} {'Regex':>12} {'Speedup':>8}")
+    for page in pages:
+        session_id, html = read_page(page)
+        doc = scraper.parser.parse(html)
+
+        structural = scraper.extract_papers_from_session(doc, session_id)
+        legacy = scraper.extract_papers_from_session_regex(doc, session_id)
+
+        t_structural = best_time(lambda: scraper.extract_papers_from_session(doc, session_id), args.repeat)
+        t_regex = best_time(lambda: scraper.extract_papers_from_session_regex(doc, session_id), args.repeat)
+        total_structural += t_structural
+        total_regex += t_regex
+        speedup = t_regex / t_structural if t_structural else float('inf')
+        print(f"{session_id:<10} {len(structural):>6} {t_structural * 1000:>10.2f}ms "
+              f"{t_regex * 1000:>10.2f}ms {speedup:>7.1f}x")
+
+        # Parity: identical records, or every difference a known defect of the regex parser
+        if not parity_problems(structural, legacy):
+            print("  = identical records")
+            continue
+        defects, problems = classify_differences(structural, legacy, anchor_ids(doc))
+        for kind, paper_ids in defects.items():
+            if paper_ids:
+                print(f"  ~ regex {kind} ({len(paper_ids)}): {', '.join(paper_ids)}")
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        mismatches += len(problems)
+
+    speedup = total_regex / total_structural if total_structural else float('inf')
+    print(f"{'Total':<10} {'':>6} {total_structural * 1000:>10.2f}ms {total_regex * 1000:>10.2f}ms {speedup:>7.1f}x")
+    print("Parity: OK (differences are known regex parser defects)" if not mismatches
+          else f"Parity: {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
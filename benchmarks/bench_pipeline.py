@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scraper Pipeline Benchmark Suite
+
+Author: Ming Liu
+Description: Reproducible timings of the scraper's parse, save, export and
+             download stages, written as JSON so runs of different commits can
+             be compared.
+             - load_sessions:       session list fetch and parse
+             - extract_papers:      session page parsing and paper extraction
+             - save_session_data:   per-session JSON / CSV / TXT files
+             - export:              streamed master files and create_final_summary
+                                    (report, index, columnar files, SQLite
+                                    catalogue, data bundle)
+             - download:            PDF downloads from a local mock server
+             - records:             building the papers as slotted records, with the
+                                    memory they retain compared to plain dictionaries
+
+Datasets:
+    recorded        saved session pages ('Debug/<session>_page.html.gz' written by the
+                    scraper with debug artifacts, e.g. by a replay run); skipped if
+                    there are none
+    synthetic_xN    meow-style pages rendered from the committed master index
+                    (NAPAC2025_Complete_Index.json) with N times as many papers
+                    per session (and N times as many sessions for load_sessions)
+
+All network stages run against an in-process HTTP server on 127.0.0.1 that
+serves the synthetic site and a fake PDF for every 'pdf/<ID>.pdf' URL.
+
+Usage:
+    python benchmarks/bench_pipeline.py [page_dir] [--scales 1,10,100] [--repeat N]
+                                        [--serializer json|orjson|msgspec]
+                                        [--output results.json] [--compare old.json]
+
+With --compare, every benchmark is compared against an earlier results file
+and the script exits with status 1 if one got slower than --threshold.
+"""
+
+import argparse
+import copy
+import html
+import http.server
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+from bench_parser import read_page, saved_pages  # noqa: E402
+from export import OUTPUT_PROFILES  # noqa: E402
+from metrics import Metrics  # noqa: E402
+from records import SERIALIZERS, Paper, Session  # noqa: E402
+from scraper import NAPAC2025Scraper  # noqa: E402
+
+DEFAULT_INDEX = REPO_DIR / "NAPAC2025_Data" / "NAPAC2025_Complete_Index.json"
+PDF_FILLER = b"0123456789abcdef" * 64
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the benchmarked tree (None outside a git checkout)."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def session_segment(session: Dict[str, str], position: int) -> str:
+    """Path segment of a session page (e.g. '1161-mowp'), taken from its URL when possible."""
+    url = session.get('url', '')
+    if '/session/' in url:
+        return url.split('/session/', 1)[1].split('/', 1)[0]
+    return f"{1000 + position}-{session['id'].lower()}"
+
+
+def to_records(sessions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Session data with Session / Paper records, as the scraper holds them."""
+    return [{'session_info': Session.from_dict(s['session_info']), 'papers': [Paper.from_dict(p) for p in s['papers']]}
+            for s in sessions]
+
+
+def scale_sessions(sessions: List[Dict[str, Any]], factor: int) -> List[Dict[str, Any]]:
+    """
+    Repeat the papers of every session ``factor`` times with renumbered paper IDs.
+
+    Args:
+        sessions: Session data dictionaries ('session_info', 'papers')
+        factor: Papers per original paper (1 keeps the sessions unchanged)
+
+    Returns:
+        Scaled session data dictionaries with paper records
+    """
+    if factor == 1:
+        return sessions
+    scaled = []
+    for session_data in sessions:
+        session = session_data['session_info']
+        papers = []
+        for copy_index in range(factor):
+            for paper in session_data['papers']:
+                paper = Paper.from_dict(dict(paper))
+                paper['paper_id'] = f"{session['id']}{len(papers) + 1:03d}"
+                papers.append(paper)
+        scaled.append({'session_info': session, 'papers': papers})
+    return scaled
+
+
+def render_session_page(session: Dict[str, str], papers: List[Dict[str, Any]]) -> str:
+    """Render a meow session page (contrib-* blocks) for the given paper records."""
+    out = [f"<html><body><h1>{html.escape(session['name'])}</h1>\n<div class='contrib-list'>"]
+    for paper in papers:
+        paper_id = paper['paper_id']
+        pdf_link = f'<a href="../../pdf/{paper_id}.pdf">paper</a>' if paper.get('paper_available') else ''
+        authors = ''.join(f"<li><b>{html.escape(author)},</b><br>{html.escape(institution)}</li>"
+                          for author, institution in zip(paper.get('authors') or ['A. Author'],
+                                                         (paper.get('institutions') or ['Laboratory']) * 8))
+        out.append(f"<div class='contrib-ancor' id='{paper_id.lower()}'></div>"
+                   f"<div class='contrib-header'><span>{paper_id}</span><span>{html.escape(paper['title'])}</span>"
+                   f"<span>{html.escape(paper.get('page_number') or '')}</span></div>"
+                   f"<div class='contrib-subheader'>{pdf_link}</div>"
+                   f"<div class='contrib-desc'>{html.escape(paper.get('abstract') or '')}</div>"
+                   f"<div class='contrib-authors'><ul>{authors}</ul></div>\n")
+    out.append("</div></body></html>")
+    return ''.join(out)
+
+
+def render_session_list(sessions: List[Dict[str, Any]], factor: int) -> str:
+    """Render html/session_list.html listing every session ``factor`` times."""
+    links = []
+    for copy_index in range(factor):
+        suffix = str(copy_index) if copy_index else ''
+        for position, session_data in enumerate(sessions):
+            session = session_data['session_info']
+            links.append(f'<li><a data-href="session/{session_segment(session, position)}{suffix}/index.html">'
+                         f'{html.escape(session["name"])}</a></li>')
+    return f"<html><body><ul>{''.join(links)}</ul></body></html>"
+
+
+class MockProceedingsServer:
+    """In-process HTTP server serving synthetic proceedings sites and fake PDFs."""
+
+    def __init__(self, pdf_size: int = 32 * 1024):
+        """
+        Initialize the server (started by ``with``).
+
+        Args:
+            pdf_size: Size of every served PDF in bytes
+        """
+        self.pages: Dict[str, bytes] = {}
+        body = PDF_FILLER * (max(0, pdf_size - 16) // len(PDF_FILLER) + 1)
+        self.pdf = b"%PDF-1.4\n" + body[:max(0, pdf_size - 16)] + b"\n%%EOF\n"
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                self.respond(send_body=False)
+
+            def do_GET(self):
+                self.respond(send_body=True)
+
+            def respond(self, send_body: bool):
+                path = self.path.split('?', 1)[0]
+                if path.endswith('.pdf'):
+                    body, content_type = server.pdf, 'application/pdf'
+                elif path in server.pages:
+                    body, content_type = server.pages[path], 'text/html; charset=utf-8'
+                else:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+        self._httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}/"
+
+    def add_site(self, name: str, sessions: List[Dict[str, Any]], list_factor: int = 1) -> str:
+        """
+        Serve a proceedings site under /<name>/.
+
+        Args:
+            name: Site path prefix
+            sessions: Session data dictionaries of the site
+            list_factor: Repetitions of each session in the session list
+
+        Returns:
+            Base URL of the site
+        """
+        for position, session_data in enumerate(sessions):
+            session = session_data['session_info']
+            path = f"/{name}/session/{session_segment(session, position)}/index.html"
+            self.pages[path] = render_session_page(session, session_data['papers']).encode('utf-8')
+        self.pages[f"/{name}/html/session_list.html"] = render_session_list(sessions, list_factor).encode('utf-8')
+        return f"{self.root_url}{name}/"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def quiet_logger() -> logging.Logger:
+    """Logger that drops the scraper's per-paper progress messages."""
+    logger = logging.getLogger('bench_pipeline')
+    logger.setLevel(logging.ERROR)
+    return logger
+
+
+def make_scraper(base_url: str, output_dir: Path, **kwargs) -> NAPAC2025Scraper:
+    """Scraper pointed at a mock site, without pacing or HTTP cache."""
+    scraper = NAPAC2025Scraper(base_url=base_url, output_dir=str(output_dir), requests_per_second=0,
+                               max_in_flight=8, download_workers=8, use_http_cache=False, logger=quiet_logger(),
+                               **kwargs)
+    scraper.create_directories()
+    return scraper
+
+
+def measure(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None) -> Tuple[Dict[str, float], Any]:
+    """
+    Time ``repeat`` calls of ``fn``.
+
+    Args:
+        fn: Benchmarked call
+        repeat: Number of timed calls
+        setup: Untimed call before every run
+
+    Returns:
+        ({'best_ms', 'mean_ms'}, result of the fastest call)
+    """
+    times = []
+    best_result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        if not times or elapsed < min(times):
+            best_result = result
+        times.append(elapsed)
+    return {'best_ms': round(min(times) * 1000, 3), 'mean_ms': round(sum(times) / len(times) * 1000, 3)}, best_result
+
+
+def bench_load_sessions(base_url: str, workdir: Path, repeat: int) -> Dict[str, Any]:
+    """Fetch and parse the session list."""
+    scraper = make_scraper(base_url, workdir)
+    timing, _ = measure(scraper.load_sessions, repeat)
+    return {**timing, 'sessions': len(scraper.sessions_config)}
+
+
+def bench_extract(scraper: NAPAC2025Scraper, pages: List[Tuple[str, str]], repeat: int) -> Dict[str, Any]:
+    """Parse session pages and extract their paper records."""
+    def run():
+        parse_time = extract_time = 0.0
+        count = 0
+        for session_id, page in pages:
+            start = time.perf_counter()
+            doc = scraper.parser.parse(page)
+            parsed = time.perf_counter()
+            count += len(scraper.extract_papers_from_session(doc, session_id))
+            parse_time += parsed - start
+            extract_time += time.perf_counter() - parsed
+        return {'parse_ms': round(parse_time * 1000, 3), 'extract_ms': round(extract_time * 1000, 3), 'papers': count}
+
+    timing, result = measure(run, repeat)
+    result['bytes'] = sum(len(page.encode('utf-8')) for _, page in pages)
+    result['papers_per_second'] = round(result['papers'] / (timing['best_ms'] / 1000), 1) if timing['best_ms'] else None
+    return {**timing, 'sessions': len(pages), **result}
+
+
+def bench_save(scraper: NAPAC2025Scraper, sessions: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """Write the per-session files of the scraper's output profile."""
+    def run():
+        for session_data in sessions:
+            scraper.save_session_data(session_data['session_info'], session_data['papers'])
+
+    timing, _ = measure(run, repeat)
+    return {**timing, 'sessions': len(sessions), 'papers': sum(len(s['papers']) for s in sessions)}
+
+
+def bench_export(scraper: NAPAC2025Scraper, sessions: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """Stream all sessions to the master files and create the final summary."""
+    def setup():
+        scraper.metrics = Metrics()
+
+    def run():
+        scraper.exporter.open()
+        try:
+            for session_data in sessions:
+                with scraper.metrics.timer('export_session'):
+                    scraper.exporter.write_session(session_data)
+            scraper.create_final_summary()
+        finally:
+            scraper.exporter.close()
+        return {stage: stats['total_seconds'] * 1000 for stage, stats in scraper.metrics.snapshot().items()}
+
+    papers = sum(len(s['papers']) for s in sessions)
+    scraper.stats.update(total_papers=papers, sessions_processed=len(sessions))
+    timing, stages = measure(run, repeat, setup)
+    return {**timing, 'sessions': len(sessions), 'papers': papers,
+            'stages_ms': {stage: round(ms, 3) for stage, ms in sorted(stages.items())}}
+
+
+def bench_records(sessions: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """Build the papers as records from decoded JSON, and compare their retained memory with dictionaries."""
+    decoded = [json.loads(json.dumps(dict(paper))) for s in sessions for paper in s['papers']]
+
+    def retained_kb(build: Callable[[], Any]) -> float:
+        tracemalloc.start()
+        try:
+            kept = build()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del kept
+        return round(size / 1024, 1)
+
+    # Fresh copies of the decoded strings, as a parser would produce them
+    def as_dicts():
+        return [json.loads(json.dumps(paper)) for paper in decoded]
+
+    def as_records():
+        return [Paper.from_dict(paper) for paper in as_dicts()]
+
+    timing, _ = measure(lambda: [Paper.from_dict(paper) for paper in decoded], repeat)
+    return {**timing, 'papers': len(decoded), 'dict_kb': retained_kb(as_dicts), 'record_kb': retained_kb(as_records)}
+
+
+def bench_download(base_url: str, sessions: List[Dict[str, Any]], workdir: Path, repeat: int) -> Dict[str, Any]:
+    """Download the available papers of every session from the mock server into a fresh output directory."""
+    sessions = copy.deepcopy(sessions)
+    for session_data in sessions:
+        for paper in session_data['papers']:
+            paper['paper_url'] = f"{base_url}pdf/{paper['paper_id']}.pdf"
+    run_dir = workdir / 'downloads'
+    state = {}
+
+    def setup():
+        shutil.rmtree(run_dir, ignore_errors=True)
+        state['scraper'] = make_scraper(base_url, run_dir)
+
+    def run():
+        scraper = state['scraper']
+        try:
+            for session_data in sessions:
+                name = session_data['session_info']['name']
+                scraper.download_manager.map(lambda paper: scraper.download_files(paper, name), session_data['papers'])
+        finally:
+            scraper.download_manager.shutdown()
+        download = scraper.metrics.snapshot().get('download', {})
+        return {'files': scraper.stats['downloaded_papers'], 'errors': scraper.stats['errors'],
+                'bytes': download.get('bytes', 0)}
+
+    timing, result = measure(run, repeat, setup)
+    seconds = timing['best_ms'] / 1000
+    result['mb_per_second'] = round(result['bytes'] / 1e6 / seconds, 2) if seconds else None
+    result['files_per_second'] = round(result['files'] / seconds, 1) if seconds else None
+    shutil.rmtree(run_dir, ignore_errors=True)
+    return {**timing, **result}
+
+
+def compare_results(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """
+    Print best times against a previous results file.
+
+    Returns:
+        Number of benchmarks slower than ``threshold`` times the baseline
+    """
+    previous = {(entry['benchmark'], entry['dataset']): entry for entry in baseline.get('results', [])}
+    print(f"\nComparison with {baseline.get('commit') or 'baseline'} (threshold {threshold:.2f}x):")
+    regressions = 0
+    for entry in results['results']:
+        old = previous.get((entry['benchmark'], entry['dataset']))
+        if not old or not old.get('best_ms'):
+            continue
+        ratio = entry['best_ms'] / old['best_ms']
+        flag = ''
+        if ratio > threshold:
+            regressions += 1
+            flag = '  ⚠️ slower'
+        print(f"  {entry['benchmark']:<18} {entry['dataset']:<16} {old['best_ms']:>11.2f}ms -> "
+              f"{entry['best_ms']:>11.2f}ms {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper's parse, save, export and download stages")
+    parser.add_argument('page_dir', nargs='?', default='NAPAC2025_Data/Debug',
+                        help="Directory with recorded '<session>_page.html(.gz)' files")
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX,
+                        help="Master index the synthetic pages are rendered from")
+    parser.add_argument('--scales', default='1,10,100', help="Synthetic dataset sizes (papers per recorded paper)")
+    parser.add_argument('--download-scales', default='1,10', help="Synthetic sizes used for the download benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per benchmark (best and mean are reported)")
+    parser.add_argument('--pdf-kb', type=int, default=32, help="Size of the mock server's PDFs in KiB")
+    parser.add_argument('--output-profile', default='standard', choices=sorted(OUTPUT_PROFILES),
+                        help="Output profile of the save_session_data benchmark")
+    parser.add_argument('--serializer', default='json', choices=sorted(SERIALIZERS),
+                        help="JSON serializer of the save and export benchmarks")
+    parser.add_argument('--output', type=Path, help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', type=Path, help="Earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    # Keep the scraper's own logging setup from adding handlers and a log file
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+    scales = [int(scale) for scale in args.scales.split(',') if scale]
+    download_scales = {int(scale) for scale in args.download_scales.split(',') if scale}
+
+    with open(args.index, 'r', encoding='utf-8') as f:
+        base_sessions = to_records(json.load(f)['sessions'])
+    recorded = [read_page(page) for page in saved_pages(args.page_dir)]
+
+    commit = git_commit()
+    results = {
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'pdf_kb': args.pdf_kb,
+        'output_profile': args.output_profile,
+        'serializer': args.serializer,
+        'results': []
+    }
+
+    def report(benchmark: str, dataset: str, result: Dict[str, Any]):
+        results['results'].append({'benchmark': benchmark, 'dataset': dataset, **result})
+        unit = next(unit for unit in ('papers', 'files', 'sessions') if unit in result)
+        size = f"{result[unit]} {unit}"
+        print(f"{benchmark:<18} {dataset:<16} {size:>16} {result['best_ms']:>11.2f}ms (mean {result['mean_ms']:.2f}ms)")
+
+    workdir = Path(tempfile.mkdtemp(prefix='bench_pipeline_'))
+    try:
+        with MockProceedingsServer(pdf_size=args.pdf_kb * 1024) as server:
+            if recorded:
+                scraper = make_scraper(server.add_site('x1', base_sessions), workdir / 'recorded')
+                report('extract_papers', 'recorded', bench_extract(scraper, recorded, args.repeat))
+            else:
+                print(f"No recorded session pages in {args.page_dir}; benchmarking synthetic pages only")
+
+            for scale in scales:
+                dataset = f"synthetic_x{scale}"
+                sessions = scale_sessions(base_sessions, scale)
+                base_url = server.add_site(f"x{scale}", sessions, list_factor=scale)
+                output_dir = workdir / dataset
+                report('load_sessions', dataset, bench_load_sessions(base_url, output_dir, args.repeat))
+
+                scraper = make_scraper(base_url, output_dir, output_profile=args.output_profile,
+                                       serializer=args.serializer)
+                pages = [(s['session_info']['id'], render_session_page(s['session_info'], s['papers']))
+                         for s in sessions]
+                report('extract_papers', dataset, bench_extract(scraper, pages, args.repeat))
+                report('save_session_data', dataset, bench_save(scraper, sessions, args.repeat))
+                report('export', dataset, bench_export(scraper, sessions, args.repeat))
+                report('records', dataset, bench_records(sessions, args.repeat))
+                if scale in download_scales:
+                    report('download', dataset, bench_download(base_url, sessions, output_dir, args.repeat))
+                shutil.rmtree(output_dir, ignore_errors=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = args.output or REPO_DIR / 'benchmarks' / 'results' / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\nResults saved to: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        return 1 if compare_results(results, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite Paper Catalogue for NAPAC2025
+
+Author: Ming Liu
+Description: Normalized SQLite database of the scraped proceedings with a
+             full-text index, plus a small query command line.
+
+Tables:
+- sessions(id, name, url)
+- papers(id, session_id, paper_id, title, abstract, doi, page_number, *_url, *_available)
+- authors(id, name) and paper_authors(paper_id, author_id, position)
+- institutions(id, name) and paper_institutions(paper_id, institution_id, position)
+- papers_fts: FTS5 index over title, abstract and author names (rowid = papers.id)
+
+Usage:
+    python catalogue.py search "SRF cavity" --institution Fermilab
+    python catalogue.py search --author "J. Smith" --session MOP
+    python catalogue.py stats
+    python catalogue.py build            # rebuild from NAPAC2025_All_Papers.jsonl
+    python catalogue.py build --index NAPAC2025_Data/NAPAC2025_Complete_Index.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional
+
+DEFAULT_DB = Path("NAPAC2025_Data") / "NAPAC2025_Catalogue.sqlite"
+DEFAULT_JSONL = Path("NAPAC2025_Data") / "NAPAC2025_All_Papers.jsonl"
+
+SCHEMA = """
+CREATE TABLE sessions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    url TEXT
+);
+CREATE TABLE papers (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(id),
+    paper_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    abstract TEXT,
+    doi TEXT,
+    page_number TEXT,
+    presentation_url TEXT,
+    paper_url TEXT,
+    poster_url TEXT,
+    presentation_available INTEGER NOT NULL DEFAULT 0,
+    paper_available INTEGER NOT NULL DEFAULT 0,
+    poster_available INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (session_id, paper_id)
+);
+CREATE TABLE authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE institutions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE paper_authors (
+    paper_id INTEGER NOT NULL REFERENCES papers(id),
+    author_id INTEGER NOT NULL REFERENCES authors(id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (paper_id, position)
+);
+CREATE TABLE paper_institutions (
+    paper_id INTEGER NOT NULL REFERENCES papers(id),
+    institution_id INTEGER NOT NULL REFERENCES institutions(id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (paper_id, position)
+);
+CREATE INDEX idx_papers_paper_id ON papers(paper_id);
+CREATE INDEX idx_paper_authors_author ON paper_authors(author_id);
+CREATE INDEX idx_paper_institutions_institution ON paper_institutions(institution_id);
+"""
+
+FTS_SCHEMA = "CREATE VIRTUAL TABLE papers_fts USING fts5(title, abstract, authors, tokenize='porter unicode61')"
+
+
+def fts5_available() -> bool:
+    """Check whether the linked SQLite library was built with FTS5."""
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+def _lookup_id(conn: sqlite3.Connection, cache: Dict[str, int], table: str, name: str) -> int:
+    if name not in cache:
+        cursor = conn.execute(f"INSERT INTO {table} (name) VALUES (?)", (name,))
+        cache[name] = cursor.lastrowid
+    return cache[name]
+
+
+def build_catalogue(sessions: Iterable[Dict[str, Any]], db_path: Path,
+                    logger: Optional[logging.Logger] = None) -> Dict[str, int]:
+    """
+    Build the SQLite catalogue from session data, replacing any previous database.
+
+    Args:
+        sessions: Session data dictionaries ('session_info', 'papers'), consumed once
+        db_path: Database file to write
+        logger: Logger for progress messages
+
+    Returns:
+        Row counts per table
+    """
+    logger = logger or logging.getLogger(__name__)
+    db_path = Path(db_path)
+    tmp_path = db_path.with_name(db_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    with_fts = fts5_available()
+    if not with_fts:
+        logger.warning("SQLite was built without FTS5; catalogue written without full-text index")
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        if with_fts:
+            conn.execute(FTS_SCHEMA)
+        author_ids: Dict[str, int] = {}
+        institution_ids: Dict[str, int] = {}
+
+        with conn:
+            for session_data in sessions:
+                session = session_data['session_info']
+                conn.execute("INSERT OR REPLACE INTO sessions (id, name, url) VALUES (?, ?, ?)",
+                             (session['id'], session['name'], session.get('url')))
+                for paper in session_data['papers']:
+                    # A paper listed again replaces its row under the same id, so the author,
+                    # institution and full-text rows keyed by that id are replaced as well
+                    existing = conn.execute("SELECT id FROM papers WHERE session_id = ? AND paper_id = ?",
+                                            (session['id'], paper['paper_id'])).fetchone()
+                    if existing:
+                        conn.execute("DELETE FROM paper_authors WHERE paper_id = ?", existing)
+                        conn.execute("DELETE FROM paper_institutions WHERE paper_id = ?", existing)
+                        if with_fts:
+                            conn.execute("DELETE FROM papers_fts WHERE rowid = ?", existing)
+                    cursor = conn.execute(
+                        "INSERT OR REPLACE INTO papers (id, session_id, paper_id, title, abstract, doi, page_number, "
+                        "presentation_url, paper_url, poster_url, presentation_available, paper_available, "
+                        "poster_available) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (existing[0] if existing else None, session['id'], paper['paper_id'], paper['title'],
+                         paper.get('abstract'), paper.get('doi'),
+                         paper.get('page_number'), paper.get('presentation_url'), paper.get('paper_url'),
+                         paper.get('poster_url'), int(bool(paper.get('presentation_available'))),
+                         int(bool(paper.get('paper_available'))), int(bool(paper.get('poster_available'))))
+                    )
+                    row_id = cursor.lastrowid
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO paper_authors (paper_id, author_id, position) VALUES (?, ?, ?)",
+                        [(row_id, _lookup_id(conn, author_ids, 'authors', name), position)
+                         for position, name in enumerate(paper.get('authors', []))]
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO paper_institutions (paper_id, institution_id, position) VALUES (?, ?, ?)",
+                        [(row_id, _lookup_id(conn, institution_ids, 'institutions', name), position)
+                         for position, name in enumerate(paper.get('institutions', []))]
+                    )
+                    if with_fts:
+                        conn.execute("INSERT INTO papers_fts (rowid, title, abstract, authors) VALUES (?, ?, ?, ?)",
+                                     (row_id, paper['title'], paper.get('abstract', ''),
+                                      ', '.join(paper.get('authors', []))))
+
+        counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in ('sessions', 'papers', 'authors', 'institutions')}
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    logger.info(f"SQLite catalogue written: {db_path} ({counts['papers']} papers, {counts['authors']} authors, "
+                f"{counts['institutions']} institutions)")
+    return counts
+
+
+def iter_jsonl_sessions(jsonl_path: Path) -> Iterable[Dict[str, Any]]:
+    """
+    Group the NDJSON paper records into session data dictionaries.
+
+    Args:
+        jsonl_path: NAPAC2025_All_Papers.jsonl file
+
+    Yields:
+        Session data dictionaries (sessions without papers are not present in the NDJSON file)
+    """
+    current = None
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            session_id = record.pop('session_id')
+            session_name = record.pop('session_name')
+            if current is None or current['session_info']['id'] != session_id:
+                if current is not None:
+                    yield current
+                current = {'session_info': {'id': session_id, 'name': session_name}, 'papers': []}
+            current['papers'].append(record)
+    if current is not None:
+        yield current
+
+
+def iter_index_sessions(index_path: Path) -> Iterable[Dict[str, Any]]:
+    """
+    Read session data dictionaries from a NAPAC2025_Complete_Index.json file.
+
+    Args:
+        index_path: Master JSON index
+
+    Returns:
+        List of session data dictionaries
+    """
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)['sessions']
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching all words (quoted, so punctuation is safe)."""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def search(conn: sqlite3.Connection, text: Optional[str] = None, institution: Optional[str] = None,
+           author: Optional[str] = None, session: Optional[str] = None, limit: int = 50) -> List[sqlite3.Row]:
+    """
+    Search the catalogue.
+
+    Args:
+        conn: Open catalogue connection
+        text: Full-text query over title, abstract and authors (all words must match)
+        institution: Substring of an institution name (case-insensitive)
+        author: Substring of an author name (case-insensitive)
+        session: Session ID
+        limit: Maximum number of results
+
+    Returns:
+        Matching papers, best full-text matches first
+    """
+    joins, conditions, params = [], [], []
+    order = "p.session_id, p.paper_id"
+    if text:
+        joins.append("JOIN papers_fts f ON f.rowid = p.id")
+        conditions.append("papers_fts MATCH ?")
+        params.append(fts_query(text))
+        order = "f.rank"
+    if institution:
+        conditions.append("p.id IN (SELECT pi.paper_id FROM paper_institutions pi "
+                          "JOIN institutions i ON i.id = pi.institution_id WHERE i.name LIKE ?)")
+        params.append(f"%{institution}%")
+    if author:
+        conditions.append("p.id IN (SELECT pa.paper_id FROM paper_authors pa "
+                          "JOIN authors a ON a.id = pa.author_id WHERE a.name LIKE ?)")
+        params.append(f"%{author}%")
+    if session:
+        conditions.append("p.session_id = ?")
+        params.append(session.upper())
+
+    sql = (f"SELECT p.id, p.session_id, p.paper_id, p.title, p.doi, p.paper_available FROM papers p "
+           f"{' '.join(joins)} {'WHERE ' + ' AND '.join(conditions) if conditions else ''} "
+           f"ORDER BY {order} LIMIT ?")
+    return conn.execute(sql, params + [limit]).fetchall()
+
+
+def paper_people(conn: sqlite3.Connection, row_id: int) -> Dict[str, List[str]]:
+    """Authors and institutions of a paper, in their original order."""
+    authors = [r[0] for r in conn.execute(
+        "SELECT a.name FROM paper_authors pa JOIN authors a ON a.id = pa.author_id "
+        "WHERE pa.paper_id = ? ORDER BY pa.position", (row_id,))]
+    institutions = [r[0] for r in conn.execute(
+        "SELECT i.name FROM paper_institutions pi JOIN institutions i ON i.id = pi.institution_id "
+        "WHERE pi.paper_id = ? ORDER BY pi.position", (row_id,))]
+    return {'authors': authors, 'institutions': institutions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the NAPAC2025 SQLite paper catalogue")
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB, help="Catalogue database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    search_cmd = commands.add_parser('search', help="Search papers")
+    search_cmd.add_argument('text', nargs='?', help="Full-text query over title, abstract and authors")
+    search_cmd.add_argument('--institution', help="Institution name substring")
+    search_cmd.add_argument('--author', help="Author name substring")
+    search_cmd.add_argument('--session', help="Session ID")
+    search_cmd.add_argument('--limit', type=int, default=50, help="Maximum number of results")
+    search_cmd.add_argument('--json', action='store_true', help="Print results as JSON")
+
+    commands.add_parser('stats', help="Show catalogue statistics")
+
+    build_cmd = commands.add_parser('build', help="Rebuild the catalogue from the NDJSON export")
+    build_cmd.add_argument('--jsonl', type=Path, default=DEFAULT_JSONL, help="NAPAC2025_All_Papers.jsonl file")
+    build_cmd.add_argument('--index', type=Path, help="Build from a NAPAC2025_Complete_Index.json file instead")
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        sessions = iter_index_sessions(args.index) if args.index else iter_jsonl_sessions(args.jsonl)
+        build_catalogue(sessions, args.db)
+        return 0
+
+    if not args.db.exists():
+        print(f"Catalogue not found: {args.db} (run the scraper or 'catalogue.py build' first)")
+        return 2
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+
+    if args.command == 'stats':
+        for table in ('sessions', 'papers', 'authors', 'institutions'):
+            print(f"{table:<14} {conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]}")
+        return 0
+
+    start = time.perf_counter()
+    rows = search(conn, args.text, args.institution, args.author, args.session, args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps([{'session_id': r[1], 'paper_id': r[2], 'title': r[3], 'doi': r[4],
+                           'paper_available': bool(r[5]), **paper_people(conn, r[0])} for r in rows],
+                         ensure_ascii=False, indent=2))
+        return 0
+
+    for row_id, session_id, paper_id, title, doi, paper_available in rows:
+        people = paper_people(conn, row_id)
+        print(f"[{session_id}] {paper_id}: {title}")
+        print(f"    {', '.join(people['authors'])}")
+        if people['institutions']:
+            print(f"    {'; '.join(people['institutions'])}")
+    print(f"\n{len(rows)} papers ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawl Journal for Resumable NAPAC2025 Scraper Runs
+
+Author: Ming Liu
+Description: Append-only JSONL journal recording per-session and per-file completion.
+             Every record is flushed and fsync'ed as soon as it is written, so a run
+             that dies partway (KeyboardInterrupt, crash, power loss) can be resumed:
+             finished sessions are restored from the journal instead of being fetched
+             again, and finished downloads are skipped.
+
+Record types:
+- run_started:   {"event": "run_started", "time": ..., "sessions": [ids], "schema_version": ...,
+                  "selection": ...}
+- session_done:  {"event": "session_done", "session_data": {...}, "html_hash": ..., "downloads": {...}}
+- file_done:     {"event": "file_done", "url": ..., "path": ...}
+- run_complete:  {"event": "run_complete", "time": ...}
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from records import SCHEMA_VERSION, Serializer, create_serializer
+
+
+class CrawlJournal:
+    """Durable append-only record of crawl progress."""
+
+    def __init__(self, path: Path, serializer: Optional[Serializer] = None):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Location of the JSONL journal file
+            serializer: JSON serializer of the records (default: standard library json)
+        """
+        self.path = Path(path)
+        self.serializer = create_serializer(serializer)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Read the journal of the previous run.
+
+        Returns:
+            Dictionary with 'exists', 'complete', 'schema_version', 'selection', 'sessions'
+            (session ID -> session_done record) and 'files' (set of completed file paths)
+        """
+        state = {'exists': False, 'complete': False, 'schema_version': SCHEMA_VERSION, 'selection': None,
+                 'sessions': {}, 'files': set()}
+        if not self.path.exists():
+            return state
+
+        state['exists'] = True
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = self.serializer.loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted write; everything before it is valid
+                    continue
+                event = record.get('event')
+                if event == 'session_done':
+                    state['sessions'][record['session_data']['session_info']['id']] = record
+                elif event == 'file_done':
+                    state['files'].add(record['path'])
+                elif event == 'run_complete':
+                    state['complete'] = True
+                elif event == 'run_started':
+                    # Journals written before the version was recorded use the version 1 layout
+                    state['schema_version'] = record.get('schema_version', 1)
+                    state['selection'] = record.get('selection')
+        return state
+
+    def begin(self, session_ids: List[str], resume: bool = True,
+              selection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Start a run, continuing an unfinished journal when resuming.
+
+        A journal of another record schema version or another selection is not resumed.
+
+        Args:
+            session_ids: IDs of the sessions in this run
+            resume: Continue an unfinished previous journal instead of starting over
+            selection: What a partial run leaves out of its sessions (e.g. {'papers': [...],
+                       'download': False}); None for complete sessions
+
+        Returns:
+            Previous journal state (empty if a fresh journal was started)
+        """
+        state = self.load()
+        if resume and state['exists'] and not state['complete'] and state['schema_version'] == SCHEMA_VERSION \
+                and state['selection'] == selection:
+            mode = 'a'
+        else:
+            state = {'exists': False, 'complete': False, 'schema_version': SCHEMA_VERSION, 'selection': selection,
+                     'sessions': {}, 'files': set()}
+            mode = 'w'
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, mode, encoding='utf-8')
+        self._append({'event': 'run_started', 'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'sessions': session_ids,
+                      'schema_version': SCHEMA_VERSION, 'selection': selection})
+        return state
+
+    def _append(self, record: Dict[str, Any]):
+        if self._file is None:
+            return
+        with self._lock:
+            self._file.write(self.serializer.dumps(record) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_session(self, session_data: Dict[str, Any], html_hash: Optional[str], downloads: Dict[str, int]):
+        """
+        Record a fully processed (saved and downloaded) session.
+
+        Args:
+            session_data: Session data dictionary as used in the master index
+            html_hash: Content hash of the session page
+            downloads: Successful downloads per file type
+        """
+        self._append({'event': 'session_done', 'session_data': session_data,
+                      'html_hash': html_hash, 'downloads': downloads})
+
+    def record_file(self, url: str, path: Path):
+        """
+        Record a completed download.
+
+        Args:
+            url: Source URL
+            path: Local file path
+        """
+        self._append({'event': 'file_done', 'url': url, 'path': str(path)})
+
+    def finish(self):
+        """Mark the run as complete and close the journal."""
+        self._append({'event': 'run_complete', 'time': time.strftime('%Y-%m-%d %H:%M:%S')})
+        self.close()
+
+    def close(self):
+        """Close the journal file without marking the run complete."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static Data Bundle for the NAPAC2025 Data Explorer
+
+Author: Ming Liu
+Description: Writes the paper catalogue as a sharded static bundle that the
+             browser explorer (docs/data-explorer.html) loads on demand:
+             - manifest.json:        conference totals and the session list
+             - sessions/<ID>.json:   paper records of one session
+             - index/<shard>.json:   inverted search index, sharded by the first
+                                     two characters of each term
+
+The explorer only fetches the manifest on first load; session chunks and index
+shards are fetched when a session is opened or a search needs them, so the
+initial download does not grow with the size of the proceedings.
+
+Index terms are lowercased word tokens (letters and digits) of the paper ID,
+title, authors, institutions and abstract. Postings are flat
+[session_index, paper_index, ...] lists pointing into the manifest's session
+list and the session chunks.
+
+Usage:
+    python data_bundle.py [NAPAC2025_Data/NAPAC2025_Complete_Index.json] [docs/data]
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional
+
+from records import Serializer, create_serializer
+
+BUNDLE_VERSION = 1
+MIN_TERM_LENGTH = 2
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+CHUNK_FIELDS = ('paper_id', 'title', 'authors', 'institutions', 'abstract', 'paper_url', 'presentation_url',
+                'poster_url', 'doi', 'paper_available', 'presentation_available', 'poster_available')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms (must match tokenize() in data-explorer.html)."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) >= MIN_TERM_LENGTH]
+
+
+def shard_key(term: str) -> str:
+    """Index shard of a term: hex code points of its first two characters."""
+    return '_'.join(format(ord(char), 'x') for char in term[:MIN_TERM_LENGTH])
+
+
+def _write_json(path: Path, data: Any, serializer: Serializer):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(serializer.dumps(data))
+
+
+def build_data_bundle(sessions: Iterable[Dict[str, Any]], bundle_dir: Path, conference: str = 'NAPAC2025',
+                      logger: Optional[logging.Logger] = None,
+                      serializer: Optional[Serializer] = None) -> Dict[str, Any]:
+    """
+    Write the sharded data bundle, replacing a previous bundle in ``bundle_dir``.
+
+    Args:
+        sessions: Session data dictionaries ('session_info', 'papers'), consumed once
+        bundle_dir: Bundle output directory
+        conference: Conference name shown by the explorer
+        logger: Logger for progress messages
+        serializer: JSON serializer of the bundle files (default: standard library json)
+
+    Returns:
+        The bundle manifest
+    """
+    logger = logger or logging.getLogger(__name__)
+    serializer = create_serializer(serializer)
+    bundle_dir = Path(bundle_dir)
+    tmp_dir = bundle_dir.with_name(bundle_dir.name + '.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    (tmp_dir / 'sessions').mkdir(parents=True)
+    (tmp_dir / 'index').mkdir()
+
+    manifest = {
+        'version': BUNDLE_VERSION,
+        'conference': conference,
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'paper_count': 0,
+        'pdf_count': 0,
+        'sessions': []
+    }
+    postings: Dict[str, List[int]] = defaultdict(list)
+
+    for session_index, session_data in enumerate(sessions):
+        session = session_data['session_info']
+        papers = session_data['papers']
+        chunk = f"sessions/{session['id']}.json"
+        _write_json(tmp_dir / chunk, [{field: paper.get(field) for field in CHUNK_FIELDS} for paper in papers],
+                    serializer)
+
+        pdf_count = sum(1 for paper in papers if paper.get('paper_available'))
+        manifest['sessions'].append({'id': session['id'], 'name': session['name'], 'paper_count': len(papers),
+                                     'pdf_count': pdf_count, 'chunk': chunk})
+        manifest['paper_count'] += len(papers)
+        manifest['pdf_count'] += pdf_count
+
+        for paper_index, paper in enumerate(papers):
+            text = ' '.join([paper['paper_id'], paper['title'], ' '.join(paper.get('authors', [])),
+                             ' '.join(paper.get('institutions', [])), paper.get('abstract', '')])
+            for term in set(tokenize(text)):
+                postings[term].extend((session_index, paper_index))
+
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        shards[shard_key(term)][term] = postings[term]
+    for key, terms in shards.items():
+        _write_json(tmp_dir / 'index' / f"{key}.json", terms, serializer)
+    manifest['index'] = {'min_term_length': MIN_TERM_LENGTH, 'shards': sorted(shards)}
+    _write_json(tmp_dir / 'manifest.json', manifest, serializer)
+
+    # Swap the complete bundle into place
+    old_dir = bundle_dir.with_name(bundle_dir.name + '.old')
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if bundle_dir.exists():
+        os.replace(bundle_dir, old_dir)
+    os.replace(tmp_dir, bundle_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    logger.info(f"Data bundle written: {bundle_dir} ({len(manifest['sessions'])} session chunks, "
+                f"{len(shards)} index shards, {len(postings)} terms)")
+    return manifest
+
+
+def main():
+    index_file = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("NAPAC2025_Data") / "NAPAC2025_Complete_Index.json"
+    bundle_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("docs") / "data"
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    with open(index_file, 'r', encoding='utf-8') as f:
+        sessions = json.load(f)['sessions']
+    conference = index_file.name.split('_')[0]
+    build_data_bundle(sessions, bundle_dir, conference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF Download Manager for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Concurrent, verified file downloads.
+             - Shared worker pool for all sessions
+             - Writes go to '<file>.part' and are renamed into place only after verification
+             - Interrupted downloads resume with HTTP Range requests (guarded by If-Range)
+             - Verifies the '%PDF' magic bytes and the advertised Content-Length
+               (files are requested with 'Accept-Encoding: identity', so the
+               length counts the bytes written to disk)
+             - Records size and SHA-256 of every file in a download manifest
+             - Logs live throughput and ETA
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+import requests
+
+from metrics import error_category
+from transport import CircuitOpenError, is_retryable
+
+PDF_MAGIC = b'%PDF'
+MIN_FILE_SIZE = 100  # Anything smaller is an error page, not a PDF
+
+
+def safe_filename(filename: str, max_length: int = 180) -> str:
+    """
+    Convert filename to safe filesystem name.
+
+    Args:
+        filename: Original filename
+        max_length: Maximum allowed filename length
+
+    Returns:
+        Safe filename string
+    """
+    if not filename:
+        return "unknown"
+
+    # Remove invalid characters
+    filename = re.sub(r'[<>:"/\\|?*\r\n]', '_', filename)
+    filename = re.sub(r'\s+', ' ', filename)
+    filename = filename.strip(' ._')
+
+    # Truncate if too long
+    if len(filename) > max_length:
+        filename = filename[:max_length].rsplit(' ', 1)[0]
+
+    return filename or "unknown"
+
+
+# (file type, output folder, file name suffix) of every downloadable file
+FILE_TYPES = (('presentation', 'Presentations', '_talk'), ('paper', 'Papers', ''), ('poster', 'Posters', '_poster'))
+FILE_SUFFIXES = {file_type: suffix for file_type, _, suffix in FILE_TYPES}
+
+
+def download_path(output_dir: Path, folder: str, session_name: str, paper_id: str, file_type: str) -> Path:
+    """Local path of a downloaded file: PAPERID.pdf, PAPERID_talk.pdf or PAPERID_poster.pdf."""
+    return Path(output_dir) / folder / safe_filename(session_name) / f"{paper_id}{FILE_SUFFIXES[file_type]}.pdf"
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def looks_like_complete_pdf(path: Path) -> bool:
+    """
+    Cheap integrity check for a PDF on disk.
+
+    Args:
+        path: File to check
+
+    Returns:
+        True if the file starts with '%PDF' and has an '%%EOF' trailer near its end
+    """
+    try:
+        size = path.stat().st_size
+        if size < MIN_FILE_SIZE:
+            return False
+        with open(path, 'rb') as f:
+            if f.read(len(PDF_MAGIC)) != PDF_MAGIC:
+                return False
+            f.seek(max(0, size - 1024))
+            return b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
+class DownloadManifest:
+    """SHA-256 manifest of downloaded files, keyed by path relative to the output directory."""
+
+    def __init__(self, path: Path, root: Path):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: Manifest JSON file
+            root: Directory that manifest keys are relative to
+        """
+        self.path = Path(path)
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('files', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def key(self, path: Path) -> str:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        return self.entries.get(self.key(path))
+
+    def record(self, path: Path, url: str, sha256: str, size: int):
+        """Add or replace the entry of a verified file."""
+        with self._lock:
+            self.entries[self.key(path)] = {
+                'url': url,
+                'size': size,
+                'sha256': sha256,
+                'downloaded': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+
+    def is_intact(self, path: Path) -> bool:
+        """
+        Check a file on disk against its manifest entry.
+
+        Files without an entry (e.g. downloaded before the manifest existed) are
+        accepted if they look like a complete PDF and are then added to the manifest.
+
+        Args:
+            path: File to check
+
+        Returns:
+            True if the file can be trusted as complete
+        """
+        path = Path(path)
+        entry = self.get(path)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return False
+        if entry:
+            return entry['size'] == size
+        if looks_like_complete_pdf(path):
+            self.record(path, '', sha256_file(path), size)
+            return True
+        return False
+
+    def verify(self) -> List[str]:
+        """
+        Re-hash every file in the manifest.
+
+        Returns:
+            Manifest keys of files that are missing or whose hash no longer matches
+        """
+        bad = []
+        for key, entry in sorted(self.entries.items()):
+            path = self.root / key
+            if not path.exists() or sha256_file(path) != entry['sha256']:
+                bad.append(key)
+        return bad
+
+    def save(self):
+        with self._lock:
+            data = json.dumps({'updated': time.strftime('%Y-%m-%d %H:%M:%S'), 'files': self.entries},
+                              ensure_ascii=False, indent=2, sort_keys=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+class TransferMeter:
+    """Thread-safe byte/file counters with throughput and ETA reporting."""
+
+    def __init__(self, logger: logging.Logger, report_interval: float = 5.0):
+        self.logger = logger
+        self.report_interval = report_interval
+        self._lock = threading.Lock()
+        self.reset(0)
+
+    def reset(self, expected_files: int):
+        """Start a new measurement for ``expected_files`` downloads."""
+        with self._lock:
+            self.expected_files = expected_files
+            self.finished_files = 0
+            self.transferred_bytes = 0
+            self.start_time = time.monotonic()
+            self._last_report = self.start_time
+
+    def expect(self, files: int):
+        """Add ``files`` downloads to the expected total (sessions are added as they are parsed)."""
+        with self._lock:
+            self.expected_files += files
+
+    def add_bytes(self, count: int):
+        with self._lock:
+            self.transferred_bytes += count
+            now = time.monotonic()
+            due = now - self._last_report >= self.report_interval
+            if due:
+                self._last_report = now
+        if due:
+            self.report()
+
+    def file_finished(self):
+        with self._lock:
+            self.finished_files += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Current transfer metrics.
+
+        Returns:
+            Dictionary with files done/expected, bytes, throughput (bytes/s) and ETA (s)
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self.start_time, 1e-6)
+            throughput = self.transferred_bytes / elapsed
+            remaining = max(self.expected_files - self.finished_files, 0)
+            eta = remaining * (elapsed / self.finished_files) if self.finished_files else 0.0
+            return {
+                'files_done': self.finished_files,
+                'files_expected': self.expected_files,
+                'bytes': self.transferred_bytes,
+                'elapsed': elapsed,
+                'throughput': throughput,
+                'eta': eta
+            }
+
+    def report(self):
+        m = self.snapshot()
+        self.logger.info(f"📥 Downloads: {m['files_done']}/{m['files_expected']} files, "
+                         f"{m['bytes'] / 1e6:.1f} MB, {m['throughput'] / 1e6:.2f} MB/s, ETA {m['eta']:.0f}s")
+
+
+class DownloadManager:
+    """Concurrent, resumable and verified downloads over a scraper transport."""
+
+    def __init__(self, transport, rate_limiter, manifest: DownloadManifest, logger: logging.Logger,
+                 workers: int = 4, chunk_size: int = 64 * 1024):
+        """
+        Initialize the download manager.
+
+        Args:
+            transport: Transport used for HTTP requests
+            rate_limiter: Per-host HostRateLimiter
+            manifest: SHA-256 manifest updated after every verified download
+            logger: Logger for progress messages
+            workers: Number of concurrent downloads
+            chunk_size: Streaming chunk size in bytes
+        """
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.manifest = manifest
+        self.logger = logger
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.meter = TransferMeter(logger)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def map(self, fn: Callable, jobs: List[Any]) -> List[Any]:
+        """
+        Run ``fn`` over ``jobs`` on the shared download pool.
+
+        Args:
+            fn: Callable taking one job
+            jobs: Jobs to run
+
+        Returns:
+            Results in job order
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='download')
+        return [future.result() for future in [self._executor.submit(fn, job) for job in jobs]]
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _part_paths(self, path: Path):
+        part = path.with_name(path.name + '.part')
+        return part, part.with_name(part.name + '.json')
+
+    def download(self, url: str, path: Path, headers: Optional[Dict[str, str]] = None,
+                 record: bool = True) -> Dict[str, Any]:
+        """
+        Download ``url`` to ``path`` with resume and verification.
+
+        Args:
+            url: File URL
+            path: Final destination
+            headers: Extra request headers (e.g. conditional validators)
+            record: Add the verified file to the manifest (off for staging paths)
+
+        Returns:
+            Dictionary with 'status' ('downloaded', 'not_modified' or 'failed'), 'bytes',
+            'headers' (response headers), 'error', on success 'size' and 'sha256' and,
+            on failure, the error 'category'
+        """
+        path = Path(path)
+        attempt = 0
+        while True:
+            request_headers, offset = self._request_headers(path, headers)
+            response = None
+            try:
+                with self.rate_limiter.slot(url):
+                    start = time.monotonic()
+                    response = self.transport.request('GET', url, headers=request_headers or None, stream=True,
+                                                      timeout=60)
+                    self.rate_limiter.feedback(url, response=response, latency=time.monotonic() - start)
+                    try:
+                        delay = self.rate_limiter.retry_delay(url, attempt, response) if is_retryable(response) else None
+                        if delay is None:
+                            return self._receive(url, path, response, offset, record)
+                        reason = f"HTTP {response.status_code}"
+                    finally:
+                        response.close()
+            except (requests.RequestException, OSError) as e:
+                if response is None and isinstance(e, requests.RequestException) and not isinstance(e, CircuitOpenError):
+                    self.rate_limiter.feedback(url, error=e)
+                # Errors while streaming keep the '.part' file, so the retry resumes with a Range request
+                delay = self.rate_limiter.retry_delay(url, attempt) if is_retryable(e) else None
+                if delay is None:
+                    return {'status': 'failed', 'bytes': 0, 'headers': {}, 'error': str(e), 'category': error_category(e)}
+                reason = e
+            self.logger.warning(f"Retrying download {url} in {delay:.1f}s (attempt {attempt + 1}): {reason}")
+            time.sleep(delay)
+            attempt += 1
+
+    def _request_headers(self, path: Path, headers: Optional[Dict[str, str]]):
+        """Request headers for ``path``, with a Range request resuming its partial download, and the resume offset."""
+        part_path, part_meta_path = self._part_paths(path)
+        # Ask for the file as stored: Content-Length and Range offsets then count the bytes written to
+        # disk, not the bytes of a gzip-encoded transfer that the transport decodes
+        request_headers = {'Accept-Encoding': 'identity', **(headers or {})}
+
+        # Resume a partial download if the server can confirm it is the same file
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if offset:
+            validator = None
+            try:
+                with open(part_meta_path, 'r', encoding='utf-8') as f:
+                    part_meta = json.load(f)
+                validator = part_meta.get('etag') or part_meta.get('last_modified')
+            except (OSError, ValueError):
+                pass
+            if validator:
+                request_headers['Range'] = f"bytes={offset}-"
+                request_headers['If-Range'] = validator
+            else:
+                offset = 0
+        return request_headers, offset
+
+    def _receive(self, url: str, path: Path, response, offset: int, record: bool = True) -> Dict[str, Any]:
+        part_path, part_meta_path = self._part_paths(path)
+
+        if response.status_code == 304:
+            part_path.unlink(missing_ok=True)
+            part_meta_path.unlink(missing_ok=True)
+            return {'status': 'not_modified', 'bytes': 0, 'headers': response.headers, 'error': None}
+        if response.status_code == 416:
+            # Partial file is not a valid prefix any more; start over next time
+            part_path.unlink(missing_ok=True)
+            part_meta_path.unlink(missing_ok=True)
+            return {'status': 'failed', 'bytes': 0, 'headers': response.headers,
+                    'error': 'range not satisfiable, discarded partial file', 'category': 'range_not_satisfiable'}
+        response.raise_for_status()
+
+        content_length = int(response.headers.get('content-length', 0) or 0)
+        resuming = response.status_code == 206 and offset > 0
+        if not resuming:
+            offset = 0
+            if 0 < content_length < MIN_FILE_SIZE:
+                return {'status': 'failed', 'bytes': 0, 'headers': response.headers,
+                        'error': f"file too small ({content_length} bytes)", 'category': 'too_small'}
+        expected_size = offset + content_length if content_length else None
+
+        with open(part_meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': response.headers.get('etag'),
+                       'last_modified': response.headers.get('last-modified')}, f)
+
+        written = 0
+        with open(part_path, 'ab' if resuming else 'wb') as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    written += len(chunk)
+                    self.meter.add_bytes(len(chunk))
+
+        size = part_path.stat().st_size
+        if expected_size is not None and size != expected_size:
+            # Keep a short partial for resuming; an oversized one is garbage
+            if size > expected_size:
+                part_path.unlink(missing_ok=True)
+                part_meta_path.unlink(missing_ok=True)
+            return {'status': 'failed', 'bytes': written, 'headers': response.headers,
+                    'error': f"incomplete download ({size} of {expected_size} bytes)", 'category': 'incomplete'}
+
+        with open(part_path, 'rb') as f:
+            magic = f.read(len(PDF_MAGIC))
+        if path.suffix.lower() == '.pdf' and magic != PDF_MAGIC:
+            part_path.unlink(missing_ok=True)
+            part_meta_path.unlink(missing_ok=True)
+            return {'status': 'failed', 'bytes': written, 'headers': response.headers,
+                    'error': f"not a PDF (starts with {magic!r})", 'category': 'not_pdf'}
+
+        digest = sha256_file(part_path)
+        os.replace(part_path, path)
+        part_meta_path.unlink(missing_ok=True)
+        if record:
+            self.manifest.record(path, url, digest, size)
+        return {'status': 'downloaded', 'bytes': written, 'size': size, 'sha256': digest, 'headers': response.headers,
+                'resumed': resuming, 'error': None}
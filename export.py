@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming Export for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Writes the master outputs incrementally while a crawl runs.
+             - NAPAC2025_All_Papers.jsonl: one JSON record per paper (NDJSON)
+             - NAPAC2025_All_Papers.csv:   master CSV, one row per paper
+             - NAPAC2025_Final_Report.txt: per-session statistics streamed to a
+               '.part' file, completed with the run totals when the crawl ends
+             - NAPAC2025_Complete_Index.json: optional pretty-printed index built
+               from the NDJSON file in a final pass
+             - NAPAC2025_All_Papers.parquet / .arrow: optional typed columnar copies
+               of the paper catalogue (requires pyarrow)
+             - Output profiles selecting the per-session files and debug artifacts,
+               and a background writer thread that keeps serialization off the
+               fetch/parse path
+
+Each session is appended and flushed as soon as it is processed, so partial
+results are visible on disk during long crawls and no output is serialized
+from one large in-memory structure at the end. The scraper finishes each session
+(PDF availability, downloads, export) before later ones, so memory is bounded by
+the sessions in flight rather than the whole proceedings. File names
+are prefixed with the conference name (NAPAC2025 by default).
+"""
+
+import csv
+import importlib.util
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, List, Any, Optional, Sequence, Tuple
+
+from records import SCHEMA_VERSION, Serializer, create_serializer
+
+CSV_FIELDS = ['session_name', 'session_id', 'paper_id', 'title', 'authors', 'institutions',
+              'abstract', 'presentation_url', 'presentation_available', 'paper_url', 'paper_available',
+              'poster_url', 'poster_available', 'doi', 'page_number']
+
+# Columns of the per-session papers_data.csv after 'session_name'
+SESSION_CSV_FIELDS = ['paper_id', 'title', 'authors', 'institutions', 'abstract', 'presentation_url',
+                      'presentation_available', 'paper_url', 'paper_available', 'poster_url', 'poster_available',
+                      'doi', 'page_number']
+
+# Keys added to each paper in the NDJSON file
+SESSION_KEYS = ('session_id', 'session_name')
+
+# Per-session files ('json': papers_data.json, 'csv': papers_data.csv, 'txt': papers_summary.txt)
+# and gzip-compressed debug artifacts (raw session page and its text) of each output profile,
+# and whether it builds the SQLite catalogue, the author index and the data explorer bundle.
+# The master files are written by every profile.
+OUTPUT_PROFILES = {
+    'minimal': {'session_files': (), 'debug_artifacts': False, 'sqlite_catalogue': False, 'author_index': False,
+                'data_bundle': False},
+    'standard': {'session_files': ('json',), 'debug_artifacts': False, 'sqlite_catalogue': False,
+                 'author_index': False, 'data_bundle': False},
+    'full': {'session_files': ('json', 'csv', 'txt'), 'debug_artifacts': True, 'sqlite_catalogue': True,
+             'author_index': True, 'data_bundle': True},
+}
+
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+STRING_COLUMNS = ['paper_id', 'title', 'abstract', 'presentation_url', 'paper_url', 'poster_url', 'doi', 'page_number']
+LIST_COLUMNS = ['authors', 'institutions']
+BOOL_COLUMNS = ['presentation_available', 'paper_available', 'poster_available']
+
+
+def paper_schema():
+    """
+    Arrow schema of the columnar paper catalogue.
+
+    Session columns are dictionary-encoded, author and institution lists are
+    list<string> and availability flags are booleans.
+    """
+    import pyarrow as pa
+
+    session_type = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [('session_id', session_type), ('session_name', session_type)] +
+        [(name, pa.string()) for name in STRING_COLUMNS[:2]] +
+        [(name, pa.list_(pa.string())) for name in LIST_COLUMNS] +
+        [(name, pa.string()) for name in STRING_COLUMNS[2:]] +
+        [(name, pa.bool_()) for name in BOOL_COLUMNS]
+    )
+
+
+def csv_row(paper: Dict[str, Any], fields: Sequence[str]) -> List[Any]:
+    """
+    CSV cells of a paper record.
+
+    Args:
+        paper: Paper record or dictionary
+        fields: Paper fields in column order
+
+    Returns:
+        Cell values, with author and institution lists joined by '; '
+    """
+    return ['; '.join(paper[field]) if field in LIST_COLUMNS else paper[field] for field in fields]
+
+
+def default_columnar_formats() -> Tuple[str, ...]:
+    """Columnar formats written when none are configured: Parquet if pyarrow is installed, else none."""
+    return ('parquet',) if importlib.util.find_spec('pyarrow') else ()
+
+
+def output_profile(name: str) -> Dict[str, Any]:
+    """
+    Look up an output profile by name.
+
+    Args:
+        name: 'minimal', 'standard' or 'full'
+
+    Returns:
+        Profile dictionary ('session_files', 'debug_artifacts', 'sqlite_catalogue', 'author_index',
+        'data_bundle')
+    """
+    try:
+        return OUTPUT_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown output profile '{name}' (choose from {', '.join(OUTPUT_PROFILES)})") from None
+
+
+class BackgroundWriter:
+    """Runs output writes on one background thread, in submission order."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, enabled: bool = True, max_pending: int = 64,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 job_context: Optional[Callable[[], ContextManager]] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            logger: Logger for failed writes
+            enabled: Write in the background (False runs every job immediately in the caller)
+            max_pending: Queued jobs before submit() blocks the caller
+            on_error: Called with the exception of a failed job
+            job_context: Context manager factory entered around every job (e.g. a profiler)
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.enabled = enabled
+        self.on_error = on_error
+        self.job_context = job_context
+        self.errors = 0
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._executor = None
+
+    def submit(self, fn: Callable, *args, **kwargs):
+        """Queue ``fn(*args, **kwargs)``; blocks while ``max_pending`` jobs are waiting."""
+        if not self.enabled:
+            self._run(fn, args, kwargs)
+            return
+        self._slots.acquire()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='writer')
+            future = self._executor.submit(self._run, fn, args, kwargs)
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _run(self, fn: Callable, args, kwargs):
+        try:
+            with self.job_context() if self.job_context else nullcontext():
+                fn(*args, **kwargs)
+        except Exception as e:
+            self.errors += 1
+            self.logger.error(f"❌ Background write failed ({getattr(fn, '__name__', fn)}): {e}")
+            if self.on_error:
+                self.on_error(e)
+
+    def flush(self):
+        """Wait until every queued job has finished."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def close(self):
+        """Finish the queued jobs and stop the writer thread (it restarts on the next submit)."""
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Indent every line of ``text`` with ``prefix``."""
+    return '\n'.join(prefix + line for line in text.split('\n'))
+
+
+class StreamingExporter:
+    """Incremental writer of the master JSONL, CSV, report and index files."""
+
+    JSONL_NAME = "{conference}_All_Papers.jsonl"
+    CSV_NAME = "{conference}_All_Papers.csv"
+    REPORT_NAME = "{conference}_Final_Report.txt"
+    INDEX_NAME = "{conference}_Complete_Index.json"
+
+    def __init__(self, output_dir: Path, logger: Optional[logging.Logger] = None, conference: str = 'NAPAC2025',
+                 serializer: Optional[Serializer] = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            output_dir: Directory receiving the master files
+            logger: Logger for progress messages
+            conference: Conference name prefixing the master file names
+            serializer: JSON serializer of the NDJSON file and the index (default: standard library json)
+        """
+        self.output_dir = Path(output_dir)
+        self.logger = logger or logging.getLogger(__name__)
+        self.conference = conference
+        self.serializer = create_serializer(serializer)
+        self.jsonl_path = self.output_dir / self.JSONL_NAME.format(conference=conference)
+        self.csv_path = self.output_dir / self.CSV_NAME.format(conference=conference)
+        self.report_path = self.output_dir / self.REPORT_NAME.format(conference=conference)
+        self.report_part_path = self.report_path.with_name(self.report_path.name + '.part')
+        self.index_path = self.output_dir / self.INDEX_NAME.format(conference=conference)
+        self._jsonl = None
+        self._csv = None
+        self._csv_writer = None
+        self._report = None
+        self.sessions: List[Dict[str, Any]] = []
+        self.totals = {'presentations': 0, 'papers': 0, 'posters': 0}
+
+    def open(self):
+        """Start a new export, truncating the master files of a previous run."""
+        self.close()
+        self.sessions = []
+        self.totals = {'presentations': 0, 'papers': 0, 'posters': 0}
+        self._jsonl = open(self.jsonl_path, 'w', encoding='utf-8')
+        self._csv = open(self.csv_path, 'w', newline='', encoding='utf-8-sig')
+        self._csv_writer = csv.writer(self._csv)
+        self._csv_writer.writerow(CSV_FIELDS)
+        self._report = open(self.report_part_path, 'w', encoding='utf-8')
+
+    def write_session(self, session_data: Dict[str, Any]):
+        """
+        Append one processed session to all sinks and flush them.
+
+        Args:
+            session_data: Session data dictionary ('session_info', 'papers', 'paper_count')
+        """
+        session = session_data['session_info']
+        papers = session_data['papers']
+        self.sessions.append({'session_info': session, 'paper_count': len(papers)})
+
+        available = {
+            'presentations': sum(1 for p in papers if p.get('presentation_available', False)),
+            'papers': sum(1 for p in papers if p.get('paper_available', False)),
+            'posters': sum(1 for p in papers if p.get('poster_available', False))
+        }
+        for key, count in available.items():
+            self.totals[key] += count
+
+        dumps = self.serializer.dumps
+        paper_fields = CSV_FIELDS[2:]
+        for paper in papers:
+            self._jsonl.write(dumps({'session_id': session['id'], 'session_name': session['name'], **paper}) + '\n')
+            self._csv_writer.writerow([session['name'], session['id']] + csv_row(paper, paper_fields))
+
+        f = self._report
+        f.write(f"Session: {session['name']}\n")
+        f.write(f"   Papers: {len(papers)}\n")
+        f.write(f"   Available presentations: {available['presentations']}\n")
+        f.write(f"   Available papers: {available['papers']}\n")
+        f.write(f"   Available posters: {available['posters']}\n")
+        f.write(f"   URL: {session['url']}\n")
+        if papers:
+            f.write("   Paper list:\n")
+            for paper in papers:
+                pdf_icon = "PDF" if paper.get('paper_available', False) else "---"
+                f.write(f"     [{pdf_icon}] {paper['paper_id']}: {paper['title'][:60]}...\n")
+        f.write("\n")
+
+        for sink in (self._jsonl, self._csv, self._report):
+            sink.flush()
+
+    def iter_sessions(self) -> Iterator[Dict[str, Any]]:
+        """
+        Read the exported sessions back from the NDJSON file, one session at a time.
+
+        Yields:
+            Session data dictionaries in export order
+        """
+        if self._jsonl is not None:
+            self._jsonl.flush()
+        loads = self.serializer.loads
+        with open(self.jsonl_path, 'r', encoding='utf-8') as f:
+            for entry in self.sessions:
+                papers = []
+                for _ in range(entry['paper_count']):
+                    record = loads(f.readline())
+                    papers.append({k: v for k, v in record.items() if k not in SESSION_KEYS})
+                yield {'session_info': entry['session_info'], 'papers': papers, 'paper_count': entry['paper_count']}
+
+    def finalize(self, stats: Dict[str, int], pretty_index: bool = True) -> Dict[str, Any]:
+        """
+        Complete the report and optionally write the pretty-printed JSON index.
+
+        Args:
+            stats: Scraper statistics of the run
+            pretty_index: Also write <conference>_Complete_Index.json
+
+        Returns:
+            Scrape summary ('scrape_info' of the index)
+        """
+        scrape_info = {
+            'scrape_time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'sessions_processed': stats['sessions_processed'],
+            'total_papers': stats['total_papers'],
+            'available_presentations': self.totals['presentations'],
+            'available_papers': self.totals['papers'],
+            'available_posters': self.totals['posters'],
+            'downloaded_presentations': stats['downloaded_presentations'],
+            'downloaded_papers': stats['downloaded_papers'],
+            'downloaded_posters': stats['downloaded_posters'],
+            'errors': stats['errors']
+        }
+
+        self._report.close()
+        self._report = None
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            f.write(f"{self.conference} Conference Complete Scraping Report\n")
+            f.write("=" * 60 + "\n")
+            f.write(f"Scrape completion time: {scrape_info['scrape_time']}\n")
+            f.write(f"Sessions processed: {stats['sessions_processed']}\n")
+            f.write(f"Total papers: {stats['total_papers']}\n")
+            f.write(f"Available presentations: {self.totals['presentations']}\n")
+            f.write(f"Available papers: {self.totals['papers']}\n")
+            f.write(f"Available posters: {self.totals['posters']}\n")
+            f.write(f"Successfully downloaded presentations: {stats['downloaded_presentations']}\n")
+            f.write(f"Successfully downloaded papers: {stats['downloaded_papers']}\n")
+            f.write(f"Successfully downloaded posters: {stats['downloaded_posters']}\n")
+            f.write(f"Errors: {stats['errors']}\n\n")
+
+            f.write("Session detailed statistics:\n")
+            f.write("-" * 50 + "\n")
+            with open(self.report_part_path, 'r', encoding='utf-8') as part:
+                for line in part:
+                    f.write(line)
+        self.report_part_path.unlink(missing_ok=True)
+
+        if pretty_index:
+            self.write_index(scrape_info)
+        return scrape_info
+
+    def write_index(self, scrape_info: Dict[str, Any]):
+        """
+        Write the pretty-printed JSON index one session at a time.
+
+        The output is byte-identical to ``json.dump({...}, indent=2)`` of the whole index.
+        The index starts with the record ``schema_version``.
+
+        Args:
+            scrape_info: Scrape summary for the index header
+        """
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f'{{\n  "schema_version": {SCHEMA_VERSION},\n  "scrape_info": ')
+            f.write(_indent(self.serializer.dumps(scrape_info, indent=True), '  ').lstrip())
+            f.write(',\n  "sessions": [')
+            for i, session_data in enumerate(self.iter_sessions()):
+                f.write(',\n' if i else '\n')
+                f.write(_indent(self.serializer.dumps(session_data, indent=True), '    '))
+            f.write('\n  ]\n}' if self.sessions else ']\n}')
+        os.replace(tmp_path, self.index_path)
+
+    def write_columnar(self, formats: Sequence[str] = ('parquet',), batch_size: int = 2048) -> List[Path]:
+        """
+        Convert the NDJSON catalogue into typed columnar files, one record batch at a time.
+
+        Args:
+            formats: Any of 'parquet' (compressed, for analytics tools) and 'arrow'
+                     (Arrow IPC file, can be memory-mapped without parsing)
+            batch_size: Papers per record batch / Parquet row group
+
+        Returns:
+            Paths of the written files (empty if pyarrow is not installed)
+        """
+        unknown = [fmt for fmt in formats if fmt not in COLUMNAR_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown columnar format(s) {unknown}, expected any of: {', '.join(COLUMNAR_FORMATS)}")
+        if not formats:
+            return []
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.logger.warning("pyarrow is not installed, skipping columnar export (pip install pyarrow)")
+            return []
+
+        if self._jsonl is not None:
+            self._jsonl.flush()
+        schema = paper_schema()
+        # Arrow IPC files allow one dictionary per field for the whole file, so the
+        # per-batch dictionaries only go to Parquet; the IPC file has plain string columns
+        plain_schema = pa.schema([pa.field(field.name, field.type.value_type)
+                                  if pa.types.is_dictionary(field.type) else field for field in schema])
+        paths = {fmt: self.output_dir / f"{self.conference}_All_Papers.{fmt}" for fmt in formats}
+        tmp_paths = {fmt: path.with_name(path.name + '.tmp') for fmt, path in paths.items()}
+        writers = {}
+
+        def flush_batch(records: List[Dict[str, Any]]):
+            columns = [pa.array([r.get(field.name) for r in records], type=field.type) for field in plain_schema]
+            if 'parquet' in writers:
+                encoded = [column.dictionary_encode() if pa.types.is_dictionary(field.type) else column
+                           for column, field in zip(columns, schema)]
+                writers['parquet'].write_batch(pa.RecordBatch.from_arrays(encoded, schema=schema))
+            if 'arrow' in writers:
+                writers['arrow'].write_batch(pa.RecordBatch.from_arrays(columns, schema=plain_schema))
+
+        try:
+            try:
+                if 'parquet' in formats:
+                    writers['parquet'] = pq.ParquetWriter(tmp_paths['parquet'], schema, compression='zstd')
+                if 'arrow' in formats:
+                    writers['arrow'] = pa.ipc.new_file(tmp_paths['arrow'], plain_schema)
+                records = []
+                with open(self.jsonl_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        records.append(self.serializer.loads(line))
+                        if len(records) >= batch_size:
+                            flush_batch(records)
+                            records = []
+                if records:
+                    flush_batch(records)
+            finally:
+                for writer in writers.values():
+                    writer.close()
+        except Exception:
+            for tmp_path in tmp_paths.values():
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+        for fmt, path in paths.items():
+            os.replace(tmp_paths[fmt], path)
+            self.logger.info(f"Columnar export written: {path}")
+        return list(paths.values())
+
+    def close(self):
+        """Close all open sinks."""
+        for sink in (self._jsonl, self._csv, self._report):
+            if sink is not None:
+                sink.close()
+        self._jsonl = self._csv = self._csv_writer = self._report = None
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Full-Text Index of the Downloaded PDFs
+
+Author: Ming Liu
+Description: Post-download stage that extracts the text and page count of every
+             PDF in Papers/, Presentations/ and Posters/ and keeps a ranked
+             full-text index of the whole corpus.
+             - Extraction runs on a process pool across all cores (requires pypdf)
+             - Incremental: files with unchanged size and mtime are skipped, and
+               files whose content hash is unchanged are not re-extracted
+             - Content is extracted once per SHA-256: hardlinked store views and
+               copies of an indexed file reuse its text
+             - SQLite FTS5 inverted index with BM25 ranking and snippets, so queries
+               over the full corpus return in milliseconds
+
+Tables:
+- documents(id, path, file_type, session_dir, paper_id, size, mtime_ns, sha256, pages, chars, error, indexed)
+- documents_fts: FTS5 index over the extracted text (rowid = documents.id)
+
+Usage:
+    python fulltext.py index [NAPAC2025_Data] [--workers N] [--verify-hash]
+    python fulltext.py search "beam loss monitor" [--type paper] [--session MOP] [--limit 20]
+    python fulltext.py stats
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from catalogue import fts5_available, fts_query
+from download_manager import FILE_TYPES, sha256_file
+
+DEFAULT_OUTPUT_DIR = Path("NAPAC2025_Data")
+INDEX_NAME = "{conference}_Fulltext.sqlite"
+# Results inserted per transaction
+COMMIT_INTERVAL = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    file_type TEXT NOT NULL,
+    session_dir TEXT NOT NULL,
+    paper_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    pages INTEGER,
+    chars INTEGER,
+    error TEXT,
+    indexed TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_paper ON documents (paper_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(text, tokenize='porter unicode61');
+"""
+
+
+def require_pdf_library():
+    """Fail early if the PDF text extractor is not installed."""
+    if importlib.util.find_spec('pypdf') is None:
+        raise ImportError("Full-text extraction requires pypdf: pip install pypdf")
+
+
+def extract_pdf_text(path: str) -> Tuple[str, int]:
+    """
+    Extract the text of a PDF.
+
+    Args:
+        path: PDF file
+
+    Returns:
+        (text with pages separated by form feeds, page count)
+    """
+    import pypdf
+
+    # Damaged files are reported by the caller; keep pypdf's recovery warnings out of the log
+    logging.getLogger('pypdf').setLevel(logging.ERROR)
+    reader = pypdf.PdfReader(path)
+    pages = [page.extract_text() or '' for page in reader.pages]
+    return '\f'.join(pages), len(pages)
+
+
+def _hash_file(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Hash a PDF (runs in a pool worker).
+
+    Args:
+        path: Absolute path
+
+    Returns:
+        (SHA-256 or None, error message or None)
+    """
+    try:
+        return sha256_file(Path(path)), None
+    except OSError as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _extract_file(path: str) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Extract the text of a PDF (runs in a pool worker).
+
+    Args:
+        path: Absolute path
+
+    Returns:
+        (text, page count or None, error message or None)
+    """
+    try:
+        text, pages = extract_pdf_text(path)
+        return text, pages, None
+    except Exception as e:
+        return '', None, f"{type(e).__name__}: {e}"
+
+
+def scan_pdfs(output_dir: Path) -> Iterator[Tuple[str, str, str, str, os.stat_result]]:
+    """
+    List the downloaded PDFs with os.scandir.
+
+    Args:
+        output_dir: Scraper output directory
+
+    Yields:
+        (relative path, file type, session folder, paper ID, stat result)
+    """
+    for file_type, folder, suffix in FILE_TYPES:
+        root = output_dir / folder
+        if not root.is_dir():
+            continue
+        with os.scandir(root) as session_dirs:
+            for session_dir in session_dirs:
+                if not session_dir.is_dir():
+                    continue
+                with os.scandir(session_dir.path) as files:
+                    for entry in files:
+                        if not entry.is_file() or not entry.name.lower().endswith('.pdf'):
+                            continue
+                        stem = entry.name[:-len('.pdf')]
+                        paper_id = stem[:-len(suffix)] if suffix and stem.endswith(suffix) else stem
+                        yield f"{folder}/{session_dir.name}/{entry.name}", file_type, session_dir.name, paper_id, \
+                            entry.stat()
+
+
+def open_index(db_path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the full-text index database."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def update_fulltext_index(output_dir: Path, db_path: Optional[Path] = None, workers: Optional[int] = None,
+                          verify_hash: bool = False, conference: str = 'NAPAC2025',
+                          logger: Optional[logging.Logger] = None) -> Dict[str, int]:
+    """
+    Bring the full-text index up to date with the PDFs on disk.
+
+    Args:
+        output_dir: Scraper output directory
+        db_path: Index database (default '<output_dir>/<conference>_Fulltext.sqlite')
+        workers: Extraction processes (default: one per CPU core)
+        verify_hash: Also hash files whose size and mtime are unchanged
+        conference: Conference name prefixing the default database name
+        logger: Logger for progress messages
+
+    Returns:
+        Counts of 'files', 'skipped', 'extracted', 'duplicates' (text copied from a file with the same
+        hash), 'unchanged' (same hash), 'failed' and 'removed' files
+    """
+    logger = logger or logging.getLogger(__name__)
+    output_dir = Path(output_dir)
+    db_path = Path(db_path or output_dir / INDEX_NAME.format(conference=conference))
+    if not fts5_available():
+        raise RuntimeError("SQLite was built without FTS5; the full-text index needs it")
+    require_pdf_library()
+    start_time = time.time()
+
+    conn = open_index(db_path)
+    try:
+        indexed = {row[0]: row[1:] for row in conn.execute("SELECT path, id, size, mtime_ns, sha256 FROM documents")}
+        counts = {'files': 0, 'skipped': 0, 'extracted': 0, 'duplicates': 0, 'unchanged': 0, 'failed': 0,
+                  'removed': 0}
+        jobs = []
+        files = {}
+        for rel_path, file_type, session_dir, paper_id, stat in scan_pdfs(output_dir):
+            counts['files'] += 1
+            files[rel_path] = (file_type, session_dir, paper_id, stat.st_size, stat.st_mtime_ns)
+            previous = indexed.get(rel_path)
+            if previous and previous[1:3] == (stat.st_size, stat.st_mtime_ns) and not verify_hash:
+                counts['skipped'] += 1
+                continue
+            jobs.append(rel_path)
+
+        hashes, contents, sources, indexed_text = {}, {}, {}, {}
+        if jobs:
+            workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+            chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                hashes = dict(zip(jobs, pool.map(_hash_file, [str(output_dir / rel_path) for rel_path in jobs],
+                                                 chunksize=chunksize)))
+                # The same content under several paths (hardlinked store views, cross-listed papers)
+                # is extracted once; text already in the index is copied instead of re-extracted
+                for rel_path in jobs:
+                    sha, error = hashes[rel_path]
+                    previous = indexed.get(rel_path)
+                    if error or (previous and previous[3] == sha) or sha in sources:
+                        continue
+                    sources[sha] = rel_path
+                    row = conn.execute("SELECT d.pages, f.text FROM documents d JOIN documents_fts f ON f.rowid = d.id "
+                                       "WHERE d.sha256 = ? AND d.error IS NULL LIMIT 1", (sha,)).fetchone()
+                    if row:
+                        indexed_text[sha] = (row[1], row[0], None)
+                extract = [sha for sha in sources if sha not in indexed_text]
+                logger.info(f"Extracting text from {len(extract)} PDFs with {workers} worker process(es) "
+                            f"({counts['skipped']} unchanged files skipped, "
+                            f"{len(jobs) - len(extract)} hashed files need no extraction)")
+                contents = dict(zip(extract, pool.map(_extract_file, [str(output_dir / sources[sha]) for sha in extract],
+                                                      chunksize=chunksize)))
+                contents.update(indexed_text)
+
+        with conn:
+            # Files deleted since the last update
+            for rel_path in indexed.keys() - files.keys():
+                row_id = indexed[rel_path][0]
+                conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row_id,))
+                conn.execute("DELETE FROM documents WHERE id = ?", (row_id,))
+                counts['removed'] += 1
+
+            for done, rel_path in enumerate(jobs, 1):
+                file_type, session_dir, paper_id, size, mtime_ns = files[rel_path]
+                previous = indexed.get(rel_path)
+                sha, error = hashes[rel_path]
+                if not error and previous and previous[3] == sha:
+                    counts['unchanged'] += 1
+                    conn.execute("UPDATE documents SET size = ?, mtime_ns = ? WHERE id = ?",
+                                 (size, mtime_ns, previous[0]))
+                    continue
+                text, pages = '', None
+                if not error:
+                    text, pages, error = contents[sha]
+                if error:
+                    counts['failed'] += 1
+                    logger.warning(f"⚠️ Could not extract {rel_path}: {error}")
+                else:
+                    counts['extracted' if sources[sha] == rel_path and sha not in indexed_text else 'duplicates'] += 1
+                if previous:
+                    conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (previous[0],))
+                    conn.execute("DELETE FROM documents WHERE id = ?", (previous[0],))
+                cursor = conn.execute(
+                    "INSERT INTO documents (path, file_type, session_dir, paper_id, size, mtime_ns, sha256, "
+                    "pages, chars, error, indexed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rel_path, file_type, session_dir, paper_id, size, mtime_ns, sha, pages, len(text), error,
+                     time.strftime('%Y-%m-%d %H:%M:%S')))
+                conn.execute("INSERT INTO documents_fts (rowid, text) VALUES (?, ?)", (cursor.lastrowid, text))
+                if done % COMMIT_INTERVAL == 0:
+                    conn.commit()
+        if jobs:
+            conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('optimize')")
+            conn.commit()
+    finally:
+        conn.close()
+
+    logger.info(f"Full-text index updated: {db_path} ({counts['files']} PDFs, {counts['extracted']} extracted, "
+                f"{counts['duplicates']} duplicates, "
+                f"{counts['unchanged'] + counts['skipped']} unchanged, {counts['failed']} failed, "
+                f"{counts['removed']} removed) in {time.time() - start_time:.2f} seconds")
+    return counts
+
+
+def search_fulltext(conn: sqlite3.Connection, text: str, file_type: Optional[str] = None,
+                    session: Optional[str] = None, limit: int = 20) -> List[sqlite3.Row]:
+    """
+    Search the extracted PDF text.
+
+    Args:
+        conn: Open index connection
+        text: Full-text query (all words must match)
+        file_type: 'paper', 'presentation' or 'poster'
+        session: Session ID prefix of the session folder (e.g. 'MOP')
+        limit: Maximum number of results
+
+    Returns:
+        Rows (path, file_type, session_dir, paper_id, pages, score, snippet), best matches first
+    """
+    conditions, params = ["documents_fts MATCH ?"], [fts_query(text)]
+    if file_type:
+        conditions.append("d.file_type = ?")
+        params.append(file_type)
+    if session:
+        conditions.append("d.session_dir LIKE ?")
+        params.append(f"{session.upper()} %")
+    sql = ("SELECT d.path, d.file_type, d.session_dir, d.paper_id, d.pages, bm25(documents_fts) AS score, "
+           "snippet(documents_fts, 0, '[', ']', ' ... ', 12) FROM documents_fts "
+           "JOIN documents d ON d.id = documents_fts.rowid "
+           f"WHERE {' AND '.join(conditions)} ORDER BY score LIMIT ?")
+    return conn.execute(sql, params + [limit]).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text index of the downloaded NAPAC2025 PDFs")
+    parser.add_argument('--db', type=Path, help="Index database (default: <output_dir>/NAPAC2025_Fulltext.sqlite)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    index_cmd = commands.add_parser('index', help="Extract new and changed PDFs and update the index")
+    index_cmd.add_argument('output_dir', nargs='?', default=DEFAULT_OUTPUT_DIR, type=Path,
+                           help="Scraper output directory")
+    index_cmd.add_argument('--workers', type=int, help="Extraction processes (default: all cores)")
+    index_cmd.add_argument('--verify-hash', action='store_true', help="Hash files even if size and mtime match")
+
+    search_cmd = commands.add_parser('search', help="Search the PDF text")
+    search_cmd.add_argument('text', help="Full-text query (all words must match)")
+    search_cmd.add_argument('--type', choices=[file_type for file_type, _, _ in FILE_TYPES], help="File type")
+    search_cmd.add_argument('--session', help="Session ID")
+    search_cmd.add_argument('--limit', type=int, default=20, help="Maximum number of results")
+    search_cmd.add_argument('--json', action='store_true', help="Print results as JSON")
+
+    commands.add_parser('stats', help="Show index statistics")
+    args = parser.parse_args()
+
+    if args.command == 'index':
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        try:
+            counts = update_fulltext_index(args.output_dir, args.db, args.workers, args.verify_hash)
+        except (ImportError, RuntimeError) as e:
+            print(f"❌ {e}")
+            return 2
+        return 1 if counts['failed'] else 0
+
+    db_path = args.db or DEFAULT_OUTPUT_DIR / INDEX_NAME.format(conference='NAPAC2025')
+    if not db_path.exists():
+        print(f"Full-text index not found: {db_path} (run 'fulltext.py index' first)")
+        return 2
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+    if args.command == 'stats':
+        documents, pages, chars, failed = conn.execute(
+            "SELECT COUNT(*), SUM(pages), SUM(chars), SUM(error IS NOT NULL) FROM documents").fetchone()
+        print(f"documents      {documents}")
+        print(f"pages          {pages or 0}")
+        print(f"characters     {chars or 0}")
+        print(f"failed         {failed or 0}")
+        for file_type, count in conn.execute("SELECT file_type, COUNT(*) FROM documents GROUP BY file_type"):
+            print(f"  {file_type:<12} {count}")
+        return 0
+
+    start = time.perf_counter()
+    rows = search_fulltext(conn, args.text, args.type, args.session, args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps([{'path': r[0], 'file_type': r[1], 'session': r[2], 'paper_id': r[3], 'pages': r[4],
+                           'score': round(-r[5], 4), 'snippet': r[6]} for r in rows], ensure_ascii=False, indent=2))
+        return 0
+
+    for path, file_type, session_dir, paper_id, pages, score, snippet in rows:
+        print(f"[{session_dir.split(' ')[0]}] {paper_id} ({file_type}, {pages} pages, score {-score:.2f})")
+        print(f"    {' '.join(snippet.split())}")
+        print(f"    {path}")
+    print(f"\n{len(rows)} documents ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
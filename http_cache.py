@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+On-disk HTTP Cache for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: URL-keyed cache storing response validators (ETag / Last-Modified)
+             and, optionally, response bodies. The scraper sends If-None-Match /
+             If-Modified-Since on re-runs and serves the stored body on a
+             304 Not Modified, so unchanged session pages are not downloaded again.
+             Entries are evicted least-recently-used first once the configured
+             size or entry limits are exceeded.
+
+Layout: one '<sha256(url)>.json' metadata file per URL plus an optional
+'<sha256(url)>.body' file with the cached response body.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+class HTTPCache:
+    """URL-keyed HTTP validator and body cache with LRU eviction."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 100 * 1024 * 1024, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            max_bytes: Maximum total size of cached bodies and metadata
+            max_entries: Maximum number of cached URLs (None = unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        # Created with the first stored entry
+        self._dir_ready = False
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.json"
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.body"
+
+    def _write_atomic(self, path: Path, data: bytes):
+        if not self._dir_ready:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached metadata for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Metadata dictionary or None if the URL is not cached
+        """
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('has_body') and not self._body_path(url).exists():
+            return None
+        return meta
+
+    def conditional_headers(self, url: str, fallback_mtime: Optional[float] = None) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a URL.
+
+        Args:
+            url: Request URL
+            fallback_mtime: Local file mtime to use as If-Modified-Since when no validators are cached
+
+        Returns:
+            Dictionary of conditional request headers (empty if nothing is known)
+        """
+        headers = {}
+        meta = self.lookup(url)
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        if not headers and fallback_mtime is not None:
+            headers['If-Modified-Since'] = formatdate(fallback_mtime, usegmt=True)
+        return headers
+
+    def store(self, url: str, headers: Dict[str, str], body: Optional[bytes] = None,
+              encoding: Optional[str] = None):
+        """
+        Store validators (and optionally the body) of a 200 response.
+
+        Responses without an ETag or Last-Modified header cannot be revalidated
+        and are not cached.
+
+        Args:
+            url: Request URL
+            headers: Response headers
+            body: Response body, or None to cache validators only
+            encoding: Text encoding used to decode the body
+        """
+        etag = headers.get('etag') or headers.get('ETag')
+        last_modified = headers.get('last-modified') or headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': headers.get('content-type') or headers.get('Content-Type', ''),
+            'encoding': encoding,
+            'has_body': body is not None,
+            'size': len(body) if body is not None else 0,
+            'stored_at': time.time(),
+            'last_access': time.time()
+        }
+        with self._lock:
+            if body is not None:
+                self._write_atomic(self._body_path(url), body)
+            else:
+                self._body_path(url).unlink(missing_ok=True)
+            self._write_atomic(self._meta_path(url), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def body(self, url: str) -> Optional[bytes]:
+        """
+        Read the cached body of a URL and mark the entry as recently used.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Cached body bytes or None
+        """
+        meta = self.lookup(url)
+        if not meta or not meta.get('has_body'):
+            return None
+        try:
+            data = self._body_path(url).read_bytes()
+        except OSError:
+            return None
+        self.touch(url, meta)
+        return data
+
+    def touch(self, url: str, meta: Optional[Dict[str, Any]] = None):
+        """Update the last-access time of a cache entry."""
+        meta = meta or self.lookup(url)
+        if not meta:
+            return
+        meta['last_access'] = time.time()
+        with self._lock:
+            self._write_atomic(self._meta_path(url), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def evict(self) -> int:
+        """
+        Evict least-recently-used entries until the size and entry limits hold.
+
+        Returns:
+            Number of evicted entries
+        """
+        with self._lock:
+            entries = []
+            total_bytes = 0
+            for meta_path in self.cache_dir.glob('*.json'):
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    meta_path.unlink(missing_ok=True)
+                    continue
+                size = meta.get('size', 0) + meta_path.stat().st_size
+                entries.append((meta.get('last_access', 0), meta_path, size))
+                total_bytes += size
+
+            entries.sort()
+            evicted = 0
+            while entries and (total_bytes > self.max_bytes or
+                               (self.max_entries is not None and len(entries) > self.max_entries)):
+                _, meta_path, size = entries.pop(0)
+                meta_path.with_suffix('.body').unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                total_bytes -= size
+                evicted += 1
+            return evicted
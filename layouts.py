@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Proceedings Site Layouts for the JACoW Scraper
+
+Author: Ming Liu
+Description: Site-layout adapters describing how a JACoW proceedings site lists
+             its sessions and papers:
+             - 'meow':   meow.elettra.eu sites (html/session_list.html with
+                         data-href session links, contrib-* paper blocks)
+             - 'jacow':  classic JACoW proceedings (html/sessi0n1.htm session
+                         frame, one html/<session>.htm table page per session)
+
+The scraper asks its layout for the session list URL, the parsed session list
+and the paper records of a session page; fetching, PDF checks, downloads and
+exports are shared by all layouts.
+"""
+
+import re
+from typing import Dict, List, Optional, Type
+from urllib.parse import urljoin
+
+from parsers import Node
+from records import Paper, Session
+
+
+class SiteLayout:
+    """Base class for proceedings site layouts."""
+
+    name = 'base'
+    session_list_path = ''
+
+    def session_list_url(self, base_url: str) -> str:
+        """URL of the page listing all sessions."""
+        return urljoin(base_url, self.session_list_path)
+
+    def parse_session_list(self, doc: Node, base_url: str) -> List[Session]:
+        """
+        Parse the session list page.
+
+        Args:
+            doc: Parsed session list page
+            base_url: Base URL of the proceedings
+
+        Returns:
+            Session records ('id', 'name', 'url')
+        """
+        raise NotImplementedError
+
+    def extract_papers(self, scraper, doc: Node, session: Dict[str, str]) -> List[Paper]:
+        """
+        Extract the paper records of a session page.
+
+        Args:
+            scraper: Scraper instance (record building, DOI prefix, logger)
+            doc: Parsed session page
+            session: Session record
+
+        Returns:
+            List of paper records
+        """
+        raise NotImplementedError
+
+
+class MeowLayout(SiteLayout):
+    """meow.elettra.eu proceedings (e.g. NAPAC2025 at https://meow.elettra.eu/97/)."""
+
+    name = 'meow'
+    # Sessions are loaded dynamically from html/session_list.html, with links stored in
+    # data-href attributes (e.g., 'session/1161-mowp/index.html')
+    session_list_path = 'html/session_list.html'
+
+    def parse_session_list(self, doc, base_url):
+        sessions = []
+        for a in doc.find_all('a', attr='data-href'):
+            data_href = a.get('data-href')
+            # Only process session links (e.g., 'session/1161-mowp/index.html')
+            if not data_href or not data_href.startswith('session/'):
+                continue
+
+            # Extract session ID from path segment like '1161-mowp'
+            parts = data_href.split('/')
+            if len(parts) >= 2:
+                seg = parts[1]  # e.g., '1161-mowp'
+                code = seg.split('-', 1)[1].upper() if '-' in seg else seg.upper()
+            else:
+                # Fallback: use first word from link text
+                text = a.text().strip()
+                code = text.split()[0].upper() if text else 'UNKNOWN'
+
+            # Get full session name from link text
+            name = a.text().strip() or code
+            sessions.append(Session(code, name, urljoin(base_url, data_href)))
+        return sessions
+
+    def extract_papers(self, scraper, doc, session):
+        return scraper.extract_papers_from_session(doc, session['id'])
+
+
+class JacowClassicLayout(SiteLayout):
+    """Classic JACoW proceedings (e.g. SRF2023 at https://proceedings.jacow.org/srf2023/)."""
+
+    name = 'jacow'
+    # Left frame of the classic site: session IDs, each followed by the session name
+    session_list_path = 'html/sessi0n1.htm'
+    SESSION_ID_PATTERN = re.compile(r'[A-Z][A-Z0-9]{2,7}')
+    # Classic paper IDs carry the full session code (e.g. MOPMB001, THTUT01)
+    PAPER_ID_PATTERN = re.compile(r'[A-Z]{2,6}\d{2,3}[A-Z]?')
+
+    def parse_session_list(self, doc, base_url):
+        list_url = self.session_list_url(base_url)
+        # Session links of the frame, by link text (e.g. 'THTUT' -> 'thtut.htm')
+        links = {}
+        for a in doc.find_all('a', attr='href'):
+            text = a.text().strip()
+            href = a.get('href').split('#')[0]
+            if self.SESSION_ID_PATTERN.fullmatch(text) and href.lower().endswith('.htm'):
+                links.setdefault(text, urljoin(list_url, href))
+
+        lines = [line.strip() for line in doc.text().split('\n') if line.strip()]
+        sessions = []
+        seen = set()
+        i = 0
+        while i < len(lines):
+            session_id = lines[i]
+            # Without session links fall back to the frame's text layout: a 5-letter
+            # upper-case line (session ID like THTUT) followed by the session name
+            is_session = session_id in links if links else len(session_id) == 5 and session_id.isupper()
+            if is_session and session_id not in seen and i + 1 < len(lines):
+                seen.add(session_id)
+                sessions.append(Session(session_id, lines[i + 1],
+                                        links.get(session_id) or urljoin(base_url, f"html/{session_id.lower()}.htm")))
+                i += 2
+            else:
+                i += 1
+        return sessions
+
+    def extract_papers(self, scraper, doc, session):
+        # Each paper starts with a 'tablerow' row whose id is the paper ID (papkey,
+        # paptitle and pappage cells); the following rows until the next paper hold
+        # the author list and the abstract
+        blocks = []
+        for row in doc.find_all('tr'):
+            row_id = (row.get('id') or '').upper()
+            if self.PAPER_ID_PATTERN.fullmatch(row_id):
+                blocks.append((row_id, [row]))
+            elif blocks:
+                blocks[-1][1].append(row)
+
+        papers = []
+        for paper_id, rows in blocks:
+            title_cell = rows[0].find('td', classes=['paptitle'])
+            title = ' '.join(title_cell.text().split()) if title_cell else ''
+            if not title:
+                continue
+            page_cell = rows[0].find('td', classes=['pappage'])
+            # The page cell links the paper PDF with the page number as link text
+            page_link = page_cell.find('a') if page_cell else None
+            page_num = (page_link or page_cell).text().strip() if page_cell else ''
+            paper_info = scraper.build_paper_record(paper_id, title, page_num, None, None, None, found=False)
+
+            for row in rows:
+                # <li><span class="author_cl">A. Name</span>, <span ...>B. Name</span>, Institution</li>
+                for item in row.find_all('li'):
+                    inst_text = item.text()
+                    for span in item.find_all('span', classes=['author_cl']):
+                        author_name = span.text().strip().rstrip(',')
+                        if author_name:
+                            paper_info.add_author(author_name)
+                        inst_text = inst_text.replace(span.text(), '', 1)
+                    inst_text = ' '.join(inst_text.split()).strip(' ,')
+                    if inst_text:
+                        paper_info.add_institution(inst_text)
+                abstract_cell = row.find('td', classes=['abstract'])
+                if abstract_cell and not paper_info['abstract']:
+                    paper_info['abstract'] = abstract_cell.text().strip()
+                self._assign_pdf_links(row, session['url'], paper_info)
+
+            papers.append(paper_info)
+            scraper.logger.info(f"  ✓ {paper_id}: {title[:50]}...")
+
+        if not papers:
+            scraper.logger.warning(f"No papers detected in session {session['id']}")
+        return papers
+
+    @staticmethod
+    def _assign_pdf_links(row: Node, page_url: str, paper_info: Paper):
+        """Fill the paper, talk and poster URLs from the PDF links of a table row."""
+        for a in row.find_all('a', attr='href'):
+            href = a.get('href').split('#')[0]
+            if not href.lower().endswith('.pdf'):
+                continue
+            url = urljoin(page_url, href)
+            name = href.rsplit('/', 1)[-1].lower()
+            if '_talk' in name:
+                file_type = 'presentation'
+            elif '_poster' in name:
+                file_type = 'poster'
+            else:
+                file_type = 'paper'
+            if not paper_info[f'{file_type}_url']:
+                paper_info[f'{file_type}_url'] = url
+                # Talks and posters are not probed; a link on the session page makes them available.
+                # Paper availability is resolved with the other sessions' papers.
+                if file_type != 'paper':
+                    paper_info[f'{file_type}_available'] = True
+
+
+LAYOUTS: Dict[str, Type[SiteLayout]] = {
+    'meow': MeowLayout,
+    'jacow': JacowClassicLayout,
+}
+
+
+def create_layout(name: str = 'meow') -> SiteLayout:
+    """
+    Create a site layout adapter by name.
+
+    Args:
+        name: 'meow' or 'jacow'
+
+    Returns:
+        SiteLayout instance
+    """
+    try:
+        return LAYOUTS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown site layout '{name}' (choose from {', '.join(LAYOUTS)})") from None
+
+
+def detect_layout(base_url: str) -> Optional[str]:
+    """Guess the layout of a proceedings URL (None if unknown)."""
+    if 'meow.elettra.eu' in base_url:
+        return 'meow'
+    if 'proceedings.jacow.org' in base_url:
+        return 'jacow'
+    return None
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run Metrics for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Lightweight instrumentation of the scraper's hot paths.
+             - Per-stage counts, latency histograms and percentiles, bytes
+               transferred and error categories (page fetches, PDF probes,
+               parsing, title extraction, downloads, saves and exports)
+             - Machine-readable '<conference>_Metrics.json' next to the final report
+             - Optional cProfile hook covering the worker threads, and listeners
+               receiving every measurement (for external tracing)
+"""
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Union
+
+import requests
+
+from transport import CircuitOpenError
+
+# Upper bounds of the latency histogram buckets in milliseconds (the last bucket is open)
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+# Latency samples kept per stage for percentiles (reservoir sampling beyond this)
+MAX_SAMPLES = 10000
+
+
+def error_category(outcome: Union[Exception, int, str, None]) -> Optional[str]:
+    """
+    Classify an error for the metrics report.
+
+    Args:
+        outcome: Exception, HTTP status code or an already assigned category
+
+    Returns:
+        Category such as 'timeout', 'connection', 'circuit_open', 'http_404' or 'io'
+    """
+    if outcome is None or isinstance(outcome, str):
+        return outcome
+    if isinstance(outcome, int):
+        return f"http_{outcome}"
+    if isinstance(outcome, CircuitOpenError):
+        return 'circuit_open'
+    if isinstance(outcome, requests.Timeout):
+        return 'timeout'
+    if isinstance(outcome, requests.HTTPError) and outcome.response is not None:
+        return f"http_{outcome.response.status_code}"
+    if isinstance(outcome, (requests.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+        return 'connection'
+    if isinstance(outcome, OSError):
+        return 'io'
+    return type(outcome).__name__
+
+
+class Span:
+    """Measurement of one timed call; the block may set bytes transferred and an error category."""
+
+    __slots__ = ('bytes', 'error')
+
+    def __init__(self):
+        self.bytes = 0
+        self.error = None
+
+
+class _StageStats:
+    """Accumulated measurements of one stage."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'bytes', 'errors', 'buckets', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.bytes = 0
+        self.errors: Dict[str, int] = {}
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.samples: List[float] = []
+
+    def add(self, seconds: float, nbytes: int, error: Optional[str]):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.bytes += nbytes
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        ms = seconds * 1000
+        index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms <= bound), len(HISTOGRAM_BOUNDS_MS))
+        self.buckets[index] += 1
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self.samples)
+
+        def percentile(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 3)
+
+        labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+        return {
+            'count': self.count,
+            'errors': sum(self.errors.values()),
+            'error_categories': dict(sorted(self.errors.items())),
+            'bytes': self.bytes,
+            'total_seconds': round(self.total, 4),
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else None,
+            'min_ms': round(self.min * 1000, 3) if self.count else None,
+            'max_ms': round(self.max * 1000, 3) if self.count else None,
+            'p50_ms': percentile(0.50),
+            'p90_ms': percentile(0.90),
+            'p99_ms': percentile(0.99),
+            'histogram_ms': {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+
+class Metrics:
+    """Thread-safe collector of per-stage timings, bytes and errors."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the collector.
+
+        Args:
+            enabled: Record measurements (a disabled collector only runs the timed blocks)
+        """
+        self.enabled = enabled
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._stages: Dict[str, _StageStats] = {}
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._profiles: List[cProfile.Profile] = []
+        self._local = threading.local()
+        self.profiling = False
+
+    def reset(self):
+        """Drop all measurements and profiles and restart the elapsed time (at the start of each run)."""
+        with self._lock:
+            self.started = time.time()
+            self._stages = {}
+            self._profiles = []
+            # Threads create a fresh profiler on their next profiled() block
+            self._local = threading.local()
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """
+        Register a tracing hook called with every measurement.
+
+        Args:
+            listener: Callable receiving {'stage', 'start', 'seconds', 'bytes', 'error', 'thread'}
+        """
+        self._listeners.append(listener)
+
+    def record(self, stage: str, seconds: float, nbytes: int = 0, error: Union[Exception, int, str, None] = None,
+               start: Optional[float] = None):
+        """
+        Record one measurement.
+
+        Args:
+            stage: Stage name (e.g. 'fetch_page')
+            seconds: Duration of the call
+            nbytes: Bytes transferred or written
+            error: Error of the call (exception, HTTP status or category), None on success
+            start: Wall-clock start time (for listeners)
+        """
+        if not self.enabled:
+            return
+        category = error_category(error)
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = _StageStats()
+            stats.add(seconds, nbytes, category)
+        if self._listeners:
+            event = {'stage': stage, 'start': start if start is not None else time.time() - seconds,
+                     'seconds': seconds, 'bytes': nbytes, 'error': category,
+                     'thread': threading.current_thread().name}
+            for listener in self._listeners:
+                listener(event)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """
+        Time the enclosed block as one call of ``stage``.
+
+        Exceptions escaping the block are recorded by category and re-raised.
+
+        Args:
+            stage: Stage name
+
+        Yields:
+            Span whose 'bytes' and 'error' the block may set
+        """
+        span = Span()
+        if not self.enabled:
+            yield span
+            return
+        start_wall = time.time()
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = span.error or error_category(e)
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - start, span.bytes, span.error, start=start_wall)
+
+    def enable_profiling(self):
+        """Collect cProfile data in every thread that enters ``profiled()``."""
+        self.profiling = True
+
+    @contextmanager
+    def profiled(self):
+        """Profile the enclosed block with this thread's profiler when profiling is enabled."""
+        if not self.profiling or getattr(self._local, 'depth', 0):
+            yield
+            return
+        profile = getattr(self._local, 'profile', None)
+        if profile is None:
+            profile = self._local.profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profile)
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active profiler per process; concurrent
+            # blocks of other threads then run unprofiled
+            yield
+            return
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.depth = 0
+
+    def write_profile(self, path: Union[str, Path], top: int = 20) -> str:
+        """
+        Merge the per-thread profiles into one pstats file.
+
+        Args:
+            path: Output .pstats file
+            top: Number of functions in the returned summary
+
+        Returns:
+            Summary of the functions with the highest cumulative time
+        """
+        with self._lock:
+            profiles = list(self._profiles)
+        if not profiles:
+            return ''
+        stream = io.StringIO()
+        stats = pstats.Stats(profiles[0], stream=stream)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(str(path))
+        stats.sort_stats('cumulative').print_stats(top)
+        return stream.getvalue()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage statistics."""
+        with self._lock:
+            return {stage: stats.to_dict() for stage, stats in sorted(self._stages.items())}
+
+    def write(self, path: Union[str, Path], extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Write the metrics file.
+
+        Args:
+            path: Output JSON file
+            extra: Additional top-level sections (e.g. run statistics, per-host budgets)
+
+        Returns:
+            The written report
+        """
+        report = {
+            'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'elapsed_seconds': round(time.time() - self.started, 3),
+            'histogram_bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'stages': self.snapshot()
+        }
+        report.update(extra or {})
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+        return report
+
+    def log_summary(self, logger: Union[logging.Logger, logging.LoggerAdapter]):
+        """Log one line per stage: count, total time, mean / p90 latency, bytes and errors."""
+        stages = self.snapshot()
+        if not stages:
+            return
+        logger.info("⏱️ Stage timings:")
+        for stage, stats in sorted(stages.items(), key=lambda item: -item[1]['total_seconds']):
+            line = (f"  {stage:<22} {stats['count']:>7} calls {stats['total_seconds']:>9.3f}s "
+                    f"mean {stats['mean_ms']:.2f}ms p90 {stats['p90_ms']:.2f}ms")
+            if stats['bytes']:
+                line += f" {stats['bytes'] / 1e6:.2f} MB"
+            if stats['errors']:
+                line += f" errors {stats['error_categories']}"
+            logger.info(line)
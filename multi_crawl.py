@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-Conference Crawler for JACoW Proceedings
+
+Author: Ming Liu
+Description: Crawls several JACoW proceedings in one run.
+             - Each conference is described by its base URL, conference name and
+               site layout ('meow' or 'jacow'), and gets its own output directory
+             - All crawls share one transport and one per-host rate limiter, so
+               conferences on different hosts are crawled concurrently while each
+               host keeps its own politeness budget
+             - A failing conference is reported without stopping the others
+
+Configuration file (JSON):
+    {
+      "requests_per_second": 2.0,
+      "max_in_flight": 4,
+      "max_retries": 3,
+      "hosts": {"proceedings.jacow.org": {"requests_per_second": 1.0, "max_in_flight": 2}},
+      "conferences": [
+        {"name": "NAPAC2025", "base_url": "https://meow.elettra.eu/97/", "layout": "meow"},
+        {"name": "SRF2023", "base_url": "https://proceedings.jacow.org/srf2023/", "layout": "jacow"}
+      ]
+    }
+
+Optional per-conference keys: output_dir, doi_prefix, max_workers.
+
+Usage:
+    python multi_crawl.py conferences.json [--test] [--incremental] [--parallel N]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+from layouts import detect_layout
+from scraper import NAPAC2025Scraper
+from transport import DEFAULT_HEADERS, HostRateLimiter, Transport, create_transport
+
+
+class ConferenceLogAdapter(logging.LoggerAdapter):
+    """Prefix log messages with the conference name so interleaved crawls stay readable."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['conference']}] {msg}", kwargs
+
+
+def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load and validate a multi-conference configuration file.
+
+    Args:
+        config_path: JSON configuration file
+
+    Returns:
+        Configuration dictionary with a 'conferences' list
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if isinstance(config, list):
+        config = {'conferences': config}
+
+    names = set()
+    for conference in config.get('conferences', []):
+        if 'name' not in conference or 'base_url' not in conference:
+            raise ValueError(f"Conference entry needs 'name' and 'base_url': {conference}")
+        if conference['name'] in names:
+            raise ValueError(f"Duplicate conference name: {conference['name']}")
+        names.add(conference['name'])
+        conference.setdefault('layout', detect_layout(conference['base_url']) or 'meow')
+    return config
+
+
+class MultiConferenceCrawler:
+    """Runs the scraper for several conferences on a shared transport and rate limiter."""
+
+    def __init__(self, conferences: List[Dict[str, Any]], requests_per_second: float = 2.0, max_in_flight: int = 4,
+                 host_limits: Optional[Dict[str, Dict[str, float]]] = None, max_parallel: Optional[int] = None,
+                 transport: Union[str, Transport] = 'requests', max_retries: int = 3, **scraper_kwargs):
+        """
+        Initialize the crawler.
+
+        Args:
+            conferences: Conference entries ('name', 'base_url', optional 'layout', 'output_dir',
+                         'doi_prefix', 'max_workers')
+            requests_per_second: Default request rate budget per host
+            max_in_flight: Default maximum concurrent requests per host
+            host_limits: Per-host overrides, host -> {'requests_per_second', 'max_in_flight'}
+            max_parallel: Number of conferences crawled at the same time (default: all)
+            transport: Transport name ('requests' or 'async') or a Transport instance shared by all crawls
+            max_retries: Retries of timeouts, connection errors and 429/5xx responses (with jittered backoff)
+            **scraper_kwargs: Further NAPAC2025Scraper arguments applied to every conference
+        """
+        self.conferences = conferences
+        self.max_parallel = max(1, max_parallel or len(conferences) or 1)
+        self.scraper_kwargs = scraper_kwargs
+        self.logger = logging.getLogger(__name__)
+
+        self.rate_limiter = HostRateLimiter(requests_per_second, max_in_flight, max_retries=max_retries)
+        pool_size = max_in_flight
+        for host, limit in (host_limits or {}).items():
+            host_in_flight = int(limit.get('max_in_flight', max_in_flight))
+            self.rate_limiter.set_host_limit(host, limit.get('requests_per_second', requests_per_second),
+                                             host_in_flight)
+            pool_size = max(pool_size, host_in_flight)
+        if isinstance(transport, Transport):
+            self.transport = transport
+        else:
+            self.transport = create_transport(transport, headers=DEFAULT_HEADERS, max_connections=pool_size)
+
+    def crawl_conference(self, conference: Dict[str, Any], run_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Discover and scrape one conference.
+
+        Args:
+            conference: Conference entry
+            run_kwargs: Arguments for NAPAC2025Scraper.run
+
+        Returns:
+            Result dictionary ('status', 'output_dir', 'elapsed' and 'scrape_info' or 'error')
+        """
+        start_time = time.time()
+        name = conference['name']
+        kwargs = dict(self.scraper_kwargs)
+        kwargs.update({key: conference[key] for key in ('output_dir', 'doi_prefix', 'max_workers') if key in conference})
+        result = {'status': 'failed', 'output_dir': conference.get('output_dir') or f"{name}_Data"}
+        try:
+            scraper = NAPAC2025Scraper(base_url=conference['base_url'], conference=name,
+                                       layout=conference.get('layout', 'meow'), transport=self.transport,
+                                       rate_limiter=self.rate_limiter,
+                                       logger=ConferenceLogAdapter(logging.getLogger('scraper'), {'conference': name}),
+                                       **kwargs)
+            if not scraper.sessions_config:
+                raise RuntimeError("no sessions found")
+            result['scrape_info'] = scraper.run(**run_kwargs)
+            result['status'] = 'completed'
+        except Exception as e:
+            self.logger.error(f"❌ {name}: crawl failed: {e}")
+            result['error'] = str(e)
+        result['elapsed'] = round(time.time() - start_time, 2)
+        return result
+
+    def run(self, **run_kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Crawl all conferences, interleaving requests across hosts.
+
+        Args:
+            **run_kwargs: Arguments for NAPAC2025Scraper.run (test_mode, incremental, resume)
+
+        Returns:
+            Conference name -> result dictionary
+        """
+        start_time = time.time()
+        self.logger.info(f"Crawling {len(self.conferences)} conferences, {self.max_parallel} at a time")
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix='conference') as executor:
+                results = dict(zip([conference['name'] for conference in self.conferences],
+                                   executor.map(lambda c: self.crawl_conference(c, run_kwargs), self.conferences)))
+        finally:
+            self.transport.close()
+
+        elapsed_time = time.time() - start_time
+        self.logger.info(f"🎉 Multi-conference crawl completed in {elapsed_time:.2f} seconds")
+        for name, result in results.items():
+            if result['status'] == 'completed':
+                info = result['scrape_info']
+                self.logger.info(f"  ✅ {name}: {info['sessions_processed']} sessions, {info['total_papers']} papers "
+                                 f"({result['elapsed']:.2f}s) -> {result['output_dir']}")
+            else:
+                self.logger.info(f"  ❌ {name}: {result.get('error')} ({result['elapsed']:.2f}s)")
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl several JACoW proceedings with a shared per-host scheduler")
+    parser.add_argument('config', type=Path, help="JSON file listing the conferences")
+    parser.add_argument('--test', action='store_true', help="Only process the first 3 sessions of each conference")
+    parser.add_argument('--incremental', action='store_true', help="Skip sessions unchanged since the last run")
+    parser.add_argument('--parallel', type=int, help="Number of conferences crawled at the same time")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('multi_crawl.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    config = load_config(args.config)
+    crawler = MultiConferenceCrawler(config['conferences'],
+                                     requests_per_second=config.get('requests_per_second', 2.0),
+                                     max_in_flight=config.get('max_in_flight', 4),
+                                     max_retries=config.get('max_retries', 3),
+                                     host_limits=config.get('hosts'),
+                                     max_parallel=args.parallel or config.get('max_parallel'))
+    results = crawler.run(test_mode=args.test, incremental=args.incremental)
+    return 0 if all(result['status'] == 'completed' for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
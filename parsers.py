@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML Parser Backends for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Small document interface used by the session and paper extractors,
+             with interchangeable backends:
+             - 'html.parser': BeautifulSoup with Python's built-in parser (no extra dependencies)
+             - 'lxml':        lxml.html tree with XPath queries (C parser, listed in requirements.txt)
+             - 'selectolax':  selectolax Lexbor engine (C parser and CSS selectors, optional)
+
+Every backend parses a page into a Node exposing the same few operations
+(find_all, find, get, classes, text, next_sibling, text_after), so the
+extractors produce identical records whichever backend is selected.
+"""
+
+from typing import Dict, List, Optional, Type
+
+from bs4 import BeautifulSoup
+
+
+class Node:
+    """Backend-neutral element interface."""
+
+    def find_all(self, tag: str, classes: Optional[List[str]] = None, attr: Optional[str] = None) -> List['Node']:
+        """
+        Find descendant elements in document order.
+
+        Args:
+            tag: Tag name
+            classes: Match elements having any of these CSS classes
+            attr: Match elements having this attribute
+
+        Returns:
+            List of matching nodes
+        """
+        raise NotImplementedError
+
+    def find(self, tag: str, classes: Optional[List[str]] = None, attr: Optional[str] = None) -> Optional['Node']:
+        """First descendant matching ``find_all`` criteria, or None."""
+        matches = self.find_all(tag, classes, attr)
+        return matches[0] if matches else None
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Attribute value."""
+        raise NotImplementedError
+
+    @property
+    def classes(self) -> List[str]:
+        """CSS classes of the element."""
+        return (self.get('class') or '').split()
+
+    def text(self) -> str:
+        """Concatenated text of the element and its descendants."""
+        raise NotImplementedError
+
+    def next_sibling(self, tag: str, cls: Optional[str] = None) -> Optional['Node']:
+        """
+        Next sibling element with the given tag (and class).
+
+        Args:
+            tag: Tag name
+            cls: Required CSS class
+
+        Returns:
+            Sibling node or None
+        """
+        raise NotImplementedError
+
+    def text_after(self, tag: str) -> Optional[str]:
+        """
+        Stripped text of the node directly following the first ``tag`` descendant.
+
+        Used for author lists where the institution follows a <br>.
+
+        Args:
+            tag: Tag name of the marker element
+
+        Returns:
+            Text of the following text node or element, or None if there is none
+        """
+        raise NotImplementedError
+
+
+class SoupNode(Node):
+    """BeautifulSoup element."""
+
+    def __init__(self, element):
+        self._el = element
+
+    def find_all(self, tag, classes=None, attr=None):
+        kwargs = {}
+        if classes:
+            kwargs['class_'] = classes
+        if attr:
+            kwargs['attrs'] = {attr: True}
+        return [SoupNode(el) for el in self._el.find_all(tag, **kwargs)]
+
+    def get(self, name, default=None):
+        value = self._el.get(name, default)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    @property
+    def classes(self):
+        return self._el.get('class', [])
+
+    def text(self):
+        return self._el.get_text()
+
+    def next_sibling(self, tag, cls=None):
+        sibling = self._el.find_next_sibling(tag, class_=cls) if cls else self._el.find_next_sibling(tag)
+        return SoupNode(sibling) if sibling else None
+
+    def text_after(self, tag):
+        marker = self._el.find(tag)
+        if not marker or not marker.next_sibling:
+            return None
+        following = marker.next_sibling
+        return following.strip() if isinstance(following, str) else following.get_text().strip()
+
+
+class LxmlNode(Node):
+    """lxml.html element."""
+
+    def __init__(self, element):
+        self._el = element
+
+    def find_all(self, tag, classes=None, attr=None):
+        conditions = []
+        if classes:
+            conditions.append(' or '.join(
+                f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes))
+        if attr:
+            conditions.append(f"@{attr}")
+        predicate = ''.join(f"[{condition}]" for condition in conditions)
+        return [LxmlNode(el) for el in self._el.xpath(f".//{tag}{predicate}")]
+
+    def get(self, name, default=None):
+        return self._el.get(name, default)
+
+    def text(self):
+        return self._el.text_content()
+
+    def next_sibling(self, tag, cls=None):
+        for sibling in self._el.itersiblings():
+            if sibling.tag == tag and (cls is None or cls in (sibling.get('class') or '').split()):
+                return LxmlNode(sibling)
+        return None
+
+    def text_after(self, tag):
+        marker = self._el.find(f".//{tag}")
+        if marker is None:
+            return None
+        # In lxml the text following an element is its tail
+        if marker.tail:
+            return marker.tail.strip()
+        following = marker.getnext()
+        return following.text_content().strip() if following is not None else None
+
+
+class SelectolaxNode(Node):
+    """selectolax (Lexbor) node."""
+
+    def __init__(self, node):
+        self._node = node
+
+    def find_all(self, tag, classes=None, attr=None):
+        if classes:
+            selector = ', '.join(f"{tag}.{cls}" for cls in classes)
+        elif attr:
+            selector = f"{tag}[{attr}]"
+        else:
+            selector = tag
+        nodes = self._node.css(selector)
+        if classes and attr:
+            nodes = [n for n in nodes if attr in n.attributes]
+        return [SelectolaxNode(n) for n in nodes]
+
+    def get(self, name, default=None):
+        value = self._node.attributes.get(name, default)
+        return default if value is None else value
+
+    def text(self):
+        return self._node.text(deep=True)
+
+    def next_sibling(self, tag, cls=None):
+        sibling = self._node.next
+        while sibling is not None:
+            if sibling.tag == tag and (cls is None or cls in (sibling.attributes.get('class') or '').split()):
+                return SelectolaxNode(sibling)
+            sibling = sibling.next
+        return None
+
+    def text_after(self, tag):
+        marker = self._node.css_first(tag)
+        if marker is None or marker.next is None:
+            return None
+        return marker.next.text(deep=True).strip()
+
+
+class ParserBackend:
+    """Base class for parser backends."""
+
+    name = 'base'
+
+    def parse(self, html: str) -> Node:
+        """
+        Parse an HTML document.
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            Root node of the document
+        """
+        raise NotImplementedError
+
+
+class HtmlParserBackend(ParserBackend):
+    """BeautifulSoup with Python's built-in html.parser."""
+
+    name = 'html.parser'
+
+    def parse(self, html):
+        return SoupNode(BeautifulSoup(html, 'html.parser'))
+
+
+class LxmlBackend(ParserBackend):
+    """lxml.html document parser."""
+
+    name = 'lxml'
+
+    def __init__(self):
+        try:
+            import lxml.html
+        except ImportError:
+            raise ImportError("The lxml parser backend requires lxml: pip install lxml")
+        self._lxml_html = lxml.html
+
+    def parse(self, html):
+        try:
+            return LxmlNode(self._lxml_html.document_fromstring(html))
+        except ValueError:
+            # lxml refuses str input carrying an XML encoding declaration
+            return LxmlNode(self._lxml_html.document_fromstring(html.encode('utf-8')))
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax Lexbor engine."""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            raise ImportError("The selectolax parser backend requires selectolax: pip install selectolax")
+        self._parser = LexborHTMLParser
+
+    def parse(self, html):
+        return SelectolaxNode(self._parser(html).root)
+
+
+PARSER_BACKENDS: Dict[str, Type[ParserBackend]] = {
+    HtmlParserBackend.name: HtmlParserBackend,
+    LxmlBackend.name: LxmlBackend,
+    SelectolaxBackend.name: SelectolaxBackend
+}
+
+
+def create_parser(name: str = 'html.parser') -> ParserBackend:
+    """
+    Create a parser backend by name.
+
+    Args:
+        name: Backend name ('html.parser', 'lxml' or 'selectolax')
+
+    Returns:
+        ParserBackend instance
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}', expected one of: {', '.join(PARSER_BACKENDS)}")
+    return PARSER_BACKENDS[name]()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-Addressed PDF Store for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Stores every downloaded file once, however many sessions list it.
+             - Blobs live under '.pdf_store/blobs/<sha[:2]>/<sha256>.pdf'
+             - 'index.json' maps each primary file name (e.g. 'TUP080.pdf', the
+               last segment of the PDF URL) to the hash, size and URL of its blob
+             - The per-session folders ('Papers/<session>/SUP012.pdf') are
+               hardlinks (or symlinks, or copies where neither is possible) of the blob
+             - Per-key locks make concurrent sessions listing the same paper wait
+               for one download instead of fetching it again
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+from urllib.parse import unquote, urlparse
+
+from download_manager import safe_filename, sha256_file
+
+LINK_MODES = ('hardlink', 'symlink', 'copy')
+
+
+def store_key(url: str) -> str:
+    """
+    Store key of a file URL: its last path segment, i.e. the primary code file name.
+
+    Args:
+        url: File URL (e.g. 'https://meow.elettra.eu/97/pdf/TUP080.pdf')
+
+    Returns:
+        Key such as 'TUP080.pdf'
+    """
+    return safe_filename(unquote(urlparse(url).path.rsplit('/', 1)[-1]))
+
+
+class PdfStore:
+    """Content-addressed blob store with per-session link views."""
+
+    def __init__(self, root: Path, link_mode: str = 'hardlink'):
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory (e.g. 'NAPAC2025_Data/.pdf_store')
+            link_mode: How session views reference blobs: 'hardlink', 'symlink' or 'copy';
+                       a mode the filesystem does not support falls back to the next one
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link_mode}' (choose from {', '.join(LINK_MODES)})")
+        self.root = Path(root)
+        self.index_path = self.root / "index.json"
+        self.link_mode = link_mode
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Keys fetched or revalidated during this crawl, and how often a view reused one
+        self.fetched = set()
+        self.stats = {'blobs_added': 0, 'views_linked': 0, 'shared_views': 0, 'bytes_saved': 0}
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('files', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.root / "blobs" / sha256[:2] / f"{sha256}.pdf"
+
+    def staging_path(self, key: str) -> Path:
+        """Download target of a key; the download manager resumes its '.part' file across runs."""
+        return self.root / "incoming" / key
+
+    def lock(self, key: str) -> threading.Lock:
+        """Lock serializing the download and linking of one key."""
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Index entry of a key whose blob is on disk with its recorded size.
+
+        Args:
+            key: Store key
+
+        Returns:
+            Entry dictionary ('sha256', 'size', 'url', 'stored'), or None
+        """
+        entry = self.entries.get(key)
+        if not entry:
+            return None
+        try:
+            if self.blob_path(entry['sha256']).stat().st_size == entry['size']:
+                return entry
+        except OSError:
+            pass
+        return None
+
+    def _record(self, key: str, url: str, sha256: str, size: int) -> Dict[str, Any]:
+        entry = {'sha256': sha256, 'size': size, 'url': url, 'stored': time.strftime('%Y-%m-%d %H:%M:%S')}
+        with self._lock:
+            self.entries[key] = entry
+        return entry
+
+    def ingest(self, key: str, url: str, path: Path, sha256: str, size: int) -> Dict[str, Any]:
+        """
+        Move a verified download into the store.
+
+        Args:
+            key: Store key
+            url: File URL
+            path: Downloaded file (moved away, or deleted if the blob already exists)
+            sha256: SHA-256 of the file
+            size: File size
+
+        Returns:
+            The new index entry
+        """
+        blob = self.blob_path(sha256)
+        if blob.exists():
+            Path(path).unlink(missing_ok=True)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, blob)
+            with self._lock:
+                self.stats['blobs_added'] += 1
+        return self._record(key, url, sha256, size)
+
+    def adopt(self, key: str, url: str, path: Path, sha256: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a file that is already in a session folder (e.g. from a run before the store existed).
+
+        The blob becomes a hardlink of the file where possible, so adopting costs no space.
+
+        Args:
+            key: Store key
+            url: File URL
+            path: Existing file
+            sha256: Known SHA-256 of the file (hashed if None)
+
+        Returns:
+            The new index entry
+        """
+        path = Path(path)
+        sha256 = sha256 or sha256_file(path)
+        blob = self.blob_path(sha256)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path.resolve(), blob)
+            except OSError:
+                shutil.copy2(path, blob)
+        return self._record(key, url, sha256, blob.stat().st_size)
+
+    def link(self, entry: Dict[str, Any], view: Path) -> str:
+        """
+        Point a session view at a blob, replacing whatever is at the view path.
+
+        Args:
+            entry: Index entry of the blob
+            view: Path in the session folder
+
+        Returns:
+            Link mode used ('hardlink', 'symlink', 'copy' or 'existing' if already linked)
+        """
+        blob = self.blob_path(entry['sha256'])
+        view = Path(view)
+        try:
+            if view.exists() and os.path.samefile(view, blob):
+                return 'existing'
+        except OSError:
+            pass
+        view.parent.mkdir(parents=True, exist_ok=True)
+        tmp_view = view.with_name(view.name + '.link')
+        tmp_view.unlink(missing_ok=True)
+        for mode in LINK_MODES[LINK_MODES.index(self.link_mode):]:
+            try:
+                if mode == 'hardlink':
+                    os.link(blob, tmp_view)
+                elif mode == 'symlink':
+                    os.symlink(os.path.relpath(blob, view.parent), tmp_view)
+                else:
+                    shutil.copy2(blob, tmp_view)
+                break
+            except OSError:
+                tmp_view.unlink(missing_ok=True)
+                if mode == 'copy':
+                    raise
+        os.replace(tmp_view, view)
+        with self._lock:
+            self.stats['views_linked'] += 1
+        return mode
+
+    def mark_fetched(self, key: str, shared: bool = False):
+        """
+        Note that a key is up to date for the rest of the crawl.
+
+        Args:
+            key: Store key
+            shared: The view reused a blob another session fetched during this crawl
+        """
+        with self._lock:
+            if shared:
+                self.stats['shared_views'] += 1
+                self.stats['bytes_saved'] += self.entries.get(key, {}).get('size', 0)
+            self.fetched.add(key)
+
+    def prune(self) -> int:
+        """
+        Delete blobs no index entry refers to (superseded versions of updated files).
+
+        Hardlinked and copied views keep their data; with symlinked views nothing is
+        pruned, since a view of a session skipped by an incremental run may still
+        point at an old blob.
+
+        Returns:
+            Number of deleted blobs
+        """
+        blobs_dir = self.root / "blobs"
+        if self.link_mode == 'symlink' or not blobs_dir.exists():
+            return 0
+        with self._lock:
+            referenced = {entry['sha256'] for entry in self.entries.values()}
+        removed = 0
+        for blob in blobs_dir.glob('*/*.pdf'):
+            if blob.stem not in referenced:
+                blob.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def save(self):
+        with self._lock:
+            data = json.dumps({'updated': time.strftime('%Y-%m-%d %H:%M:%S'), 'files': self.entries},
+                              ensure_ascii=False, indent=2, sort_keys=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.index_path)
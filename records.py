@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Typed Records and Serializers for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Compact record model and pluggable JSON serializers.
+             - Paper and Session records with __slots__ (no per-record dict) that
+               still read and write like dictionaries (paper['title'], paper.get(...),
+               dict(paper)), so exporters accept records and plain dicts alike
+             - Author and institution strings are interned: a lab listed on
+               hundreds of papers is stored once
+             - SCHEMA_VERSION tags the record layout in the index, session files,
+               journal and incremental state
+             - Serializers: 'json' (standard library, default), 'orjson' and
+               'msgspec' (optional compiled encoders); all write the same JSON documents
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+# Version of the paper/session record layout; bump when a field is added, renamed or retyped.
+# Files written before the version was recorded have the version 1 layout.
+SCHEMA_VERSION = 1
+
+PAPER_FIELDS = ('paper_id', 'title', 'authors', 'institutions', 'abstract', 'presentation_url', 'paper_url',
+                'poster_url', 'doi', 'page_number', 'presentation_available', 'paper_available', 'poster_available')
+SESSION_FIELDS = ('id', 'name', 'url')
+
+
+def intern_text(text: str) -> str:
+    """Intern a repeated string (author or institution name)."""
+    return sys.intern(text) if type(text) is str else text
+
+
+class Record(Mapping):
+    """Base class of slotted records with a read/write mapping interface over their fields."""
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    _FIELD_SET = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._FIELD_SET:
+            raise KeyError(f"{type(self).__name__} has no field '{key}'")
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS)})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary of the fields, in field order."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'Record':
+        """
+        Build a record from a dictionary, ignoring unknown keys.
+
+        Args:
+            data: Record dictionary (e.g. read back from JSON)
+
+        Returns:
+            Record instance (``data`` itself if it already is one)
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(**{name: data[name] for name in cls.FIELDS if name in data})
+
+
+class Session(Record):
+    """Session of the proceedings: ID (e.g. 'MOP'), display name and page URL."""
+
+    __slots__ = SESSION_FIELDS
+    FIELDS = SESSION_FIELDS
+    _FIELD_SET = frozenset(SESSION_FIELDS)
+
+    def __init__(self, id: str, name: str, url: str):
+        self.id = id
+        self.name = name
+        self.url = url
+
+
+class Paper(Record):
+    """Paper record: metadata, file URLs and their availability."""
+
+    __slots__ = PAPER_FIELDS
+    FIELDS = PAPER_FIELDS
+    _FIELD_SET = frozenset(PAPER_FIELDS)
+
+    def __init__(self, paper_id: str, title: str, authors: Optional[Iterable[str]] = None,
+                 institutions: Optional[Iterable[str]] = None, abstract: str = '', presentation_url: str = '',
+                 paper_url: str = '', poster_url: str = '', doi: str = '', page_number: str = '',
+                 presentation_available: bool = False, paper_available: bool = False, poster_available: bool = False):
+        self.paper_id = paper_id
+        self.title = title
+        self.authors: List[str] = [intern_text(name) for name in authors] if authors else []
+        self.institutions: List[str] = [intern_text(name) for name in institutions] if institutions else []
+        self.abstract = abstract
+        self.presentation_url = presentation_url
+        self.paper_url = paper_url
+        self.poster_url = poster_url
+        self.doi = doi
+        self.page_number = page_number
+        self.presentation_available = presentation_available
+        self.paper_available = paper_available
+        self.poster_available = poster_available
+
+    def add_author(self, name: str):
+        """Append an author name (interned)."""
+        self.authors.append(intern_text(name))
+
+    def add_institution(self, name: str):
+        """Append an institution (interned) unless the paper already lists it."""
+        if name not in self.institutions:
+            self.institutions.append(intern_text(name))
+
+
+def _encode_record(obj: Any) -> Any:
+    """Fallback encoder turning records into dictionaries."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Serializer:
+    """Base class of JSON serializers."""
+
+    name = 'base'
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        """
+        Serialize an object (records included) to a JSON document.
+
+        Single-line output has no spaces after separators, so every serializer
+        writes the same bytes for the same object.
+
+        Args:
+            obj: Object to serialize
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            JSON text (non-ASCII characters are written as-is)
+        """
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document."""
+        raise NotImplementedError
+
+
+class JsonSerializer(Serializer):
+    """Python's built-in json module."""
+
+    name = 'json'
+
+    def dumps(self, obj, indent=False):
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None,
+                          separators=None if indent else (',', ':'), default=_encode_record)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """orjson (Rust JSON library)."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError("The orjson serializer requires orjson: pip install orjson")
+        self._orjson = orjson
+
+    def dumps(self, obj, indent=False):
+        option = self._orjson.OPT_INDENT_2 if indent else 0
+        return self._orjson.dumps(obj, default=_encode_record, option=option).decode('utf-8')
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class MsgspecSerializer(Serializer):
+    """msgspec JSON encoder and decoder."""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("The msgspec serializer requires msgspec: pip install msgspec")
+        self._format = msgspec.json.format
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_record)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj, indent=False):
+        data = self._encoder.encode(obj)
+        if indent:
+            data = self._format(data, indent=2)
+        return data.decode('utf-8')
+
+    def loads(self, data):
+        return self._decoder.decode(data)
+
+
+SERIALIZERS: Dict[str, Type[Serializer]] = {
+    JsonSerializer.name: JsonSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+    MsgspecSerializer.name: MsgspecSerializer
+}
+
+
+def create_serializer(name: Union[str, Serializer, None] = 'json') -> Serializer:
+    """
+    Create a serializer by name.
+
+    Args:
+        name: Serializer name ('json', 'orjson' or 'msgspec'), a Serializer instance or None for 'json'
+
+    Returns:
+        Serializer instance
+    """
+    if isinstance(name, Serializer):
+        return name
+    name = name or 'json'
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{name}', expected one of: {', '.join(SERIALIZERS)}")
+    return SERIALIZERS[name]()
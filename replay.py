@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Record / Replay Transports for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Network-free runs driven by a recorded response archive.
+             - RecordingTransport wraps a live transport and stores every response
+               (status, headers, body) in a zip archive
+             - ReplayTransport serves every request from such an archive, so a run
+               needs no network access and is fully deterministic
+
+Archive layout: one '<sha256(method url)>.json' metadata entry per request plus a
+'<sha256(method url)>.body' entry with the response body. HTML is deflated; PDF
+bodies are stored as-is and are only recorded when requested (include_pdfs).
+Retryable responses (429, 5xx) are not recorded, so a transient error is never
+archived in place of the successful retry. Re-recording a request replaces its
+entries: the last response wins.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import warnings
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+import requests
+
+from transport import RETRYABLE_STATUS, HostRateLimiter, RequestSpec, Transport, TransportResponse
+
+# Request headers stripped while recording so the archive always holds complete responses
+CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since', 'range', 'if-range')
+# Response headers describing the wire encoding; recorded bodies are already decoded
+WIRE_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+
+
+def entry_name(method: str, url: str) -> str:
+    """Archive entry stem of a request."""
+    return hashlib.sha256(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+
+class RecordingTransport(Transport):
+    """Transport wrapper that records every response into a zip archive."""
+
+    name = 'record'
+
+    def __init__(self, inner: Transport, archive_path: Union[str, Path], include_pdfs: bool = False):
+        """
+        Initialize the recorder.
+
+        Args:
+            inner: Live transport performing the requests
+            archive_path: Zip archive to write (updated in place if it exists)
+            include_pdfs: Also record PDF bodies (large); otherwise PDF downloads are not archived
+        """
+        self.inner = inner
+        self.archive_path = Path(archive_path)
+        self.include_pdfs = include_pdfs
+        self._lock = threading.Lock()
+        self._zip = None
+        self._recorded = set()
+        # Set when an entry was written again; flush() then drops the superseded copies
+        self._superseded = False
+
+    def _open(self) -> zipfile.ZipFile:
+        if self._zip is None:
+            self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip = zipfile.ZipFile(self.archive_path, 'a', compression=zipfile.ZIP_DEFLATED)
+            self._recorded = set(self._zip.namelist())
+        return self._zip
+
+    def _record(self, method: str, url: str, response, body: Optional[bytes]):
+        if response.status_code in RETRYABLE_STATUS:
+            # Transient failure; the rate limiter retries and the final response is recorded
+            return
+        stem = entry_name(method, url)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in WIRE_HEADERS}
+        if body is not None:
+            headers['Content-Length'] = str(len(body))
+        elif 'content-length' in response.headers:
+            headers['Content-Length'] = response.headers['content-length']
+        meta = {
+            'method': method.upper(),
+            'url': url,
+            'status_code': response.status_code,
+            'headers': headers,
+            'encoding': response.encoding if body is not None else None,
+            'has_body': body is not None
+        }
+        is_pdf = 'pdf' in headers.get('Content-Type', headers.get('content-type', '')).lower()
+        with self._lock:
+            archive = self._open()
+            if f"{stem}.json" in self._recorded:
+                # zipfile cannot replace entries: the newer copy is appended (readers use the
+                # last entry of a name) and the old one is dropped when the archive is flushed
+                self._superseded = True
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', message='Duplicate name', category=UserWarning)
+                if body is not None:
+                    archive.writestr(f"{stem}.body", body,
+                                     compress_type=zipfile.ZIP_STORED if is_pdf else zipfile.ZIP_DEFLATED)
+                archive.writestr(f"{stem}.json", json.dumps(meta, ensure_ascii=False))
+            self._recorded.add(f"{stem}.json")
+
+    def _compact(self):
+        """Rewrite the archive with only the last entry of every name."""
+        tmp_path = self.archive_path.with_name(self.archive_path.name + '.tmp')
+        with zipfile.ZipFile(self.archive_path, 'r') as source:
+            latest = {info.filename: info for info in source.infolist()}
+            with zipfile.ZipFile(tmp_path, 'w') as target:
+                for info in latest.values():
+                    target.writestr(info, source.read(info))
+        os.replace(tmp_path, self.archive_path)
+
+    def _is_pdf_download(self, method: str, url: str, stream: bool) -> bool:
+        return method.upper() == 'GET' and (stream or url.lower().endswith('.pdf'))
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30, stream: bool = False):
+        if headers:
+            headers = {k: v for k, v in headers.items() if k.lower() not in CONDITIONAL_HEADERS} or None
+        response = self.inner.request(method, url, headers=headers, timeout=timeout, stream=stream)
+
+        if method.upper() == 'HEAD':
+            self._record(method, url, response, None)
+            return response
+        if self._is_pdf_download(method, url, stream) and not self.include_pdfs:
+            return response
+
+        # Buffer the body so it can be both archived and returned
+        body = response.content
+        self._record(method, url, response, body)
+        if not stream:
+            return response
+        return TransportResponse(response.status_code, dict(response.headers), body, url,
+                                 encoding=response.encoding)
+
+    def request_many(self, specs: List[RequestSpec],
+                     limiter: Optional[HostRateLimiter] = None) -> List[Union[Any, Exception]]:
+        results = self.inner.request_many(specs, limiter=limiter)
+        for (method, url, kwargs), result in zip(specs, results):
+            if isinstance(result, Exception):
+                continue
+            body = None if method.upper() == 'HEAD' or kwargs.get('stream') else result.content
+            self._record(method, url, result, body)
+        return results
+
+    def flush(self):
+        """Finalize the archive so it is readable; recording continues in a new append session."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+            if self._superseded:
+                self._compact()
+                self._superseded = False
+
+    def close(self):
+        self.flush()
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """Transport serving every request from a recorded archive."""
+
+    name = 'replay'
+
+    def __init__(self, archive_path: Union[str, Path]):
+        """
+        Initialize the replayer.
+
+        Args:
+            archive_path: Zip archive written by RecordingTransport
+        """
+        self.archive_path = Path(archive_path)
+        if not self.archive_path.exists():
+            raise FileNotFoundError(f"Replay archive not found: {self.archive_path}")
+        self._zip = zipfile.ZipFile(self.archive_path, 'r')
+        self._names = set(self._zip.namelist())
+        self._lock = threading.Lock()
+        self.max_connections = 1
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30, stream: bool = False) -> TransportResponse:
+        stem = entry_name(method, url)
+        if f"{stem}.json" not in self._names:
+            # Not recorded (e.g. a PDF in an archive recorded without PDFs): behave like a missing file
+            return TransportResponse(404, {'Content-Type': 'text/plain', 'X-Replay': 'missing'},
+                                     b'Not in replay archive', url)
+        with self._lock:
+            meta = json.loads(self._zip.read(f"{stem}.json"))
+            body = self._zip.read(f"{stem}.body") if meta['has_body'] else b''
+        return TransportResponse(meta['status_code'], meta['headers'], body, url, encoding=meta.get('encoding'))
+
+    def request_many(self, specs: List[RequestSpec],
+                     limiter: Optional[HostRateLimiter] = None) -> List[Union[TransportResponse, Exception]]:
+        results = []
+        for method, url, kwargs in specs:
+            try:
+                results.append(self.request(method, url, **kwargs))
+            except requests.RequestException as e:
+                results.append(e)
+        return results
+
+    def close(self):
+        self._zip.close()
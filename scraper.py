@@ -15,121 +15,287 @@ Features:
 - PDF download with validation
 - Multi-format data export
 - Robust error handling and retry mechanisms
+- Concurrent session processing with a per-host politeness budget
 - Comprehensive logging
+- Non-interactive command line: discover, scrape, download, export, analyze
 """
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
 import os
+import csv
+import gzip
 import json
 import time
+import hashlib
 import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Union
 import logging
 from pathlib import Path
 
+from analyze_results import analyze, iter_sessions as iter_saved_sessions, print_report, write_summary_csv
+from author_index import build_author_index
+from catalogue import build_catalogue
+from crawl_journal import CrawlJournal
+from data_bundle import build_data_bundle
+from export import (OUTPUT_PROFILES, SESSION_CSV_FIELDS, BackgroundWriter, StreamingExporter, csv_row,
+                    default_columnar_formats, output_profile as get_output_profile)
+from fulltext import update_fulltext_index
+from download_manager import DownloadManager, DownloadManifest, download_path, safe_filename
+from http_cache import HTTPCache
+from layouts import SiteLayout, create_layout
+from metrics import Metrics, error_category
+from parsers import PARSER_BACKENDS, Node, ParserBackend, create_parser
+from pdf_store import PdfStore, store_key
+from records import SCHEMA_VERSION, Paper, Serializer, Session, create_serializer
+from replay import RecordingTransport, ReplayTransport
+from transport import DEFAULT_HEADERS, HostRateLimiter, Transport, TransportResponse, create_transport
+
+
+def ordered_map(executor: Executor, fn: Callable, items: Iterable[Any], window: int) -> Iterator[Any]:
+    """
+    Like ``executor.map``, but with at most ``window`` items submitted ahead of the result
+    being yielded, so results finished early wait for a slow item in bounded numbers.
+    
+    Args:
+        executor: Executor running ``fn``
+        fn: Callable taking one item
+        items: Items, consumed as the window moves on
+        window: Maximum number of submitted but not yet yielded items
+        
+    Yields:
+        Results in item order
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Items not started yet are dropped when a result raises (e.g. an interrupted run)
+        for future in pending:
+            future.cancel()
+
+
 class NAPAC2025Scraper:
     """
     Web scraper for NAPAC2025 proceedings hosted at meow.elettra.eu/97.
 
     This scraper extracts paper information from the NAPAC2025 website by reading
     the session index and parsing individual session pages. It reuses the existing
-    download and export logic from the original SRF scraper.
+    download and export logic from the original SRF scraper. Other JACoW proceedings
+    are scraped by passing their base URL, conference name and site layout.
     """
 
-    def __init__(self, base_url: str = "https://meow.elettra.eu/97/", output_dir: str = "NAPAC2025_Data"):
+    def __init__(self, base_url: str = "https://meow.elettra.eu/97/", output_dir: Optional[str] = None,
+                 max_workers: int = 1, requests_per_second: float = 2.0, max_in_flight: int = 4,
+                 transport: Union[str, Transport] = 'requests', use_http_cache: bool = True,
+                 cache_max_mb: float = 100, cache_max_entries: Optional[int] = None, download_workers: int = 4,
+                 parser: Union[str, ParserBackend] = 'html.parser', record_archive: Optional[str] = None,
+                 record_pdfs: bool = False, replay_archive: Optional[str] = None, pretty_index: bool = True,
+                 columnar_formats: Optional[Sequence[str]] = None, sqlite_catalogue: Optional[bool] = None,
+                 data_bundle: Optional[bool] = None, conference: str = "NAPAC2025", layout: Union[str, SiteLayout] = 'meow',
+                 doi_prefix: Optional[str] = None, rate_limiter: Optional[HostRateLimiter] = None,
+                 logger: Optional[Union[logging.Logger, logging.LoggerAdapter]] = None, max_retries: int = 3,
+                 collect_metrics: bool = True, profile: bool = False, output_profile: str = 'standard',
+                 debug_artifacts: Optional[bool] = None, async_writes: bool = True, fulltext_index: bool = False,
+                 fulltext_workers: Optional[int] = None, pdf_store: bool = False, link_mode: str = 'hardlink',
+                 serializer: Union[str, Serializer] = 'json', author_index: Optional[bool] = None):
         """
         Initialize the SRF2021 scraper.
         
         Args:
             base_url: Base URL of the SRF2021 conference website
-            output_dir: Directory to store scraped data and PDFs
+            output_dir: Directory to store scraped data and PDFs (default '<conference>_Data')
+            max_workers: Number of sessions processed in parallel (1 = serial mode)
+            requests_per_second: Per-host request rate budget
+            max_in_flight: Maximum concurrent requests per host
+            transport: Transport name ('requests' or 'async') or a Transport instance
+            use_http_cache: Revalidate pages and PDFs with conditional GETs (ETag/Last-Modified)
+            cache_max_mb: Maximum size of the on-disk HTTP cache in megabytes
+            cache_max_entries: Maximum number of cached URLs (None = unlimited)
+            download_workers: Number of concurrent file downloads
+            parser: HTML parser backend name ('html.parser', 'lxml' or 'selectolax') or a ParserBackend instance
+            record_archive: Record every HTTP response of the run into this zip archive
+            record_pdfs: Also record PDF bodies into the archive
+            replay_archive: Serve every request from this recorded archive instead of the network
+            pretty_index: Write the pretty-printed <conference>_Complete_Index.json at the end of a run
+            columnar_formats: Typed columnar copies of the catalogue to write ('parquet', 'arrow'); needs pyarrow
+                              (default: 'parquet' if pyarrow is installed)
+            sqlite_catalogue: Build the <conference>_Catalogue.sqlite database with a full-text index
+                              (default: as the output profile says)
+            data_bundle: Write the sharded data bundle for the data explorer to 'data_bundle/'
+                         (default: as the output profile says)
+            conference: Conference name used for output file names and DOIs (e.g. 'SRF2023')
+            layout: Site layout name ('meow' or 'jacow') or a SiteLayout instance
+            doi_prefix: DOI prefix of the paper IDs (default '10.18429/JACoW-<conference>-')
+            rate_limiter: Shared per-host rate limiter (e.g. of a multi-conference crawl)
+            logger: Logger to use instead of the module logger
+            max_retries: Retries of timeouts, connection errors and 429/5xx responses (with jittered backoff)
+            collect_metrics: Write per-stage timings, bytes and errors to <conference>_Metrics.json
+            profile: Profile the run with cProfile (all worker threads) into <conference>_Profile.pstats
+            output_profile: Per-session outputs: 'minimal' (master files only), 'standard' (plus
+                            papers_data.json per session) or 'full' (plus CSV / TXT per session,
+                            debug artifacts, the SQLite catalogue, the author index
+                            and the data bundle)
+            debug_artifacts: Write gzip-compressed raw session pages and page text to Debug/
+                             (default: as the output profile says)
+            async_writes: Serialize session files, master files and journal records on a background
+                          writer thread instead of the crawl workers
+            fulltext_index: After downloading, extract the text of new and changed PDFs into the
+                            <conference>_Fulltext.sqlite search index (needs pypdf)
+            fulltext_workers: Text extraction processes (default: one per CPU core)
+            pdf_store: Keep each file once in the content-addressed '.pdf_store/' and link it into
+                       the session folders, so papers listed by several sessions are fetched once
+                       (False: one download per session folder)
+            link_mode: How session folders reference stored files: 'hardlink', 'symlink' or 'copy'
+            serializer: JSON serializer of all exports and state files ('json', 'orjson' or 'msgspec')
+                        or a Serializer instance
+            author_index: Write <conference>_Author_Index.json (normalized author and institution
+                          IDs, their papers and co-author links; default: as the output profile says)
         """
         self.base_url = base_url
-        self.output_dir = Path(output_dir)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
-        
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('napac2025_scraper.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-        
-        # NAPAC2025 session configuration - will be populated dynamically
-        self.sessions_config = []
-        
-        # Initialize directories and statistics
-        self.create_directories()
-        self.stats = {'total_papers': 0, 'downloaded_presentations': 0, 'downloaded_papers': 0, 'downloaded_posters': 0, 'errors': 0, 'sessions_processed': 0}
+        self.conference = conference
+        self.metrics = Metrics(enabled=collect_metrics)
+        if profile:
+            self.metrics.enable_profiling()
+        self.layout = layout if isinstance(layout, SiteLayout) else create_layout(layout)
+        self.serializer = create_serializer(serializer)
+        profile_settings = get_output_profile(output_profile)
+        self.output_profile = output_profile
+        self.session_files = profile_settings['session_files']
+        self.debug_artifacts = profile_settings['debug_artifacts'] if debug_artifacts is None else debug_artifacts
+        self.doi_prefix = doi_prefix or f"10.18429/JACoW-{conference}-"
+        self.output_dir = Path(output_dir or f"{conference}_Data")
+        self.max_workers = max(1, max_workers)
+        # The transport (and its connection pool) is created on the first request, so
+        # commands that stay offline (export, analyze) open no network session
+        self._transport: Optional[Transport] = None
+        self._download_manager: Optional[DownloadManager] = None
+        self._lazy_lock = threading.RLock()
+        if replay_archive:
+            # Replayed responses come from disk; no politeness pacing needed
+            self.rate_limiter = HostRateLimiter(0, max_in_flight)
+            self._create_transport = lambda: ReplayTransport(replay_archive)
+        else:
+            self.rate_limiter = rate_limiter or HostRateLimiter(requests_per_second, max_in_flight,
+                                                                max_retries=max_retries)
 
-        # Load sessions dynamically
-        self.load_sessions()
-    
-    def load_sessions(self):
-        """Load session configuration from the NAPAC2025 website."""
-        try:
-            # NAPAC2025 uses dynamic loading: the actual session list is in html/session_list.html
-            # with links stored in data-href attributes (e.g., 'session/1161-mowp/index.html')
-            resp = self.session.get(urljoin(self.base_url, 'html/session_list.html'), timeout=30)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, 'html.parser')
-
-            sessions = []
-            # Find all anchors with data-href attribute
-            anchors = soup.find_all('a', attrs={'data-href': True})
-            
-            for a in anchors:
-                data_href = a.get('data-href')
-                if not data_href:
-                    continue
-
-                # Only process session links (e.g., 'session/1161-mowp/index.html')
-                if not data_href.startswith('session/'):
-                    continue
-
-                # Build full URL
-                full_url = urljoin(self.base_url, data_href)
-                
-                # Extract session ID from path segment like '1161-mowp'
-                parts = data_href.split('/')
-                if len(parts) >= 2:
-                    seg = parts[1]  # e.g., '1161-mowp'
-                    if '-' in seg:
-                        code = seg.split('-', 1)[1].upper()  # 'mowp' -> 'MOWP'
-                    else:
-                        code = seg.upper()
+            def create_network_transport() -> Transport:
+                if isinstance(transport, Transport):
+                    network = transport
                 else:
-                    # Fallback: use first word from link text
-                    text = a.get_text().strip()
-                    code = text.split()[0].upper() if text else 'UNKNOWN'
+                    network = create_transport(transport, headers=DEFAULT_HEADERS,
+                                               max_connections=max(self.max_workers, max_in_flight))
+                if record_archive:
+                    network = RecordingTransport(network, record_archive, include_pdfs=record_pdfs)
+                return network
+            self._create_transport = create_network_transport
+        self.parser = parser if isinstance(parser, ParserBackend) else create_parser(parser)
+        self.http_cache = None
+        if use_http_cache:
+            self.http_cache = HTTPCache(self.output_dir / ".http_cache", max_bytes=int(cache_max_mb * 1024 * 1024),
+                                        max_entries=cache_max_entries)
+        
+        self.logger = logger or logging.getLogger(__name__)
+        
+        # Session configuration - loaded from the site's session list on first use
+        self._sessions_config: Optional[List[Session]] = None
+        
+        # Statistics (directories are created when a run starts)
+        self.stats = {'total_papers': 0, 'downloaded_presentations': 0, 'downloaded_papers': 0, 'downloaded_posters': 0, 'errors': 0, 'sessions_processed': 0}
+        self._stats_lock = threading.Lock()
 
-                # Get full session name from link text
-                name = a.get_text().strip()
-                if not name:
-                    name = code
+        # PDF URLs linked directly from session pages (collected while parsing)
+        self.linked_pdf_urls = set()
+        self.pdf_manifest_file = self.output_dir / "pdf_availability.json"
+        # Availability manifest and probe results of the current run (URLs only, shared by all sessions)
+        self._pdf_lock = threading.Lock()
+        self._pdf_manifest: Optional[Dict[str, Any]] = None
+        self._probed_pdfs: Dict[str, bool] = {}
 
-                sessions.append({
-                    'id': code,
-                    'name': name,
-                    'url': full_url
-                })
+        # Incremental re-scrape state: content hashes of session pages and paper records
+        self.state_file = self.output_dir / "incremental_state.json"
+        self.incremental = False
+        self.previous_state = {}
+        self.session_hashes = {}
+        self.unchanged_sessions = set()
+        # Sessions that failed this run; their saved state is kept, not reported as removed
+        self.failed_sessions = set()
 
-            self.sessions_config = sessions
-            self.logger.info(f"Loaded {len(self.sessions_config)} sessions from NAPAC2025 website")
+        # Crawl journal for resuming interrupted runs
+        self.journal = CrawlJournal(self.output_dir / "crawl_journal.jsonl", self.serializer)
+        self.resumed_sessions = {}
+        self.completed_files = set()
+
+        # Concurrent, verified downloads with a SHA-256 manifest
+        self.download_manifest = DownloadManifest(self.output_dir / "download_manifest.json", self.output_dir)
+        self.download_workers = download_workers
+        # Content-addressed store: one blob per file, hardlinked into every session listing it
+        self.pdf_store = PdfStore(self.output_dir / ".pdf_store", link_mode) if pdf_store else None
+
+        # Master files are appended to as sessions are processed, so only the sessions in
+        # flight are held in memory; all output files are written by one background thread
+        # so the crawl workers only fetch and parse
+        self.exporter = StreamingExporter(self.output_dir, self.logger, conference=conference,
+                                          serializer=self.serializer)
+        self.writer = BackgroundWriter(self.logger, enabled=async_writes,
+                                       on_error=lambda e: self._increment_stat('errors'),
+                                       job_context=self.metrics.profiled)
+        self.pretty_index = pretty_index
+        self.columnar_formats = default_columnar_formats() if columnar_formats is None else tuple(columnar_formats)
+        self.sqlite_catalogue = profile_settings['sqlite_catalogue'] if sqlite_catalogue is None else sqlite_catalogue
+        self.data_bundle = profile_settings['data_bundle'] if data_bundle is None else data_bundle
+        self.author_index = profile_settings['author_index'] if author_index is None else author_index
+        self.fulltext_index = fulltext_index
+        self.fulltext_workers = fulltext_workers
+    
+    @property
+    def transport(self) -> Transport:
+        """HTTP transport, created on first use."""
+        if self._transport is None:
+            with self._lazy_lock:
+                if self._transport is None:
+                    self._transport = self._create_transport()
+        return self._transport
+    
+    @property
+    def download_manager(self) -> DownloadManager:
+        """Download pool, created on first use (with the transport)."""
+        if self._download_manager is None:
+            with self._lazy_lock:
+                if self._download_manager is None:
+                    self._download_manager = DownloadManager(self.transport, self.rate_limiter, self.download_manifest,
+                                                             self.logger, workers=self.download_workers)
+        return self._download_manager
+    
+    @property
+    def sessions_config(self) -> List[Session]:
+        """Sessions of the proceedings, fetched from the session list page on first use."""
+        if self._sessions_config is None:
+            self.load_sessions()
+        return self._sessions_config
+    
+    @sessions_config.setter
+    def sessions_config(self, sessions: List[Session]):
+        self._sessions_config = sessions
+    
+    def load_sessions(self):
+        """Load the session configuration from the proceedings' session list page."""
+        try:
+            resp = self.fetch_page(self.layout.session_list_url(self.base_url), timeout=30)
+            doc = self.parser.parse(resp.text)
+            self.sessions_config = self.layout.parse_session_list(doc, self.base_url)
+            self.logger.info(f"Loaded {len(self.sessions_config)} sessions from {self.conference} website "
+                             f"({self.layout.name} layout)")
 
         except Exception as e:
             self.logger.error(f"Failed to load sessions: {e}")
@@ -141,9 +307,82 @@ class NAPAC2025Scraper:
         (self.output_dir / "Presentations").mkdir(exist_ok=True)
         (self.output_dir / "Papers").mkdir(exist_ok=True)
         (self.output_dir / "Posters").mkdir(exist_ok=True)
-        (self.output_dir / "Sessions").mkdir(exist_ok=True)
-        (self.output_dir / "Debug").mkdir(exist_ok=True)
+        if self.session_files:
+            (self.output_dir / "Sessions").mkdir(exist_ok=True)
+        if self.debug_artifacts:
+            (self.output_dir / "Debug").mkdir(exist_ok=True)
         self.logger.info(f"Created output directory: {self.output_dir}")
+
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Thread-safe increment of a statistics counter."""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Issue an HTTP request within the per-host politeness budget, retrying retryable errors.
+
+        Args:
+            method: HTTP method ('GET', 'HEAD', ...)
+            url: URL to request
+            **kwargs: Extra arguments passed to Transport.request
+
+        Returns:
+            Response object from the active transport
+        """
+        return self.rate_limiter.request(self.transport, method, url, **kwargs)
+
+    def _request_many(self, method: str, urls: List[str], **kwargs) -> List[Any]:
+        """
+        Issue a batch of requests concurrently within the per-host politeness budget.
+
+        Args:
+            method: HTTP method ('GET', 'HEAD', ...)
+            urls: URLs to request
+            **kwargs: Extra arguments passed to Transport.request
+
+        Returns:
+            List of responses or exceptions, in the same order as ``urls``
+        """
+        return self.transport.request_many([(method, url, kwargs) for url in urls], limiter=self.rate_limiter)
+    
+    def fetch_page(self, url: str, timeout: float = 30):
+        """
+        GET a page, revalidating against the HTTP cache when possible.
+        
+        Sends If-None-Match/If-Modified-Since for cached URLs and serves the stored
+        body on a 304 Not Modified response.
+        
+        Args:
+            url: URL to fetch
+            timeout: Timeout in seconds
+            
+        Returns:
+            Response object with the page body
+            
+        Raises:
+            requests.RequestException: On network errors or HTTP error status
+        """
+        if not self.http_cache:
+            response = self._request('GET', url, timeout=timeout)
+            response.raise_for_status()
+            return response
+        
+        headers = self.http_cache.conditional_headers(url)
+        response = self._request('GET', url, headers=headers or None, timeout=timeout)
+        if response.status_code == 304:
+            body = self.http_cache.body(url)
+            if body is not None:
+                meta = self.http_cache.lookup(url)
+                self.logger.info(f"Not modified, using cached copy: {url}")
+                return TransportResponse(200, {'content-type': meta.get('content_type', '')}, body, url,
+                                         encoding=meta.get('encoding'))
+            # Cached body disappeared between lookup and revalidation; fetch unconditionally
+            response = self._request('GET', url, timeout=timeout)
+        
+        response.raise_for_status()
+        self.http_cache.store(url, response.headers, response.content, encoding=response.encoding)
+        return response
     
     def safe_filename(self, filename: str, max_length: int = 180) -> str:
         """
@@ -156,67 +395,193 @@ class NAPAC2025Scraper:
         Returns:
             Safe filename string
         """
-        if not filename:
-            return "unknown"
-        
-        # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*\r\n]', '_', filename)
-        filename = re.sub(r'\s+', ' ', filename)
-        filename = filename.strip(' ._')
-        
-        # Truncate if too long
-        if len(filename) > max_length:
-            filename = filename[:max_length].rsplit(' ', 1)[0]
-        
-        return filename or "unknown"
+        return safe_filename(filename, max_length)
     
-    def get_page_content(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
+    def get_page_html(self, url: str) -> Optional[str]:
         """
-        Get webpage content with retry mechanism.
+        Get raw webpage HTML.
+        
+        Timeouts, connection errors and throttling / transient 5xx responses are
+        retried by the request scheduler; other errors such as 404 fail at once.
         
         Args:
             url: URL to fetch
-            retries: Number of retry attempts
             
         Returns:
-            BeautifulSoup object or None if failed
+            Page HTML or None if failed
         """
-        for attempt in range(retries):
+        with self.metrics.timer('fetch_page') as span:
             try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return BeautifulSoup(response.text, 'html.parser')
+                response = self.fetch_page(url, timeout=30)
+                span.bytes = len(response.content)
+                return response.text
             except requests.RequestException as e:
-                self.logger.warning(f"Failed to fetch page (attempt {attempt + 1}/{retries}) {url}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    self.logger.error(f"Final failure fetching page {url}: {e}")
-                    self.stats['errors'] += 1
+                span.error = error_category(e)
+                self.logger.error(f"Failed to fetch page {url}: {e}")
+                self._increment_stat('errors')
         return None
     
-    def extract_papers_from_session(self, soup: BeautifulSoup, session_id: str) -> List[Dict[str, Any]]:
+    def get_page_content(self, url: str) -> Optional[Node]:
         """
-        Extract paper information from a session page.
+        Get webpage content.
         
         Args:
-            soup: BeautifulSoup object of the session page
-            session_id: Session ID (e.g., 'MOIAA')
+            url: URL to fetch
+            
+        Returns:
+            Parsed document or None if failed
+        """
+        html = self.get_page_html(url)
+        return self.parser.parse(html) if html is not None else None
+    
+    # Paper IDs as they appear in session page text (session prefix + 2-3 digits)
+    PAPER_ID_PATTERN = re.compile(r'\b[A-Z]{3,4}\d{2,3}')
+    CONTRIB_CLASSES = ['contrib-ancor', 'contrib-header', 'contrib-subheader', 'contrib-desc', 'contrib-authors']
+    
+    def clean_title(self, content: str) -> str:
+        """
+        Derive a paper title from the text that follows its paper ID.
+        
+        NAPAC session pages list papers in a tightly packed format, e.g.
+        "SUP001Title text hereTUP080use link...Author names...", so the title
+        ends before a secondary paper code, an author name or metadata keywords.
+        
+        Args:
+            content: Text following the paper ID
             
         Returns:
-            List of paper dictionaries
+            Cleaned title, or '' if no plausible title was found
+        """
+        # Skip if too short or if it's a secondary reference code (like TUP080)
+        if len(content) < 20:
+            return ''
+        
+        # Extract title: it ends before common patterns
+        # 1) Secondary paper code (e.g., "TUP080use link")
+        # 2) Author names (e.g., "H. Alamprese")
+        # 3) DOI/Citation text
+        title = content
+        
+        # Remove secondary paper codes and "use link" phrases
+        title = re.sub(r'[A-Z]{3,4}\d{2,3}use\s+link.*', '', title, flags=re.DOTALL)
+        
+        # Split at author pattern: capital initial + period + space + capitalized surname
+        author_match = re.search(r'([A-Z]\.\s+[A-Z][a-z]+)', title)
+        if author_match:
+            title = title[:author_match.start()].strip()
+        
+        # Also try splitting at common metadata keywords
+        for keyword in ['DOI:', 'About:', 'Cite:', 'Received:', 'Funding:']:
+            if keyword in title:
+                title = title.split(keyword)[0].strip()
+                break
+        
+        # Filter short or empty titles
+        if len(title) < 10:
+            return ''
+        
+        # Clean up trailing/leading whitespace
+        return ' '.join(title.split())
+    
+    # Page number at the end of a contrib-header, directly after the title (e.g. 'Commissioning of the HEPS26')
+    HEADER_PAGE_PATTERN = re.compile(r'(?<=[^\s\d])(\d{1,4})$')
+    
+    def split_header(self, header: Node, paper_id: str) -> Tuple[str, str]:
+        """
+        Split the text of a contrib-header into title and page number.
+        
+        The header reads paper ID, title and (for published papers) page number with
+        nothing in between, e.g. 'MOYN03Commissioning of the HEPS26'. A number is only
+        taken for the page if it directly follows a non-digit, so titles ending in a
+        separate number (e.g. 'Run 3') keep it.
+        
+        Args:
+            header: contrib-header element
+            paper_id: Paper ID of the block
+        
+        Returns:
+            Tuple of (title, page number), page number '' if there is none
+        """
+        text = ' '.join(header.text().split())
+        if text.upper().startswith(paper_id):
+            text = text[len(paper_id):].strip()
+        page = self.HEADER_PAGE_PATTERN.search(text)
+        if page:
+            return text[:page.start()].strip(), page.group(1)
+        return text, ''
+    
+    def extract_papers_from_session(self, doc: Node, session_id: str) -> List[Paper]:
         """
+        Extract paper information from a session page in a single structural pass.
+        
+        Walks the contrib-ancor / contrib-header / contrib-subheader / contrib-desc /
+        contrib-authors blocks once, in document order, and builds each paper record
+        from its own block, so the cost is linear in the size of the page. Title and
+        page number come from the contrib-header; papers that are not cross-listed
+        have no contrib-subheader, which does not hide their abstract and authors.
+        
+        Args:
+            doc: Parsed session page
+            session_id: Session ID (e.g., 'MOIAA')
+        
+        Returns:
+            List of paper records
+        """
+        # Group the contrib divs into one block per paper
+        blocks = []
+        for div in doc.find_all('div', classes=self.CONTRIB_CLASSES):
+            kind = next(c for c in div.classes if c in self.CONTRIB_CLASSES)
+            if kind == 'contrib-ancor':
+                blocks.append({'anchor': div})
+            elif blocks:
+                blocks[-1].setdefault(kind, div)
+        
         papers = []
-        page_text = soup.get_text()
-
-        # Save debug information
-        debug_file = self.output_dir / "Debug" / f"{session_id}_page_text.txt"
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(page_text)
-
-        # NAPAC session pages list papers with tightly packed format:
-        # "SUP001Title text hereT UPnnn-or-otheruselink...Author names..."
-        # We need to extract: Paper ID (e.g., SUP001), Title (ends before author or secondary ID)
+        for block in blocks:
+            paper_id = (block['anchor'].get('id') or '').upper()
+            if not paper_id:
+                continue
+            
+            header = block.get('contrib-header')
+            with self.metrics.timer('title_extraction'):
+                if header:
+                    title, page_num = self.split_header(header, paper_id)
+                else:
+                    # No header: fall back to the text heuristic over the block, up to the
+                    # next paper-ID-like token
+                    text = ''.join(block[kind].text() for kind in self.CONTRIB_CLASSES if kind in block)
+                    if text.startswith(paper_id):
+                        text = text[len(paper_id):]
+                    next_id = self.PAPER_ID_PATTERN.search(text)
+                    title, page_num = self.clean_title(text[:next_id.start()] if next_id else text), ''
+            if not title:
+                continue
+            
+            paper_info = self.build_paper_record(paper_id, title, page_num, block.get('contrib-subheader'),
+                                                 block.get('contrib-desc'), block.get('contrib-authors'))
+            papers.append(paper_info)
+            self.logger.info(f"  ✓ {paper_id}: {title[:50]}...")
+        
+        if not papers:
+            self.logger.warning(f"No papers detected in session {session_id}")
+        
+        return papers
+    
+    def extract_papers_from_session_regex(self, doc: Node, session_id: str) -> List[Paper]:
+        """
+        Extract paper information by pattern matching over the flattened page text.
+        
+        This is the original parser, kept for parity checks and benchmarks
+        (benchmarks/bench_parser.py). It re-searches the document for every paper.
+        
+        Args:
+            doc: Parsed session page
+            session_id: Session ID (e.g., 'MOIAA')
+            
+        Returns:
+            List of paper records
+        """
+        page_text = doc.text()
         
         # First, find all potential paper IDs (session prefix + 3 digits or 4 uppercase + 2 digits)
         # Pattern: match paper ID followed by capital letter (start of title)
@@ -225,141 +590,119 @@ class NAPAC2025Scraper:
         papers = []
         for m in id_pattern.finditer(page_text):
             pid = m.group(1).strip()
-            content = m.group(2).strip()
-            
-            # Skip if too short or if it's a secondary reference code (like TUP080)
-            if len(content) < 20:
+            title = self.clean_title(m.group(2).strip())
+            if not title:
                 continue
             
-            # Extract title: it ends before common patterns
-            # 1) Secondary paper code (e.g., "TUP080use link")
-            # 2) Author names (e.g., "H. Alamprese")
-            # 3) DOI/Citation text
-            title = content
-            
-            # Remove secondary paper codes and "use link" phrases
-            title = re.sub(r'[A-Z]{3,4}\d{2,3}use\s+link.*', '', title, flags=re.DOTALL)
-            
-            # Split at author pattern: capital initial + period + space + capitalized surname
-            author_match = re.search(r'([A-Z]\.\s+[A-Z][a-z]+)', title)
-            if author_match:
-                title = title[:author_match.start()].strip()
-            
-            # Also try splitting at common metadata keywords
-            for keyword in ['DOI:', 'About:', 'Cite:', 'Received:', 'Funding:']:
-                if keyword in title:
-                    title = title.split(keyword)[0].strip()
-                    break
-            
-            # Filter short or empty titles
-            if len(title) < 10:
-                continue
-            
-            # Clean up trailing/leading whitespace
-            title = ' '.join(title.split())
-            
             page_num = ''
             
             # Use existing detail extractor
-            paper_info = self.extract_paper_details_from_page(soup, pid, title, page_num)
+            paper_info = self.extract_paper_details_from_page(doc, pid, title, page_num)
             if paper_info and paper_info['title']:
                 papers.append(paper_info)
                 self.logger.info(f"  ✓ {pid}: {title[:50]}...")
-
+        
         if not papers:
             self.logger.warning(f"No papers detected by pattern matching in session {session_id}")
-
+        
         return papers
     
-    def extract_paper_details_from_page(self, soup: BeautifulSoup, paper_id: str, title: str, page_num: str) -> Dict[str, Any]:
+    def extract_paper_details_from_page(self, doc: Node, paper_id: str, title: str, page_num: str) -> Paper:
         """
         Extract detailed information for a single paper from the session page.
         
         Args:
-            soup: BeautifulSoup object of the session page
+            doc: Parsed session page
             paper_id: Paper ID (e.g., 'SUP001')
             title: Paper title
             page_num: Page number
             
         Returns:
-            Dictionary containing paper information
-        """
-        paper_info = {
-            'paper_id': paper_id,
-            'title': title,
-            'authors': [],
-            'institutions': [],
-            'abstract': '',
-            'presentation_url': '',
-            'paper_url': '',
-            'poster_url': '',
-            'doi': f"https://doi.org/10.18429/JACoW-NAPAC2025-{paper_id}",
-            'page_number': page_num,
-            'presentation_available': False,
-            'paper_available': False,
-            'poster_available': False
-        }
-        
-        # Find the paper section in the HTML using BeautifulSoup
+            Paper record
+        """
+        # Find the paper section in the HTML
         # Look for the contrib-ancor div with id matching this paper (lowercase)
-        anchor_div = soup.find('div', class_='contrib-ancor', id=paper_id.lower())
-        
-        if anchor_div:
-            # Get the contrib-header (next sibling)
-            contrib_header = anchor_div.find_next_sibling('div', class_='contrib-header')
-            # Get the contrib-subheader (sibling after header)
-            contrib_subheader = contrib_header.find_next_sibling('div', class_='contrib-subheader') if contrib_header else None
-            # Get other sections
-            contrib_desc = contrib_subheader.find_next_sibling('div', class_='contrib-desc') if contrib_subheader else None
-            contrib_authors = contrib_desc.find_next_sibling('div', class_='contrib-authors') if contrib_desc else None
-            
-            # Extract primary paper code from contrib-subheader
-            # Pattern: <a data-href=session/xxxx/index.html#papercode>PAPERCODE</a>
-            primary_code = None
-            if contrib_subheader:
-                primary_code_link = contrib_subheader.find('a', {'data-href': re.compile(r'session/.*#\w+')})
-                if primary_code_link:
-                    primary_code = primary_code_link.get_text().strip().upper()
-                    self.logger.debug(f"Found primary code {primary_code} for {paper_id}")
-            
-            # If no primary code found (main session papers), use the paper_id itself
-            if not primary_code:
-                primary_code = paper_id
-                self.logger.debug(f"Using paper_id as primary code: {primary_code}")
-            
-            # PDF URL is based on primary code
-            paper_pdf_url = urljoin(self.base_url, f"pdf/{primary_code}.pdf")
-            paper_info['paper_url'] = paper_pdf_url
-            paper_info['paper_available'] = self.check_pdf_exists(paper_pdf_url)
-            
-            # Update DOI to use primary code
-            paper_info['doi'] = f"https://doi.org/10.18429/JACoW-NAPAC2025-{primary_code}"
-            
-            # Extract authors from contrib-authors
-            if contrib_authors:
-                # Authors are in <li> tags with <b> for names
-                author_items = contrib_authors.find_all('li')
-                for item in author_items:
-                    # Get bold author names
-                    bold_authors = item.find_all('b')
-                    for b in bold_authors:
-                        author_name = b.get_text().strip().rstrip(',')
-                        if author_name:
-                            paper_info['authors'].append(author_name)
-                    
-                    # Get institution from <br> tag siblings
-                    br_tag = item.find('br')
-                    if br_tag and br_tag.next_sibling:
-                        inst_text = br_tag.next_sibling.strip() if isinstance(br_tag.next_sibling, str) else br_tag.next_sibling.get_text().strip()
-                        if inst_text and inst_text not in paper_info['institutions']:
-                            paper_info['institutions'].append(inst_text)
-            
-            # Extract abstract from contrib-desc
-            if contrib_desc:
-                paper_info['abstract'] = contrib_desc.get_text().strip()
+        anchor_div = next((div for div in doc.find_all('div', classes=['contrib-ancor'])
+                           if div.get('id') == paper_id.lower()), None)
         
-        else:
+        if not anchor_div:
             self.logger.warning(f"Could not find detailed section for {paper_id} in HTML")
+            return self.build_paper_record(paper_id, title, page_num, None, None, None, found=False)
+        
+        # Get the contrib-header (next sibling)
+        contrib_header = anchor_div.next_sibling('div', 'contrib-header')
+        # Get the contrib-subheader (sibling after header)
+        contrib_subheader = contrib_header.next_sibling('div', 'contrib-subheader') if contrib_header else None
+        # Get other sections
+        contrib_desc = contrib_subheader.next_sibling('div', 'contrib-desc') if contrib_subheader else None
+        contrib_authors = contrib_desc.next_sibling('div', 'contrib-authors') if contrib_desc else None
+        
+        return self.build_paper_record(paper_id, title, page_num, contrib_subheader, contrib_desc, contrib_authors)
+    
+    def build_paper_record(self, paper_id: str, title: str, page_num: str, contrib_subheader: Optional[Node],
+                           contrib_desc: Optional[Node], contrib_authors: Optional[Node], found: bool = True) -> Paper:
+        """
+        Build a paper record from the contrib blocks of one paper.
+        
+        Args:
+            paper_id: Paper ID (e.g., 'SUP001')
+            title: Paper title
+            page_num: Page number
+            contrib_subheader: contrib-subheader element or None
+            contrib_desc: contrib-desc element or None
+            contrib_authors: contrib-authors element or None
+            found: False if the paper's section was not found in the HTML
+            
+        Returns:
+            Paper record
+        """
+        paper_info = Paper(paper_id, title, doi=f"https://doi.org/{self.doi_prefix}{paper_id}", page_number=page_num)
+        if not found:
+            return paper_info
+        
+        # Extract primary paper code from contrib-subheader
+        # Pattern: <a data-href=session/xxxx/index.html#papercode>PAPERCODE</a>
+        primary_code = None
+        if contrib_subheader:
+            primary_code_link = next((a for a in contrib_subheader.find_all('a', attr='data-href')
+                                      if re.search(r'session/.*#\w+', a.get('data-href'))), None)
+            if primary_code_link:
+                primary_code = primary_code_link.text().strip().upper()
+                self.logger.debug(f"Found primary code {primary_code} for {paper_id}")
+        
+        # If no primary code found (main session papers), use the paper_id itself
+        if not primary_code:
+            primary_code = paper_id
+            self.logger.debug(f"Using paper_id as primary code: {primary_code}")
+        
+        # PDF URL is based on primary code; availability is resolved per session after
+        # parsing (resolve_pdf_availability) so parsing stays network-free
+        paper_pdf_url = urljoin(self.base_url, f"pdf/{primary_code}.pdf")
+        paper_info['paper_url'] = paper_pdf_url
+        
+        # Update DOI to use primary code
+        paper_info['doi'] = f"https://doi.org/{self.doi_prefix}{primary_code}"
+        
+        # Extract authors from contrib-authors
+        if contrib_authors:
+            # Authors are in <li> tags with <b> for names
+            author_items = contrib_authors.find_all('li')
+            for item in author_items:
+                # Get bold author names
+                bold_authors = item.find_all('b')
+                for b in bold_authors:
+                    author_name = b.text().strip().rstrip(',')
+                    if author_name:
+                        paper_info.add_author(author_name)
+                
+                # Get institution from <br> tag siblings
+                inst_text = item.text_after('br')
+                if inst_text:
+                    paper_info.add_institution(inst_text)
+        
+        # Extract abstract from contrib-desc
+        if contrib_desc:
+            paper_info['abstract'] = contrib_desc.text().strip()
         
         return paper_info
     
@@ -373,44 +716,255 @@ class NAPAC2025Scraper:
         Returns:
             True if PDF exists and is accessible
         """
+        with self.metrics.timer('probe_pdf') as span:
+            try:
+                response = self._request('HEAD', pdf_url, timeout=10)
+                span.error = self._probe_error(response)
+                return span.error is None
+            except Exception as e:
+                span.error = error_category(e)
+                return False
+
+    def check_pdfs_exist(self, pdf_urls: List[str]) -> Dict[str, bool]:
+        """
+        Check a batch of PDF URLs concurrently over the active transport.
+        
+        Args:
+            pdf_urls: URLs of the PDF files
+            
+        Returns:
+            Dictionary mapping each URL to its availability
+        """
+        unique_urls = list(dict.fromkeys(pdf_urls))
+        responses = self._request_many('HEAD', unique_urls, timeout=10)
+        availability = {}
+        for url, response in zip(unique_urls, responses):
+            if isinstance(response, Exception):
+                error = error_category(response)
+                elapsed = 0.0
+            else:
+                error = self._probe_error(response)
+                elapsed = response.elapsed.total_seconds()
+            self.metrics.record('probe_pdf', elapsed, error=error)
+            availability[url] = error is None
+        return availability
+
+    @staticmethod
+    def _is_pdf_response(response) -> bool:
+        """Return True if a HEAD response describes an accessible PDF."""
+        return response.status_code == 200 and 'pdf' in response.headers.get('content-type', '').lower()
+
+    @classmethod
+    def _probe_error(cls, response) -> Optional[str]:
+        """Error category of a HEAD probe response, None if it describes an accessible PDF."""
+        if cls._is_pdf_response(response):
+            return None
+        return error_category(response.status_code) if response.status_code != 200 else 'not_pdf'
+    
+    def extract_pdf_links(self, doc: Node, page_url: str) -> List[str]:
+        """
+        Collect PDF URLs linked directly from a session page.
+        
+        Args:
+            doc: Parsed session page
+            page_url: URL of the session page (for resolving relative links)
+            
+        Returns:
+            List of absolute PDF URLs
+        """
+        links = []
+        for a in doc.find_all('a', attr='href'):
+            href = a.get('href').split('#')[0]
+            if href.lower().endswith('.pdf'):
+                links.append(urljoin(page_url, href))
+        return links
+    
+    def load_pdf_manifest(self) -> Dict[str, Any]:
+        """Load the cached PDF availability manifest (URL -> check result)."""
+        if self.pdf_manifest_file.exists():
+            try:
+                with open(self.pdf_manifest_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable PDF manifest {self.pdf_manifest_file}: {e}")
+        return {}
+    
+    def save_pdf_manifest(self, manifest: Dict[str, Any]):
+        """Save the PDF availability manifest."""
+        with open(self.pdf_manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    
+    def resolve_pdf_availability(self, papers: List[Dict[str, Any]]):
+        """
+        Resolve PDF availability for the papers of a session in one batch.
+        
+        Candidate URLs are deduplicated. A URL counts as available without probing
+        if a session page links to it or the cached manifest has already confirmed
+        it, and a URL probed for an earlier session of the run is not probed again;
+        the remaining URLs are probed concurrently with HEAD requests. Only confirmed
+        PDFs are cached, so missing ones are re-checked on the next run.
+        
+        Args:
+            papers: Paper dictionaries to update in place
+        """
+        candidate_urls = list(dict.fromkeys(p['paper_url'] for p in papers if p.get('paper_url')))
+        if not candidate_urls:
+            return
+        
+        with self._pdf_lock:
+            if self._pdf_manifest is None:
+                self._pdf_manifest = self.load_pdf_manifest()
+            manifest = self._pdf_manifest
+            availability = {}
+            for url in candidate_urls:
+                if url in self.linked_pdf_urls or manifest.get(url, {}).get('available'):
+                    availability[url] = True
+                elif url in self._probed_pdfs:
+                    availability[url] = self._probed_pdfs[url]
+        
+        to_probe = [url for url in candidate_urls if url not in availability]
+        self.logger.info(f"Resolving PDF availability: {len(candidate_urls)} unique URLs, "
+                         f"{len(candidate_urls) - len(to_probe)} known, {len(to_probe)} to probe")
+        probed = self.check_pdfs_exist(to_probe) if to_probe else {}
+        availability.update(probed)
+        
+        checked = time.strftime('%Y-%m-%d %H:%M:%S')
+        with self._pdf_lock:
+            self._probed_pdfs.update(probed)
+            confirmed = [url for url, available in availability.items()
+                         if available and not manifest.get(url, {}).get('available')]
+            for url in confirmed:
+                manifest[url] = {'available': True, 'checked': checked}
+            if confirmed or not self.pdf_manifest_file.exists():
+                self.save_pdf_manifest(manifest)
+        
+        for paper in papers:
+            if paper.get('paper_url'):
+                paper['paper_available'] = availability.get(paper['paper_url'], False)
+    
+    def load_incremental_state(self) -> Dict[str, Any]:
+        """Load session page and paper record hashes saved by the previous run."""
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = self.serializer.loads(f.read())
+                if state.get('schema_version', 1) != SCHEMA_VERSION:
+                    # Paper hashes of another record layout never match; re-parse everything
+                    self.logger.info(f"Incremental state has schema version {state.get('schema_version', 1)}, "
+                                     f"expected {SCHEMA_VERSION}; ignoring it")
+                    return {}
+                return state.get('sessions', {})
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable incremental state {self.state_file}: {e}")
+        return {}
+    
+    @staticmethod
+    def paper_hash(paper: Dict[str, Any]) -> str:
+        """Content hash of a paper record (always canonical stdlib JSON, whichever serializer is selected)."""
+        return hashlib.sha256(json.dumps(dict(paper), sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    def load_unchanged_session(self, session: Dict[str, str], html_hash: str) -> Optional[List[Paper]]:
+        """
+        Reuse the saved papers of a session whose page has not changed.
+        
+        Args:
+            session: Session configuration dictionary
+            html_hash: Hash of the freshly fetched session page
+            
+        Returns:
+            Previously saved paper records, or None if the session must be re-parsed
+        """
+        previous = self.previous_state.get(session['id'])
+        if not previous or previous.get('html_hash') != html_hash:
+            return None
+        
+        if not previous.get('papers'):
+            # Sessions without papers have no saved papers_data.json
+            papers = []
+            with self._stats_lock:
+                self.unchanged_sessions.add(session['id'])
+            return papers
+        
+        json_file = self.output_dir / "Sessions" / self.safe_filename(session['name']) / "papers_data.json"
         try:
-            response = self.session.head(pdf_url, timeout=10)
-            return response.status_code == 200 and 'pdf' in response.headers.get('content-type', '').lower()
-        except:
-            return False
+            with open(json_file, 'r', encoding='utf-8') as f:
+                session_data = self.serializer.loads(f.read())
+            if session_data.get('schema_version', 1) != SCHEMA_VERSION:
+                return None
+            papers = [Paper.from_dict(paper) for paper in session_data['papers']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        with self._stats_lock:
+            self.unchanged_sessions.add(session['id'])
+        return papers
+    
+    def save_debug_page(self, session_id: str, doc: Node, html: str):
+        """
+        Save the raw session page and its flattened text (gzip-compressed) for debugging and benchmarks.
+        
+        Args:
+            session_id: Session ID
+            doc: Parsed session page
+            html: Raw page HTML
+        """
+        with self.metrics.timer('save_debug_page'):
+            debug_dir = self.output_dir / "Debug"
+            with gzip.open(debug_dir / f"{session_id}_page.html.gz", 'wt', encoding='utf-8') as f:
+                f.write(html)
+            with gzip.open(debug_dir / f"{session_id}_page_text.txt.gz", 'wt', encoding='utf-8') as f:
+                f.write(doc.text())
     
-    def scrape_session(self, session: Dict[str, str]) -> List[Dict[str, Any]]:
+    def scrape_session(self, session: Dict[str, str]) -> Optional[List[Paper]]:
         """
-        Scrape all papers from a single session.
+        Fetch and parse all papers from a single session (no PDF probing).
+        
+        In incremental mode, a session whose page is unchanged since the last run
+        is not re-parsed; its saved papers_data.json is reused instead.
         
         Args:
             session: Session configuration dictionary
             
         Returns:
-            List of paper dictionaries
+            List of paper records, or None if the session page could not be fetched
         """
         self.logger.info(f"Scraping session: {session['name']}")
         
-        soup = self.get_page_content(session['url'])
-        if not soup:
-            return []
+        html = self.get_page_html(session['url'])
+        if html is None:
+            # Not an empty session: it is left out of the run (and the crawl journal),
+            # so a resumed or later run fetches it again
+            return None
         
-        papers = self.extract_papers_from_session(soup, session['id'])
+        html_hash = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        with self._stats_lock:
+            self.session_hashes[session['id']] = html_hash
         
-        self.stats['total_papers'] += len(papers)
-        self.stats['sessions_processed'] += 1
-        
-        self.logger.info(f"Session {session['id']} results: {len(papers)} papers")
+        papers = self.load_unchanged_session(session, html_hash) if self.incremental else None
+        if papers is not None:
+            self.logger.info(f"Session {session['id']} unchanged, reusing {len(papers)} saved papers")
+        else:
+            with self.metrics.timer('parse_html') as span:
+                span.bytes = len(html)
+                doc = self.parser.parse(html)
+            if self.debug_artifacts:
+                self.writer.submit(self.save_debug_page, session['id'], doc, html)
+            with self.metrics.timer('extract_papers'):
+                papers = self.layout.extract_papers(self, doc, session)
+            linked_pdfs = self.extract_pdf_links(doc, session['url'])
+            with self._stats_lock:
+                self.linked_pdf_urls.update(linked_pdfs)
+            self.logger.info(f"Session {session['id']} results: {len(papers)} papers")
         
-        # Display found papers
-        for i, paper in enumerate(papers):
-            pres_status = "✓" if paper['presentation_available'] else "✗"
-            paper_status = "✓" if paper['paper_available'] else "✗"
-            poster_status = "✓" if paper['poster_available'] else "✗"
-            self.logger.info(f"  {i+1}. {paper['paper_id']}: {paper['title'][:50]}... [P:{pres_status} R:{paper_status} T:{poster_status}]")
+        self._increment_stat('total_papers', len(papers))
+        self._increment_stat('sessions_processed')
         
         return papers
     
+    def _download_path(self, paper_info: Dict[str, Any], session_name: str, folder: str, file_type: str) -> Path:
+        """Local path of a downloaded file: PAPERID.pdf, PAPERID_talk.pdf or PAPERID_poster.pdf."""
+        return download_path(self.output_dir, folder, session_name, paper_info['paper_id'], file_type)
+    
     def download_single_file(self, file_url: str, paper_info: Dict[str, Any], session_name: str, folder: str, file_type: str) -> bool:
         """
         Download a single file (presentation, paper, or poster).
@@ -425,48 +979,163 @@ class NAPAC2025Scraper:
         Returns:
             True if download successful
         """
-        try:
-            session_dir = self.output_dir / folder / self.safe_filename(session_name)
-            session_dir.mkdir(exist_ok=True, parents=True)
+        with self.metrics.timer('download') as span:
+            try:
+                filepath = self._download_path(paper_info, session_name, folder, file_type)
+                filepath.parent.mkdir(exist_ok=True, parents=True)
+                filename = filepath.name
+            
+                if str(filepath) in self.completed_files:
+                    self.logger.info(f"{file_type.title()} completed in interrupted run, skipping: {filename}")
+                    return True
+            
+                if self.pdf_store:
+                    return self._download_to_store(file_url, filepath, file_type, span)
+            
+                headers = None
+                if filepath.exists():
+                    if not self.download_manifest.is_intact(filepath):
+                        # Truncated or corrupt copy from an interrupted or failed download
+                        self.logger.warning(f"{file_type.title()} on disk is incomplete or corrupt, re-downloading: {filename}")
+                        filepath.unlink()
+                    elif not self.http_cache:
+                        self.logger.info(f"{file_type.title()} already exists, skipping: {filename}")
+                        self.journal.record_file(file_url, filepath)
+                        return True
+                    else:
+                        # Revalidate the local copy so PDFs updated after the conference are refreshed
+                        headers = self.http_cache.conditional_headers(file_url, fallback_mtime=filepath.stat().st_mtime)
             
-            # Use simple naming: PAPERID.pdf, PAPERID_talk.pdf, PAPERID_poster.pdf
-            suffix = "_talk" if file_type == "presentation" else ("_poster" if file_type == "poster" else "")
-            filename = f"{paper_info['paper_id']}{suffix}.pdf"
+                result = self.download_manager.download(file_url, filepath, headers)
+                self.download_manager.meter.file_finished()
             
-            filepath = session_dir / filename
+                if result['status'] == 'not_modified':
+                    self.logger.info(f"{file_type.title()} not modified, skipping: {filename}")
+                    self.journal.record_file(file_url, filepath)
+                    return True
+                span.bytes = result['bytes']
+                if result['status'] == 'failed':
+                    span.error = result.get('category') or 'download_failed'
+                    self.logger.error(f"Failed to download {file_type} {file_url}: {result['error']}")
+                    self._increment_stat('errors')
+                    return False
             
-            if filepath.exists():
-                self.logger.info(f"{file_type.title()} already exists, skipping: {filename}")
+                if self.http_cache:
+                    # PDFs live in the output tree; only their validators are cached
+                    self.http_cache.store(file_url, result['headers'])
+                self.journal.record_file(file_url, filepath)
+            
+                resumed = " (resumed)" if result.get('resumed') else ""
+                self.logger.info(f"✅ Downloaded {file_type}: {filename} ({result['size']} bytes){resumed}")
                 return True
             
-            response = self.session.get(file_url, stream=True, timeout=60)
-            response.raise_for_status()
+            except Exception as e:
+                span.error = error_category(e)
+                self.logger.error(f"Failed to download {file_type} {file_url}: {e}")
+                self._increment_stat('errors')
+                return False
+    
+    def _download_to_store(self, file_url: str, filepath: Path, file_type: str, span) -> bool:
+        """
+        Fetch a file into the PDF store (at most once per crawl) and link it into its session folder.
+        
+        Args:
+            file_url: URL of the file
+            filepath: Path of the file in the session folder
+            file_type: Type of file (presentation, paper, poster)
+            span: Metrics span of the download
+            
+        Returns:
+            True if the session folder has the file
+        """
+        key = store_key(file_url)
+        filename = filepath.name
+        with self.pdf_store.lock(key):
+            entry = self.pdf_store.get(key)
+            if entry and key in self.pdf_store.fetched:
+                # Another session listing the same paper already fetched it during this crawl
+                self.pdf_store.link(entry, filepath)
+                self.pdf_store.mark_fetched(key, shared=True)
+                self._record_stored_file(file_url, filepath, entry)
+                self.logger.info(f"♻️ {file_type.title()} shared with another session: {filename} ({key})")
+                return True
+            
+            if entry is None and filepath.exists():
+                if self.download_manifest.is_intact(filepath):
+                    # Downloaded before the store existed: adopt the file instead of fetching it again
+                    known = self.download_manifest.get(filepath) or {}
+                    entry = self.pdf_store.adopt(key, file_url, filepath, known.get('sha256'))
+                else:
+                    # Truncated or corrupt copy from an interrupted or failed download
+                    self.logger.warning(f"{file_type.title()} on disk is incomplete or corrupt, re-downloading: {filename}")
+                    filepath.unlink()
             
-            content_length = int(response.headers.get('content-length', 0))
-            if content_length > 0 and content_length < 100:  # Skip obviously wrong small files
-                self.logger.warning(f"{file_type.title()} file too small ({content_length} bytes), skipping: {paper_info['paper_id']}")
+            headers = None
+            if entry:
+                if not self.http_cache:
+                    self.pdf_store.link(entry, filepath)
+                    self.pdf_store.mark_fetched(key)
+                    self._record_stored_file(file_url, filepath, entry)
+                    self.logger.info(f"{file_type.title()} already exists, skipping: {filename}")
+                    return True
+                # Revalidate the stored copy so PDFs updated after the conference are refreshed
+                blob_mtime = self.pdf_store.blob_path(entry['sha256']).stat().st_mtime
+                headers = self.http_cache.conditional_headers(file_url, fallback_mtime=blob_mtime)
+            
+            staging_path = self.pdf_store.staging_path(key)
+            staging_path.parent.mkdir(parents=True, exist_ok=True)
+            result = self.download_manager.download(file_url, staging_path, headers, record=False)
+            self.download_manager.meter.file_finished()
+            
+            if result['status'] == 'not_modified' and entry:
+                self.pdf_store.link(entry, filepath)
+                self.pdf_store.mark_fetched(key)
+                self._record_stored_file(file_url, filepath, entry)
+                self.logger.info(f"{file_type.title()} not modified, skipping: {filename}")
+                return True
+            span.bytes = result['bytes']
+            if result['status'] != 'downloaded':
+                span.error = result.get('category') or 'download_failed'
+                self.logger.error(f"Failed to download {file_type} {file_url}: {result['error']}")
+                self._increment_stat('errors')
                 return False
             
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            entry = self.pdf_store.ingest(key, file_url, staging_path, result['sha256'], result['size'])
+            self.pdf_store.link(entry, filepath)
+            self.pdf_store.mark_fetched(key)
+            if self.http_cache:
+                # PDFs live in the output tree; only their validators are cached
+                self.http_cache.store(file_url, result['headers'])
+            self._record_stored_file(file_url, filepath, entry)
             
-            self.logger.info(f"✅ Downloaded {file_type}: {filename} ({content_length} bytes)")
+            resumed = " (resumed)" if result.get('resumed') else ""
+            self.logger.info(f"✅ Downloaded {file_type}: {filename} ({result['size']} bytes){resumed}")
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to download {file_type} {file_url}: {e}")
-            self.stats['errors'] += 1
-            return False
     
-    def download_files(self, paper_info: Dict[str, Any], session_name: str):
+    def _record_stored_file(self, file_url: str, filepath: Path, entry: Dict[str, Any]):
+        """Record a session folder file linked from the store in the download manifest and crawl journal."""
+        known = self.download_manifest.get(filepath)
+        if not known or known['sha256'] != entry['sha256']:
+            self.download_manifest.record(filepath, file_url, entry['sha256'], entry['size'])
+        self.journal.record_file(file_url, filepath)
+    
+    def _profiled_download_files(self, paper_info: Dict[str, Any], session_name: str) -> Dict[str, int]:
+        """Run download_files under the download worker's profiler."""
+        with self.metrics.profiled():
+            return self.download_files(paper_info, session_name)
+    
+    def download_files(self, paper_info: Dict[str, Any], session_name: str) -> Dict[str, int]:
         """
         Download all available files (presentation, paper, poster) for a paper.
         
         Args:
             paper_info: Paper information dictionary
             session_name: Name of the session
+            
+        Returns:
+            Number of successful downloads per file type
         """
+        downloads = {'presentation': 0, 'paper': 0, 'poster': 0}
         file_types = [
             ('presentation', paper_info['presentation_url'], paper_info['presentation_available'], 'Presentations'),
             ('paper', paper_info['paper_url'], paper_info['paper_available'], 'Papers'),
@@ -477,62 +1146,59 @@ class NAPAC2025Scraper:
             if available:
                 success = self.download_single_file(url, paper_info, session_name, folder, file_type)
                 if success:
-                    self.stats[f'downloaded_{file_type}s'] += 1
+                    self._increment_stat(f'downloaded_{file_type}s')
+                    downloads[file_type] += 1
+        return downloads
     
     def save_session_data(self, session: Dict[str, str], papers: List[Dict[str, Any]]):
         """
-        Save session data to files in multiple formats.
+        Save session data to the per-session files of the output profile (JSON, CSV, TXT).
         
         Args:
             session: Session configuration dictionary
             papers: List of paper dictionaries
         """
-        session_dir = self.output_dir / "Sessions" / self.safe_filename(session['name'])
-        session_dir.mkdir(parents=True, exist_ok=True)
-        
-        # JSON format
-        json_file = session_dir / "papers_data.json"
-        session_data = {
-            'session_info': session,
-            'papers': papers,
-            'paper_count': len(papers),
-            'scrape_time': time.strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
-        
-        # CSV format
-        self.save_session_csv(session_dir, papers, session)
-        
-        # Text format
-        self.save_session_txt(session_dir, session, papers)
-        
-        self.logger.info(f"Saved session data: {session['name']} ({len(papers)} papers)")
+        if not self.session_files:
+            return
+        with self.metrics.timer('save_session'):
+            session_dir = self.output_dir / "Sessions" / self.safe_filename(session['name'])
+            session_dir.mkdir(parents=True, exist_ok=True)
+            
+            # JSON format (also read back by incremental runs)
+            if 'json' in self.session_files:
+                json_file = session_dir / "papers_data.json"
+                session_data = {
+                    'schema_version': SCHEMA_VERSION,
+                    'session_info': session,
+                    'papers': papers,
+                    'paper_count': len(papers),
+                    'scrape_time': time.strftime('%Y-%m-%d %H:%M:%S')
+                }
+                
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    f.write(self.serializer.dumps(session_data, indent=True))
+            
+            # CSV format
+            if 'csv' in self.session_files:
+                self.save_session_csv(session_dir, papers, session)
+            
+            # Text format
+            if 'txt' in self.session_files:
+                self.save_session_txt(session_dir, session, papers)
+            
+            self.logger.info(f"Saved session data: {session['name']} ({len(papers)} papers)")
     
     def save_session_csv(self, session_dir: Path, papers: List[Dict[str, Any]], session: Dict[str, str]):
         """Save session data in CSV format."""
-        import csv
-        
         csv_file = session_dir / "papers_data.csv"
         with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
             if not papers:
                 return
-                
-            fieldnames = ['session_name', 'paper_id', 'title', 'authors', 'institutions', 'abstract', 
-                         'presentation_url', 'presentation_available', 'paper_url', 'paper_available', 
-                         'poster_url', 'poster_available', 'doi', 'page_number']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
             
+            writer = csv.writer(f)
+            writer.writerow(['session_name'] + SESSION_CSV_FIELDS)
             for paper in papers:
-                row = {
-                    'session_name': session['name'],
-                    **paper
-                }
-                row['authors'] = '; '.join(paper['authors'])
-                row['institutions'] = '; '.join(paper['institutions'])
-                writer.writerow(row)
+                writer.writerow([session['name']] + csv_row(paper, SESSION_CSV_FIELDS))
     
     def save_session_txt(self, session_dir: Path, session: Dict[str, str], papers: List[Dict[str, Any]]):
         """Save session data in text format."""
@@ -575,127 +1241,314 @@ class NAPAC2025Scraper:
                     f.write(f"   Abstract: {abstract_preview}\n")
                 f.write("-" * 60 + "\n")
     
-    def create_final_summary(self, all_sessions_data: List[Dict]):
-        """
-        Create final summary report of all scraped data.
-        
-        Args:
-            all_sessions_data: List of all session data dictionaries
-        """
-        # Calculate statistics
-        total_presentations = sum(
-            sum(1 for paper in session_data['papers'] if paper.get('presentation_available', False))
-            for session_data in all_sessions_data
-        )
-        total_papers = sum(
-            sum(1 for paper in session_data['papers'] if paper.get('paper_available', False))
-            for session_data in all_sessions_data
-        )
-        total_posters = sum(
-            sum(1 for paper in session_data['papers'] if paper.get('poster_available', False))
-            for session_data in all_sessions_data
-        )
-        
-        # Text summary
-        summary_file = self.output_dir / "NAPAC2025_Final_Report.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write("NAPAC2025 Conference Complete Scraping Report\n")
-            f.write("=" * 60 + "\n")
-            f.write(f"Scrape completion time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Sessions processed: {self.stats['sessions_processed']}\n")
-            f.write(f"Total papers: {self.stats['total_papers']}\n")
-            f.write(f"Available presentations: {total_presentations}\n")
-            f.write(f"Available papers: {total_papers}\n")
-            f.write(f"Available posters: {total_posters}\n")
-            f.write(f"Successfully downloaded presentations: {self.stats['downloaded_presentations']}\n")
-            f.write(f"Successfully downloaded papers: {self.stats['downloaded_papers']}\n")
-            f.write(f"Successfully downloaded posters: {self.stats['downloaded_posters']}\n")
-            f.write(f"Errors: {self.stats['errors']}\n\n")
-            
-            f.write("Session detailed statistics:\n")
-            f.write("-" * 50 + "\n")
-            for session_data in all_sessions_data:
-                session = session_data['session_info']
-                papers = session_data['papers']
-                available_presentations = sum(1 for p in papers if p.get('presentation_available', False))
-                available_papers_count = sum(1 for p in papers if p.get('paper_available', False))
-                available_posters = sum(1 for p in papers if p.get('poster_available', False))
+    def export_session(self, session_data: Dict[str, Any]):
+        """Append a processed session to the master files."""
+        with self.metrics.timer('export_session'):
+            self.exporter.write_session(session_data)
+    
+    def create_final_summary(self) -> Dict[str, Any]:
+        """
+        Complete the final report and write the JSON index, columnar files, SQLite catalogue,
+        author index and data explorer bundle.
+        
+        The master CSV, NDJSON file and per-session report sections have already been
+        appended to by the exporter while sessions were processed.
+        
+        Returns:
+            Scrape summary dictionary
+        """
+        with self.metrics.timer('export_report'):
+            scrape_info = self.exporter.finalize(self.stats, pretty_index=self.pretty_index)
+        with self.metrics.timer('export_columnar'):
+            self.exporter.write_columnar(self.columnar_formats)
+        if self.sqlite_catalogue:
+            with self.metrics.timer('export_sqlite'):
+                build_catalogue(self.exporter.iter_sessions(),
+                                self.output_dir / f"{self.conference}_Catalogue.sqlite", self.logger)
+        if self.author_index:
+            with self.metrics.timer('export_authors'):
+                build_author_index(self.exporter.iter_sessions(),
+                                   self.output_dir / f"{self.conference}_Author_Index.json", self.conference,
+                                   self.logger, serializer=self.serializer)
+        if self.data_bundle:
+            with self.metrics.timer('export_bundle'):
+                build_data_bundle(self.exporter.iter_sessions(), self.output_dir / "data_bundle", self.conference,
+                                  self.logger, serializer=self.serializer)
+        return scrape_info
+    
+    def update_fulltext_index(self) -> Optional[Dict[str, int]]:
+        """
+        Extract the text of new and changed PDFs into the full-text search index.
+        
+        Returns:
+            Per-file counts of the update, or None if the index could not be built
+        """
+        try:
+            return update_fulltext_index(self.output_dir, workers=self.fulltext_workers, conference=self.conference,
+                                         logger=self.logger)
+        except (ImportError, RuntimeError) as e:
+            self.logger.warning(f"{e}; skipping full-text index")
+            return None
+    
+    def update_incremental_state(self, all_sessions_data: Iterable[Dict], prune_missing: bool) -> Dict[str, Any]:
+        """
+        Compare this run against the saved state, write the changelog and save the new state.
+        
+        Sessions that failed this run (e.g. a page that could not be fetched) are left out of
+        the comparison: their saved state is kept and they are listed as failed, not removed.
+        
+        Args:
+            all_sessions_data: Session data dictionaries from this run (consumed once)
+            prune_missing: Treat sessions absent from this run as removed (False for partial runs)
+            
+        Returns:
+            Changelog dictionary
+        """
+        state = dict(self.previous_state)
+        changelog = {
+            'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'incremental': self.incremental,
+            'unchanged_sessions': sorted(self.unchanged_sessions),
+            'failed_sessions': sorted(self.failed_sessions),
+            'added': [],
+            'removed': [],
+            'modified': []
+        }
+        
+        seen_sessions = set()
+        for session_data in all_sessions_data:
+            session = session_data['session_info']
+            seen_sessions.add(session['id'])
+            old_hashes = self.previous_state.get(session['id'], {}).get('papers', {})
+            new_hashes = {}
+            for paper in session_data['papers']:
+                new_hashes[paper['paper_id']] = self.paper_hash(paper)
+                entry = {'session_id': session['id'], 'paper_id': paper['paper_id'], 'title': paper['title']}
+                if paper['paper_id'] not in old_hashes:
+                    changelog['added'].append(entry)
+                elif old_hashes[paper['paper_id']] != new_hashes[paper['paper_id']]:
+                    changelog['modified'].append(entry)
+            for paper_id in old_hashes:
+                if paper_id not in new_hashes:
+                    changelog['removed'].append({'session_id': session['id'], 'paper_id': paper_id})
+            
+            if session['id'] in self.session_hashes:
+                state[session['id']] = {'html_hash': self.session_hashes[session['id']], 'papers': new_hashes}
+        
+        if prune_missing:
+            for session_id in list(state):
+                if session_id not in seen_sessions and session_id not in self.failed_sessions:
+                    for paper_id in state.pop(session_id).get('papers', {}):
+                        changelog['removed'].append({'session_id': session_id, 'paper_id': paper_id})
+        
+        with open(self.output_dir / f"{self.conference}_Changelog.json", 'w', encoding='utf-8') as f:
+            f.write(self.serializer.dumps(changelog, indent=True))
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            f.write(self.serializer.dumps({'schema_version': SCHEMA_VERSION, 'updated': changelog['generated'],
+                                           'sessions': state}, indent=True))
+        
+        self.logger.info(f"Changelog: {len(changelog['added'])} added, {len(changelog['removed'])} removed, "
+                         f"{len(changelog['modified'])} modified, {len(self.unchanged_sessions)} sessions unchanged")
+        if self.failed_sessions:
+            self.logger.warning(f"Changelog: sessions {', '.join(sorted(self.failed_sessions))} failed and were not "
+                                f"compared; their saved state is kept for the next run")
+        return changelog
+    
+    def fetch_session(self, session: Dict[str, str], index: int, total: int) -> Optional[List[Paper]]:
+        """
+        Fetch and parse one session (one unit of work for the worker pool).
+        
+        Args:
+            session: Session configuration dictionary
+            index: 1-based position of the session in this run
+            total: Number of sessions in this run
+            
+        Returns:
+            List of paper records, or None if the session failed
+        """
+        self.logger.info(f"\nProcessing session {index}/{total}: {session['name']}")
+        
+        try:
+            with self.metrics.profiled():
+                papers = self.scrape_session(session)
+        except Exception as e:
+            self.logger.error(f"❌ Error processing session {session['name']}: {e}")
+            self._increment_stat('errors')
+            papers = None
+        if papers is None:
+            with self._stats_lock:
+                self.failed_sessions.add(session['id'])
+        return papers
+    
+    def crawl_session(self, session: Dict[str, str], index: int, total: int,
+                      paper_ids: Optional[set] = None, download: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Fetch, parse, resolve, save and download one session (one unit of work for the worker pool).
+        
+        Args:
+            session: Session configuration dictionary
+            index: 1-based position of the session in this run
+            total: Number of sessions in this run
+            paper_ids: Only keep, probe and download these (upper-case) paper IDs
+            download: Download the session's available files
+            
+        Returns:
+            Session data dictionary, or None if the session failed or has none of ``paper_ids``
+        """
+        if session['id'] in self.resumed_sessions:
+            return self.process_session(session, [], download=download)
+        
+        papers = self.fetch_session(session, index, total)
+        if papers is None:
+            return None
+        if paper_ids is not None:
+            selected = [paper for paper in papers if paper['paper_id'].upper() in paper_ids]
+            self._increment_stat('total_papers', len(selected) - len(papers))
+            if not selected:
+                self._increment_stat('sessions_processed', -1)
+                return None
+            papers = selected
+        
+        if session['id'] not in self.unchanged_sessions:
+            with self.metrics.profiled(), self.metrics.timer('resolve_pdfs'):
+                self.resolve_pdf_availability(papers)
+        if download:
+            self.download_manager.meter.expect(sum(
+                1 for paper in papers for file_type in ('presentation', 'paper', 'poster')
+                if paper.get(f'{file_type}_available')))
+        return self.process_session(session, papers, download=download)
+    
+    def process_session(self, session: Dict[str, str], papers: List[Dict[str, Any]],
+                        download: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Save and download a parsed session once PDF availability is resolved.
+        
+        Args:
+            session: Session configuration dictionary
+            papers: Paper dictionaries of the session
+            download: Download the session's available files
+            
+        Returns:
+            Session data dictionary, or None if the session failed
+        """
+        try:
+            if session['id'] in self.resumed_sessions:
+                # Released once exported, like the sessions crawled in this run
+                record = self.resumed_sessions.pop(session['id'])
+                for file_type, count in record['downloads'].items():
+                    self._increment_stat(f'downloaded_{file_type}s', count)
+                self.logger.info(f"⏭️ Session {session['id']} restored from crawl journal")
+                return record['session_data']
+            
+            downloads = {'presentation': 0, 'paper': 0, 'poster': 0}
+            
+            unchanged = session['id'] in self.unchanged_sessions
+            if unchanged:
+                self.logger.info(f"⏭️ Session {session['id']} unchanged, skipped parsing and save")
+            else:
+                # Display found papers
+                for i, paper in enumerate(papers):
+                    pres_status = "✓" if paper['presentation_available'] else "✗"
+                    paper_status = "✓" if paper['paper_available'] else "✗"
+                    poster_status = "✓" if paper['poster_available'] else "✗"
+                    self.logger.info(f"  {i+1}. {paper['paper_id']}: {paper['title'][:50]}... [P:{pres_status} R:{paper_status} T:{poster_status}]")
+            
+            if papers:
+                if not unchanged:
+                    self.writer.submit(self.save_session_data, session, papers)
                 
-                f.write(f"Session: {session['name']}\n")
-                f.write(f"   Papers: {len(papers)}\n")
-                f.write(f"   Available presentations: {available_presentations}\n")
-                f.write(f"   Available papers: {available_papers_count}\n")
-                f.write(f"   Available posters: {available_posters}\n")
-                f.write(f"   URL: {session['url']}\n")
+                # Download files for all papers in this session on the shared download pool. Intact
+                # files are skipped (or revalidated), so unchanged sessions still retry files that
+                # failed or went missing since an earlier run
+                if download:
+                    for paper_downloads in self.download_manager.map(
+                            lambda paper: self._profiled_download_files(paper, session['name']), papers):
+                        for file_type, count in paper_downloads.items():
+                            downloads[file_type] += count
                 
-                if papers:
-                    f.write("   Paper list:\n")
-                    for paper in papers:
-                        pdf_icon = "PDF" if paper.get('pdf_available', False) else "---"
-                        f.write(f"     [{pdf_icon}] {paper['paper_id']}: {paper['title'][:60]}...\n")
-                f.write("\n")
-        
-        # JSON index
-        master_json = self.output_dir / "NAPAC2025_Complete_Index.json"
-        with open(master_json, 'w', encoding='utf-8') as f:
-            json.dump({
-                'scrape_info': {
-                    'scrape_time': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'sessions_processed': self.stats['sessions_processed'],
-                    'total_papers': self.stats['total_papers'],
-                    'available_presentations': total_presentations,
-                    'available_papers': total_papers,
-                    'available_posters': total_posters,
-                    'downloaded_presentations': self.stats['downloaded_presentations'],
-                    'downloaded_papers': self.stats['downloaded_papers'],
-                    'downloaded_posters': self.stats['downloaded_posters'],
-                    'errors': self.stats['errors']
-                },
-                'sessions': all_sessions_data
-            }, f, ensure_ascii=False, indent=2)
-
-        # Create master CSV
-        self.create_master_csv(all_sessions_data)
-    
-    def create_master_csv(self, all_sessions_data: List[Dict]):
-        """Create master CSV file containing all papers."""
-        import csv
-
-        csv_file = self.output_dir / "NAPAC2025_All_Papers.csv"
-        with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
-            fieldnames = ['session_name', 'session_id', 'paper_id', 'title', 'authors', 'institutions', 
-                         'abstract', 'presentation_url', 'presentation_available', 'paper_url', 'paper_available',
-                         'poster_url', 'poster_available', 'doi', 'page_number']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for session_data in all_sessions_data:
-                session_info = session_data['session_info']
-                for paper in session_data['papers']:
-                    row = {
-                        'session_name': session_info['name'],
-                        'session_id': session_info['id'],
-                        **paper
-                    }
-                    row['authors'] = '; '.join(paper['authors'])
-                    row['institutions'] = '; '.join(paper['institutions'])
-                    writer.writerow(row)
+                self.logger.info(f"✅ Session completed: {session['id']} ({len(papers)} papers)")
+                self.logger.info(f"   Presentations downloaded: {self.stats['downloaded_presentations']}")
+                self.logger.info(f"   Papers downloaded: {self.stats['downloaded_papers']}")
+                self.logger.info(f"   Posters downloaded: {self.stats['downloaded_posters']}")
+            else:
+                self.logger.info(f"⚠️ Session {session['id']} found no papers")
+            
+            session_data = {
+                'session_info': session,
+                'papers': papers,
+                'paper_count': len(papers)
+            }
+            # Queued after the session's files, so a journaled session always has them on disk
+            self.writer.submit(self.journal.record_session, session_data, self.session_hashes.get(session['id']),
+                               downloads)
+            return session_data
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error processing session {session['name']}: {e}")
+            self._increment_stat('errors')
+            with self._stats_lock:
+                self.failed_sessions.add(session['id'])
+            return None
+    
+    def select_sessions(self, session_ids: Optional[Sequence[str]] = None) -> List[Session]:
+        """
+        Sessions of the proceedings, optionally restricted to the given IDs.
+        
+        Args:
+            session_ids: Session IDs to keep (case-insensitive), in any order; None keeps all
+            
+        Returns:
+            Selected sessions in site order
+        """
+        sessions = self.sessions_config
+        if not session_ids:
+            return list(sessions)
+        wanted = {session_id.upper() for session_id in session_ids}
+        unknown = wanted - {session['id'].upper() for session in sessions}
+        if unknown:
+            self.logger.warning(f"Unknown sessions: {', '.join(sorted(unknown))}")
+        return [session for session in sessions if session['id'].upper() in wanted]
     
-    def run(self, test_mode: bool = False):
+    def run(self, test_mode: bool = False, incremental: bool = False, resume: bool = True,
+            sessions: Optional[Sequence[str]] = None, papers: Optional[Sequence[str]] = None,
+            download: bool = True):
         """
         Run the main scraping process.
         
         Args:
             test_mode: If True, only process first 3 sessions for testing
+            incremental: If True, skip sessions whose page is unchanged since the last run
+            resume: If True, continue an interrupted run recorded in the crawl journal
+            sessions: Only process these session IDs (all sessions if None)
+            papers: Only keep, probe and download these paper IDs (session pages are still
+                    fetched to find them)
+            download: Download the available files (False writes metadata only)
             
         Returns:
-            List of all session data
+            Scrape summary dictionary (the 'scrape_info' of the master index)
+            
+        Raises:
+            ValueError: For an incremental run with an output profile without papers_data.json
         """
-        self.logger.info("Starting NAPAC2025 conference data scraping")
+        if incremental and 'json' not in self.session_files:
+            raise ValueError(f"Incremental runs reuse each session's papers_data.json, which the "
+                             f"'{self.output_profile}' output profile does not write")
+        self.logger.info(f"Starting {self.conference} conference data scraping")
         start_time = time.time()
+        # Counters start from zero on every run of the same instance
+        self.stats = {key: 0 for key in self.stats}
+        self.metrics.reset()
+        paper_ids = {paper_id.upper() for paper_id in papers} if papers else None
+        # Runs that leave out papers or files must not be taken for complete ones later
+        selection = {'papers': sorted(paper_ids) if paper_ids else None, 'download': download}
+        partial_content = paper_ids is not None or not download
         
+        session_filter = bool(sessions)
         try:
-            sessions = self.sessions_config
+            sessions = self.select_sessions(sessions)
+            if not sessions:
+                raise ValueError("no sessions selected")
+            self.create_directories()
             
             self.logger.info(f"Prepared to process {len(sessions)} sessions")
             
@@ -703,45 +1556,85 @@ class NAPAC2025Scraper:
                 sessions = sessions[:3]  # Test with first 3 sessions
                 self.logger.info(f"Test mode: processing first 3 sessions")
             
-            all_sessions_data = []
+            self.incremental = incremental
+            self.previous_state = self.load_incremental_state()
+            self.session_hashes = {}
+            self.unchanged_sessions = set()
+            self.failed_sessions = set()
+            self._pdf_manifest = None
+            self._probed_pdfs = {}
+            if incremental:
+                self.logger.info(f"Incremental mode: {len(self.previous_state)} sessions in saved state")
             
-            # Process each session
-            for i, session in enumerate(sessions, 1):
-                self.logger.info(f"\nProcessing session {i}/{len(sessions)}: {session['name']}")
-                
-                try:
-                    papers = self.scrape_session(session)
-                    
-                    if papers:
-                        self.save_session_data(session, papers)
-                        
-                        # Download files for all papers in this session
-                        for paper in papers:
-                            self.download_files(paper, session['name'])
-                            time.sleep(1)  # Avoid too frequent requests
-                        
-                        self.logger.info(f"✅ Session completed: {len(papers)} papers")
-                        self.logger.info(f"   Presentations downloaded: {self.stats['downloaded_presentations']}")
-                        self.logger.info(f"   Papers downloaded: {self.stats['downloaded_papers']}")
-                        self.logger.info(f"   Posters downloaded: {self.stats['downloaded_posters']}")
-                    else:
-                        self.logger.info(f"⚠️ Session {session['id']} found no papers")
-                    
-                    all_sessions_data.append({
-                        'session_info': session,
-                        'papers': papers,
-                        'paper_count': len(papers)
-                    })
-                    
-                    time.sleep(2)  # Rest between sessions
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ Error processing session {session['name']}: {e}")
-                    self.stats['errors'] += 1
-                    continue
+            # Restore sessions and downloads completed by an interrupted previous run
+            session_ids = [session['id'] for session in sessions]
+            journal_state = self.journal.begin(session_ids, resume=resume,
+                                               selection=selection if partial_content else None)
+            self.resumed_sessions = {sid: record for sid, record in journal_state['sessions'].items() if sid in session_ids}
+            for record in self.resumed_sessions.values():
+                session_data = record['session_data']
+                session_data['session_info'] = Session.from_dict(session_data['session_info'])
+                session_data['papers'] = [Paper.from_dict(paper) for paper in session_data['papers']]
+            self.completed_files = journal_state['files']
+            for session_id, record in self.resumed_sessions.items():
+                if record.get('html_hash'):
+                    self.session_hashes[session_id] = record['html_hash']
+                self._increment_stat('total_papers', record['session_data']['paper_count'])
+                self._increment_stat('sessions_processed')
+            if journal_state['exists']:
+                self.logger.info(f"Resuming interrupted run: {len(self.resumed_sessions)} sessions and "
+                                 f"{len(self.completed_files)} files already completed")
+            
+            self.logger.info(f"Using {self.max_workers} worker(s), "
+                             f"{self.rate_limiter.max_in_flight} max in-flight requests per host")
+            
+            # Each worker fetches, parses, resolves, saves and downloads one session, and the
+            # session is appended to the master files as soon as it and all sessions before it
+            # are done. ordered_map() keeps results in session order (so the master index and
+            # CSV match serial mode) with a bounded number of sessions ahead, so only the
+            # sessions in flight are held in memory, not the whole proceedings
+            total = len(sessions)
+            self.download_manager.meter.reset(0)
+            self.exporter.open()
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for session_data in ordered_map(
+                        executor, lambda item: self.crawl_session(item[1], item[0], total, paper_ids, download),
+                        enumerate(sessions, 1), window=2 * self.max_workers):
+                    if session_data is not None:
+                        self.writer.submit(self.export_session, session_data)
+            self.writer.flush()
+            if paper_ids is not None:
+                self.logger.info(f"Paper filter: {self.stats['total_papers']} of {len(paper_ids)} papers found")
+            if self.download_manager.meter.expected_files:
+                self.download_manager.meter.report()
+            if self.pdf_store:
+                store_stats = self.pdf_store.stats
+                if store_stats['shared_views']:
+                    self.logger.info(f"♻️ {store_stats['shared_views']} files shared between sessions, "
+                                     f"{store_stats['bytes_saved'] / 1e6:.1f} MB not downloaded again")
+                pruned = self.pdf_store.prune()
+                if pruned:
+                    self.logger.info(f"Removed {pruned} superseded files from the PDF store")
             
             # Create final report
-            self.create_final_summary(all_sessions_data)
+            with self.metrics.profiled():
+                scrape_info = self.create_final_summary()
+                if partial_content:
+                    self.logger.info("Incremental state not updated: run without all papers or downloads")
+                else:
+                    with self.metrics.timer('save_state'):
+                        self.update_incremental_state(self.exporter.iter_sessions(),
+                                                      prune_missing=not (test_mode or session_filter))
+            self.journal.finish()
+            
+            if self.fulltext_index:
+                with self.metrics.timer('fulltext_index'):
+                    self.update_fulltext_index()
+            
+            if self.http_cache:
+                evicted = self.http_cache.evict()
+                if evicted:
+                    self.logger.info(f"Evicted {evicted} entries from the HTTP cache")
             
             elapsed_time = time.time() - start_time
             self.logger.info(f"\n🎉 Scraping completed! Time elapsed: {elapsed_time:.2f} seconds")
@@ -752,58 +1645,283 @@ class NAPAC2025Scraper:
             self.logger.info(f"  📄 Papers downloaded: {self.stats['downloaded_papers']}")
             self.logger.info(f"  📋 Posters downloaded: {self.stats['downloaded_posters']}")
             self.logger.info(f"  ❌ Errors: {self.stats['errors']}")
+            for host, budget in self.rate_limiter.snapshot().items():
+                self.logger.info(f"  🌐 {host}: {budget['requests']} requests, concurrency {budget['concurrency']}, "
+                                 f"{budget['throttled']} throttled, {budget['retries']} retries, "
+                                 f"circuit {budget['circuit']}")
             
-            return all_sessions_data
+            return scrape_info
             
         except Exception as e:
             self.logger.error(f"Critical error during scraping process: {e}")
             raise
+        finally:
+            # Keep the journal on disk (unfinished) so the next run can resume
+            self.writer.close()
+            self.journal.close()
+            self.exporter.close()
+            if self._download_manager is not None:
+                self.download_manager.shutdown()
+            self.download_manifest.save()
+            if self.pdf_store:
+                self.pdf_store.save()
+            if self._transport is not None:
+                self.transport.flush()
+            self.write_metrics()
+    
+    def load_saved_sessions(self, session_ids: Optional[Sequence[str]] = None,
+                            paper_ids: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Read the sessions of the last run back from the master index (or NDJSON export).
+        
+        Args:
+            session_ids: Only keep these session IDs (case-insensitive)
+            paper_ids: Only keep these paper IDs (case-insensitive); sessions left empty are dropped
+            
+        Returns:
+            Session data dictionaries with Session and Paper records
+        """
+        wanted_sessions = {session_id.upper() for session_id in session_ids} if session_ids else None
+        wanted_papers = {paper_id.upper() for paper_id in paper_ids} if paper_ids else None
+        saved = []
+        for session_data in iter_saved_sessions(self.output_dir, self.conference):
+            info = session_data['session_info']
+            if wanted_sessions is not None and info['id'].upper() not in wanted_sessions:
+                continue
+            papers = [Paper.from_dict(paper) for paper in session_data['papers']
+                      if wanted_papers is None or paper['paper_id'].upper() in wanted_papers]
+            if wanted_papers is not None and not papers:
+                continue
+            saved.append({'session_info': Session(info['id'], info['name'], info.get('url', '')),
+                          'papers': papers, 'paper_count': len(papers)})
+        return saved
+    
+    def download_saved(self, session_ids: Optional[Sequence[str]] = None,
+                       paper_ids: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Download the available files of the papers in the last run's export, without fetching
+        session pages or probing PDF URLs again.
+        
+        Args:
+            session_ids: Only download files of these sessions
+            paper_ids: Only download files of these papers
+            
+        Returns:
+            Statistics of the downloads
+        """
+        start_time = time.time()
+        self.stats = {key: 0 for key in self.stats}
+        self.metrics.reset()
+        saved = self.load_saved_sessions(session_ids, paper_ids)
+        self.create_directories()
+        pending = sum(1 for session_data in saved for paper in session_data['papers']
+                      for file_type in ('presentation', 'paper', 'poster') if paper.get(f'{file_type}_available'))
+        self.logger.info(f"Downloading {pending} files of {sum(len(s['papers']) for s in saved)} papers "
+                         f"in {len(saved)} sessions")
+        try:
+            self.download_manager.meter.reset(pending)
+            for session_data in saved:
+                name = session_data['session_info']['name']
+                self.download_manager.map(lambda paper: self._profiled_download_files(paper, name),
+                                          session_data['papers'])
+                self._increment_stat('total_papers', session_data['paper_count'])
+                self._increment_stat('sessions_processed')
+            if pending:
+                self.download_manager.meter.report()
+            self.logger.info(f"🎉 Downloads completed in {time.time() - start_time:.2f} seconds: "
+                             f"{self.stats['downloaded_presentations']} presentations, "
+                             f"{self.stats['downloaded_papers']} papers, {self.stats['downloaded_posters']} posters, "
+                             f"{self.stats['errors']} errors")
+            return dict(self.stats)
+        finally:
+            if self._download_manager is not None:
+                self.download_manager.shutdown()
+            self.download_manifest.save()
+            if self.pdf_store:
+                self.pdf_store.save()
+            if self._transport is not None:
+                self.transport.flush()
+            self.write_metrics()
+    
+    def export_saved(self) -> Dict[str, Any]:
+        """
+        Rebuild the master files, catalogue, author index and data bundle from the last run's
+        export, without network access. Download counts are taken from the files on disk.
+        
+        Every saved session is exported: the master files are rewritten in place, so a
+        session or paper selection would drop the rest of the catalogue.
+        
+        Returns:
+            Scrape summary dictionary
+        """
+        self.stats = {key: 0 for key in self.stats}
+        self.metrics.reset()
+        # Read completely before the exporter truncates the files it reads from
+        saved = self.load_saved_sessions()
+        try:
+            self.exporter.open()
+            for session_data in saved:
+                name = session_data['session_info']['name']
+                for paper in session_data['papers']:
+                    for file_type, folder in (('presentation', 'Presentations'), ('paper', 'Papers'), ('poster', 'Posters')):
+                        if paper.get(f'{file_type}_available') and \
+                                self._download_path(paper, name, folder, file_type).exists():
+                            self._increment_stat(f'downloaded_{file_type}s')
+                self._increment_stat('total_papers', session_data['paper_count'])
+                self._increment_stat('sessions_processed')
+                self.export_session(session_data)
+            scrape_info = self.create_final_summary()
+            self.logger.info(f"Exported {scrape_info['total_papers']} papers in {scrape_info['sessions_processed']} "
+                             f"sessions to {self.output_dir}")
+            return scrape_info
+        finally:
+            self.exporter.close()
+            self.write_metrics()
+    
+    def write_metrics(self):
+        """Write the metrics file (and profile) of this run next to the final report and log the stage timings."""
+        if not self.metrics.enabled:
+            return
+        try:
+            metrics_file = self.output_dir / f"{self.conference}_Metrics.json"
+            extra = {'conference': self.conference, 'stats': dict(self.stats), 'hosts': self.rate_limiter.snapshot()}
+            if self.pdf_store:
+                extra['pdf_store'] = dict(self.pdf_store.stats)
+            self.metrics.write(metrics_file, extra=extra)
+            self.metrics.log_summary(self.logger)
+            self.logger.info(f"Metrics saved: {metrics_file}")
+            if self.metrics.profiling:
+                profile_file = self.output_dir / f"{self.conference}_Profile.pstats"
+                summary = self.metrics.write_profile(profile_file)
+                if summary:
+                    self.logger.info(f"Profile saved: {profile_file}\n{summary}")
+        except OSError as e:
+            self.logger.warning(f"Could not write metrics: {e}")
 
 
-def main():
-    """Main function to run the NAPAC2025 scraper."""
-    print("NAPAC2025 Conference Web Scraper")
-    print("=" * 60)
-    print("Comprehensive scraper for NAPAC2025 conference papers")
-    print("Author: Ming Liu")
-    print()
+LOG_FILE = 'napac2025_scraper.log'
 
-    scraper = NAPAC2025Scraper()
+
+def setup_logging(log_file: Optional[str] = LOG_FILE, level: int = logging.INFO):
+    """
+    Configure console (and log file) output for command-line runs.
+    
+    The scraper itself only logs through its logger, so embedding applications keep
+    their own logging configuration.
     
+    Args:
+        log_file: Log file appended to (None for console only)
+        level: Logging level
+    """
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file, encoding='utf-8'))
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s', handlers=handlers)
+
+
+def _id_list(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Session or paper IDs given as separate arguments and/or comma-separated lists."""
+    if not values:
+        return None
+    return [item.strip() for value in values for item in value.split(',') if item.strip()]
+
+
+def main():
+    """Command-line entry point: discover, scrape, download, export or analyze."""
+    parser = argparse.ArgumentParser(description="Scrape JACoW conference proceedings (NAPAC2025 by default)")
+    parser.add_argument('--base-url', default="https://meow.elettra.eu/97/", help="Proceedings base URL")
+    parser.add_argument('--conference', default="NAPAC2025", help="Conference name (prefix of the master files)")
+    parser.add_argument('--layout', default='meow', help="Site layout ('meow' or 'jacow')")
+    parser.add_argument('--output-dir', help="Output directory (default: <conference>_Data)")
+    parser.add_argument('--workers', type=int, default=1, help="Sessions fetched and processed in parallel")
+    parser.add_argument('--requests-per-second', type=float, default=2.0, help="Request rate per host")
+    parser.add_argument('--output-profile', default='standard', help="'minimal', 'standard' or 'full'")
+    parser.add_argument('--serializer', default='json', help="JSON serializer ('json', 'orjson' or 'msgspec')")
+    parser.add_argument('--parser', default='html.parser', choices=list(PARSER_BACKENDS),
+                        help="HTML parser backend for the session pages")
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument('--record', metavar='ARCHIVE', help="Record every HTTP response into this zip archive")
+    archive.add_argument('--replay', metavar='ARCHIVE',
+                         help="Serve every request from this recorded archive (no network access)")
+    parser.add_argument('--record-pdfs', action='store_true', help="Also record PDF bodies (with --record)")
+    parser.add_argument('--pdf-store', action='store_true',
+                        help="Fetch files listed by several sessions once and hardlink them into each session folder")
+    parser.add_argument('--log-file', default=LOG_FILE, help="Log file ('' for console only)")
+    parser.add_argument('--quiet', action='store_true', help="Only log warnings and errors")
+
+    selection = argparse.ArgumentParser(add_help=False)
+    selection.add_argument('--sessions', nargs='+', metavar='ID', help="Only these sessions (e.g. MOP TUP or MOP,TUP)")
+    selection.add_argument('--papers', nargs='+', metavar='ID', help="Only these papers (e.g. MOP001 TUP080)")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+    discover_cmd = commands.add_parser('discover', help="List the sessions of the proceedings")
+    discover_cmd.add_argument('--json', action='store_true', help="Print the sessions as JSON")
+    scrape_cmd = commands.add_parser('scrape', parents=[selection],
+                                     help="Fetch session pages, save paper data, download files and export")
+    scrape_cmd.add_argument('--no-download', action='store_true', help="Write paper data without downloading files")
+    scrape_cmd.add_argument('--incremental', action='store_true', help="Skip sessions unchanged since the last run")
+    scrape_cmd.add_argument('--no-resume', action='store_true', help="Start over instead of resuming an interrupted run")
+    scrape_cmd.add_argument('--test', action='store_true', help="Only process the first 3 selected sessions")
+    commands.add_parser('download', parents=[selection],
+                        help="Download the files of the papers in the last export (no page fetches)")
+    commands.add_parser('export', help="Rebuild the master files (and the profile's catalogue, author index and "
+                                       "bundle) offline from all saved sessions")
+    analyze_cmd = commands.add_parser('analyze', help="Audit the output: paper counts and missing or corrupt files")
+    analyze_cmd.add_argument('--list-papers', action='store_true', help="List paper IDs per session")
+    args = parser.parse_args()
+    if args.record_pdfs and not args.record:
+        parser.error("--record-pdfs requires --record")
+    if args.command == 'scrape' and args.incremental and \
+            'json' not in OUTPUT_PROFILES.get(args.output_profile, {}).get('session_files', ('json',)):
+        parser.error(f"--incremental needs the per-session papers_data.json, which the "
+                     f"'{args.output_profile}' output profile does not write")
+
+    output_dir = Path(args.output_dir or f"{args.conference}_Data")
+    if args.command == 'analyze':
+        if not output_dir.exists():
+            print(f"❌ Results directory does not exist: {output_dir}")
+            return 1
+        try:
+            report = analyze(output_dir, args.conference)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            return 1
+        print_report(report, show_papers=args.list_papers)
+        write_summary_csv(report, output_dir / "Sessions_Summary.csv")
+        return 1 if any(report[key] for key in ('missing', 'zero_byte', 'corrupt')) else 0
+
+    setup_logging(args.log_file or None, logging.WARNING if args.quiet else logging.INFO)
+    scraper = NAPAC2025Scraper(base_url=args.base_url, output_dir=str(output_dir), conference=args.conference,
+                               layout=args.layout, max_workers=args.workers,
+                               requests_per_second=args.requests_per_second, output_profile=args.output_profile,
+                               serializer=args.serializer, parser=args.parser, record_archive=args.record,
+                               record_pdfs=args.record_pdfs, replay_archive=args.replay,
+                               pdf_store=args.pdf_store)
     try:
-        print("Starting test mode...")
-        results = scraper.run(test_mode=True)
-        
-        print("\n" + "="*60)
-        print("Test completed successfully!")
-        
-        # Ask if user wants to continue with full scraping
-        print("\nWould you like to continue with full scraping of all sessions?")
-        choice = input("Enter 'y' to continue with full scraping, any other key to exit: ").lower().strip()
-        
-        if choice == 'y':
-            print("\nStarting full scraping...")
-            results = scraper.run(test_mode=False)
-            
-            print("\n" + "="*60)
-            print("Full scraping completed successfully!")
-            print(f"Output directory: {scraper.output_dir}")
-            print("\nMain output files:")
-            print("  📊 NAPAC2025_Final_Report.txt - Complete scraping report")
-            print("  📈 NAPAC2025_All_Papers.csv - All papers Excel table")
-            print("  🗂️ NAPAC2025_Complete_Index.json - Complete data index")
-            print("  📁 Sessions/ - Session-categorized detailed data")
-            print("  � Presentations/ - Downloaded presentation files")
-            print("  📁 Papers/ - Downloaded paper files")
-            print("  📁 Posters/ - Downloaded poster files")
-            print("  🔍 Debug/ - Debug information and page content")
-            print("\n💡 Each session contains JSON, CSV, TXT format data")
-        
+        if args.command == 'discover':
+            sessions = scraper.sessions_config
+            if args.json:
+                print(json.dumps([session.to_dict() for session in sessions], ensure_ascii=False, indent=2))
+            else:
+                for session in sessions:
+                    print(f"{session['id']:<8} {session['name']:<50} {session['url']}")
+            scraper.transport.flush()
+            return 0 if sessions else 1
+        if args.command == 'scrape':
+            scraper.run(test_mode=args.test, incremental=args.incremental, resume=not args.no_resume,
+                        sessions=_id_list(args.sessions), papers=_id_list(args.papers), download=not args.no_download)
+        elif args.command == 'download':
+            scraper.download_saved(_id_list(args.sessions), _id_list(args.papers))
+        else:
+            scraper.export_saved()
+        return 0
     except KeyboardInterrupt:
-        print("\n⏹️ User interrupted scraping")
+        print("\n⏹️ Interrupted; the next 'scrape' resumes from the crawl journal")
+        return 130
     except Exception as e:
-        print(f"\n❌ Scraping failed: {e}")
+        print(f"\n❌ {args.command} failed: {e}")
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
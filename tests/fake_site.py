@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stand-in proceedings site for the tests
+
+Author: Ming Liu
+Description: In-memory Transport serving the fixture session pages and fake PDFs,
+             so scraper runs can be tested without network access. It answers
+             HEAD and GET requests, conditional requests (ETag) and Range requests
+             like the meow server does. make_scraper() points a scraper at it.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from scraper import NAPAC2025Scraper  # noqa: E402
+from transport import HostRateLimiter, Transport, TransportResponse  # noqa: E402
+
+BASE_URL = "https://meow.example.org/97/"
+PAGES = Path(__file__).resolve().parent / "fixtures" / "session_pages"
+# (URL segment, session ID, session name) of the sessions on the stand-in site
+SESSIONS = (
+    ('1161-mowp', 'MOWP', "Opening"),
+    ('1164-moyn', 'MOYN', "Photon Sources and Electron Accelerators (Invited)"),
+    ('1173-tubn', 'TUBN', "Novel Particle Sources (Contributed)"),
+)
+SESSION_LIST = (
+    "<html><body>"
+    + "".join(f"<a data-href='session/{segment}/index.html'>{session_id} - {name}</a>"
+              for segment, session_id, name in SESSIONS)
+    + "</body></html>"
+)
+# Papers of the fixture sessions with a published PDF (linked from their session page)
+PUBLISHED = ('MOYN01', 'MOYN03', 'TUBN01', 'TUBN03')
+
+
+def session_url(session_id):
+    segment = next(segment for segment, sid, _ in SESSIONS if sid == session_id)
+    return f"{BASE_URL}session/{segment}/index.html"
+
+
+def pdf_url(paper_id):
+    return f"{BASE_URL}pdf/{paper_id}.pdf"
+
+
+def pdf_body(paper_id, version=1):
+    """A small but complete PDF file."""
+    return (f"%PDF-1.4\n% {paper_id} version {version}\n".encode('ascii') + b"0" * 512 + b"\n%%EOF\n")
+
+
+def site_pages(pdfs=PUBLISHED):
+    """Session list, fixture session pages and the PDFs of ``pdfs`` by URL."""
+    pages = {BASE_URL + "html/session_list.html": SESSION_LIST.encode('utf-8')}
+    for segment, session_id, _ in SESSIONS:
+        pages[session_url(session_id)] = (PAGES / f"{session_id}_page.html").read_bytes()
+    for paper_id in pdfs:
+        pages[pdf_url(paper_id)] = pdf_body(paper_id)
+    return pages
+
+
+class FakeSite(Transport):
+    """
+    In-memory proceedings site.
+
+    ``flaky`` URLs answer 503 on their first request; ``delays`` maps URLs to a
+    response time in seconds. ``max_active`` is the highest number of requests
+    served at the same time.
+    """
+
+    name = 'fake'
+
+    def __init__(self, pages, flaky=(), delays=None):
+        self.pages = dict(pages)
+        self.flaky = set(flaky)
+        self.delays = dict(delays or {})
+        self.calls = []
+        self.batches = []
+        self.active = self.max_active = 0
+        self._lock = threading.Lock()
+
+    def etag(self, url):
+        return '"%s"' % hashlib.sha1(self.pages[url]).hexdigest()[:16]
+
+    def request(self, method, url, headers=None, timeout=30, stream=False):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(url, 0))
+            return self._respond(method.upper(), url, {key.lower(): value for key, value in (headers or {}).items()})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _respond(self, method, url, headers):
+        with self._lock:
+            self.calls.append((method, url, headers))
+            if url in self.flaky:
+                self.flaky.discard(url)
+                return TransportResponse(503, {'Content-Type': 'text/plain', 'Retry-After': '0'}, b'busy', url)
+        if url not in self.pages:
+            return TransportResponse(404, {'Content-Type': 'text/plain'}, b'not found', url)
+        body = self.pages[url]
+        content_type = 'application/pdf' if url.endswith('.pdf') else 'text/html; charset=utf-8'
+        response_headers = {'Content-Type': content_type, 'ETag': self.etag(url)}
+        if headers.get('if-none-match') == self.etag(url):
+            return TransportResponse(304, response_headers, b'', url)
+        status = 200
+        if 'range' in headers and headers.get('if-range', self.etag(url)) == self.etag(url):
+            offset = int(headers['range'].split('=', 1)[1].rstrip('-'))
+            if offset >= len(body):
+                return TransportResponse(416, response_headers, b'', url)
+            status, body = 206, body[offset:]
+        response_headers['Content-Length'] = str(len(body))
+        return TransportResponse(status, response_headers, body if method == 'GET' else b'', url)
+
+    def request_many(self, specs, limiter=None):
+        specs = list(specs)
+        with self._lock:
+            self.batches.append([(method.upper(), url) for method, url, _ in specs])
+        return [self.request(method, url, **kwargs) for method, url, kwargs in specs]
+
+    def requested(self, method=None):
+        """URLs requested so far (with ``method`` only)."""
+        return [url for verb, url, _ in self.calls if method is None or verb == method]
+
+
+def make_scraper(output_dir, site=None, **options):
+    """
+    Scraper crawling ``site`` (a new stand-in site by default) into ``output_dir``.
+
+    Requests are not paced, and the HTTP cache and run metrics are off; ``options``
+    override these or set any other NAPAC2025Scraper argument.
+    """
+    settings = {'base_url': BASE_URL, 'output_dir': str(output_dir),
+                'transport': FakeSite(site_pages()) if site is None else site,
+                'rate_limiter': HostRateLimiter(0, 4), 'use_http_cache': False, 'collect_metrics': False}
+    settings.update(options)
+    return NAPAC2025Scraper(**settings)
+
+
+def index_sessions(output_dir):
+    """Sessions of the master index written by a run."""
+    index = json.loads((Path(output_dir) / "NAPAC2025_Complete_Index.json").read_text(encoding='utf-8'))
+    return index['sessions']
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the author and institution index
+
+Author: Ming Liu
+Description: Name variants map to one author, and the precomputed co-author
+             adjacency is symmetric, counts shared papers once per paper (also
+             when a paper is listed by several sessions) and has no self-links.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from author_index import AuthorIndex, author_id, build_author_index  # noqa: E402
+
+
+def session(session_id, papers):
+    return {
+        'session_info': {'id': session_id, 'name': f"{session_id} - Session", 'url': 'https://example.org/'},
+        'papers': [{'paper_id': paper_id, 'title': f"Paper {paper_id}", 'authors': list(authors),
+                    'institutions': ['Fermi National Accelerator Laboratory']} for paper_id, authors in papers]
+    }
+
+
+def build(tmp_path, sessions):
+    path = tmp_path / "Author_Index.json"
+    counts = build_author_index(sessions, path)
+    return counts, AuthorIndex.load(path)
+
+
+def test_name_variants_are_one_author(tmp_path):
+    _, index = build(tmp_path, [session('MOP', [('MOP001', ['Hans-Jürgen Müller']),
+                                                ('MOP002', ['H.J. Muller,']),
+                                                ('MOP003', ['Muller, H.-J.'])])])
+    assert len(index.authors) == 1
+    entry = index.author('h. j. MULLER')
+    assert entry['papers'] == ['MOP001', 'MOP002', 'MOP003']
+    assert entry['variants'] == sorted(['Hans-Jürgen Müller', 'H.J. Muller', 'Muller, H.-J.'])
+
+
+def test_coauthor_adjacency_counts_shared_papers(tmp_path):
+    counts, index = build(tmp_path, [
+        session('MOP', [('MOP001', ['A. Smith', 'B. Jones', 'C. Brown']),
+                        ('MOP002', ['A. Smith', 'B. Jones']),
+                        ('MOP003', ['B. Jones'])]),
+        # A cross-listing of MOP001 and a paper naming the same author in two spellings
+        session('SUP', [('MOP001', ['A. Smith', 'B. Jones', 'C. Brown']),
+                        ('SUP001', ['D. Green', 'Green, D.'])]),
+    ])
+    assert counts['papers'] == 4
+    assert counts['coauthor_pairs'] == 3
+
+    smith, jones, brown = (author_id(name) for name in ('A. Smith', 'B. Jones', 'C. Brown'))
+    assert index.coauthor_counts[smith] == {jones: 2, brown: 1}
+    for first, others in index.coauthor_counts.items():
+        assert first not in others
+        for second, shared in others.items():
+            assert index.coauthor_counts[second][first] == shared
+    assert author_id('D. Green') not in index.coauthor_counts
+
+    assert [(entry['name'], shared) for entry, shared in index.coauthors('Jones, B.')] == [('A. Smith', 2),
+                                                                                          ('C. Brown', 1)]
+    assert index.coauthors('Nobody') == []
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the SQLite paper catalogue
+
+Author: Ming Liu
+Description: A paper listed twice (e.g. an updated copy from a resumed run)
+             must replace its author, institution and full-text rows instead of
+             leaving orphans that turn up as duplicate search results.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from catalogue import build_catalogue, fts5_available, search  # noqa: E402
+
+
+def session(title, authors, papers=('MOP001',)):
+    return {
+        'session_info': {'id': 'MOP', 'name': 'MOP - Monday Posters', 'url': 'https://example.org/mop'},
+        'papers': [{'paper_id': paper_id, 'title': f"{title} {paper_id}", 'abstract': 'Cavity tuning results.',
+                    'authors': list(authors), 'institutions': ['Fermilab']} for paper_id in papers]
+    }
+
+
+def test_relisted_paper_replaces_dependent_rows(tmp_path):
+    db_path = tmp_path / 'catalogue.sqlite'
+    counts = build_catalogue([session('Cavity tuning', ['J. Smith', 'A. Jones'], ('MOP001', 'MOP002')),
+                              session('Revised cavity tuning', ['J. Smith'])], db_path)
+    assert counts['papers'] == 2
+
+    conn = sqlite3.connect(db_path)
+    try:
+        row_id = conn.execute("SELECT id FROM papers WHERE paper_id = 'MOP001'").fetchone()[0]
+        assert conn.execute("SELECT COUNT(*) FROM paper_authors WHERE paper_id = ?", (row_id,)).fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM paper_institutions").fetchone()[0] == 2
+        assert [row[2] for row in search(conn, author='Jones')] == ['MOP002']
+        if fts5_available():
+            assert conn.execute("SELECT COUNT(*) FROM papers_fts").fetchone()[0] == 2
+            assert sorted(row[2] for row in search(conn, text='cavity tuning')) == ['MOP001', 'MOP002']
+            assert [row[3] for row in search(conn, text='revised')] == ['Revised cavity tuning MOP001']
+    finally:
+        conn.close()
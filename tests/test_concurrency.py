@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the concurrent session engine
+
+Author: Ming Liu
+Description: Session pages fetched and parsed by a worker pool, with the first
+             session answering last: the master files must list the sessions in
+             site order, exactly like a serial run. Each session is finished
+             (down to its files) before sessions far behind it are fetched.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import FakeSite, index_sessions, make_scraper, pdf_url, session_url, site_pages  # noqa: E402
+from scraper import ordered_map  # noqa: E402
+
+MASTER_FILES = ("NAPAC2025_All_Papers.jsonl", "NAPAC2025_All_Papers.csv")
+
+
+def crawl(output_dir, workers, delays):
+    site = FakeSite(site_pages(), delays=delays)
+    # Metadata only, so every request in flight is a session page fetch
+    make_scraper(output_dir, site, max_workers=workers).run(resume=False, download=False)
+    masters = {name: (output_dir / name).read_text(encoding='utf-8') for name in MASTER_FILES}
+    return site, index_sessions(output_dir), masters
+
+
+def test_concurrent_sessions_keep_site_order(tmp_path):
+    # The first session page is the slowest, so the worker pool finishes it last
+    delays = {session_url('MOWP'): 0.3, session_url('MOYN'): 0.15, session_url('TUBN'): 0.05}
+    serial_site, serial, serial_masters = crawl(tmp_path / "serial", 1, delays)
+    site, sessions, masters = crawl(tmp_path / "concurrent", 3, delays)
+
+    assert site.max_active > 1 and serial_site.max_active == 1
+    assert [session['session_info']['id'] for session in sessions] == ['MOWP', 'MOYN', 'TUBN']
+    assert sessions == serial
+    assert masters == serial_masters
+
+
+def test_serial_run_finishes_each_session_before_the_next(tmp_path):
+    site = FakeSite(site_pages())
+    make_scraper(tmp_path, site).run(resume=False)
+    requested = site.requested('GET')
+    # MOYN's files are downloaded before the TUBN page is fetched
+    assert requested.index(pdf_url('MOYN03')) < requested.index(session_url('TUBN'))
+
+
+def test_ordered_map_keeps_order_within_its_window():
+    started = []
+    lock = threading.Lock()
+
+    def work(item):
+        with lock:
+            started.append(item)
+        time.sleep(0.05 if item == 0 else 0)
+        return item * 10
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = ordered_map(executor, work, range(10), window=3)
+        assert next(results) == 0
+        # Item 0 was slow, yet no more than the window was submitted while waiting for it
+        assert len(started) <= 3
+        assert list(results) == [10 * item for item in range(1, 10)]
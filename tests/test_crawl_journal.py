@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the crawl journal
+
+Author: Ming Liu
+Description: A run interrupted during its downloads is resumed without fetching
+             its finished sessions and files again, and the master index is
+             rebuilt with every session. A session page that failed to load is
+             not journaled, so the resumed run fetches it again. Finished journals
+             and journals of another paper / download selection are not resumed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from crawl_journal import CrawlJournal  # noqa: E402
+from fake_site import FakeSite, index_sessions, make_scraper, pdf_url, session_url, site_pages  # noqa: E402
+
+SESSION = {'session_info': {'id': 'MOYN', 'name': 'MOYN - Photon Sources', 'url': ''}, 'papers': [],
+           'paper_count': 0}
+
+
+class InterruptedSite(FakeSite):
+    """Stand-in site whose first GET of ``interrupt_url`` is interrupted by the user."""
+
+    def __init__(self, pages, interrupt_url):
+        super().__init__(pages)
+        self.interrupt_url = interrupt_url
+
+    def request(self, method, url, headers=None, timeout=30, stream=False):
+        if method.upper() == 'GET' and url == self.interrupt_url:
+            self.interrupt_url = None
+            raise KeyboardInterrupt
+        return super().request(method, url, headers=headers, timeout=timeout, stream=stream)
+
+
+def crawl(site, output_dir):
+    # One download at a time, so the interrupted download is the last one started
+    return make_scraper(output_dir, site, download_workers=1).run()
+
+
+def test_interrupted_run_resumes_where_it_stopped(tmp_path):
+    site = InterruptedSite(site_pages(), interrupt_url=pdf_url('TUBN03'))
+    with pytest.raises(KeyboardInterrupt):
+        crawl(site, tmp_path)
+    assert pdf_url('MOYN01') in site.requested('GET')
+
+    site.calls.clear()
+    info = crawl(site, tmp_path)
+    # Finished sessions and files are not fetched again
+    assert session_url('MOWP') not in site.requested() and session_url('MOYN') not in site.requested()
+    assert session_url('TUBN') in site.requested()
+    assert not any(url in site.requested() for url in (pdf_url('MOYN01'), pdf_url('MOYN03')))
+    assert pdf_url('TUBN03') in site.requested('GET')
+
+    assert [(s['session_info']['id'], s['paper_count']) for s in index_sessions(tmp_path)] == \
+           [('MOWP', 1), ('MOYN', 3), ('TUBN', 3)]
+    assert (info['total_papers'], info['downloaded_papers']) == (7, 4)
+
+    # The finished run is not resumed again
+    site.calls.clear()
+    crawl(site, tmp_path)
+    assert session_url('MOWP') in site.requested()
+
+
+def test_session_page_failed_in_the_interrupted_run_is_fetched_on_resume(tmp_path):
+    pages = site_pages()
+    moyn_page = pages.pop(session_url('MOYN'))
+    site = InterruptedSite(pages, interrupt_url=pdf_url('TUBN03'))
+    with pytest.raises(KeyboardInterrupt):
+        crawl(site, tmp_path)
+    assert 'MOYN' not in CrawlJournal(tmp_path / "crawl_journal.jsonl").load()['sessions']
+
+    # The page is back: the resumed run fetches it instead of restoring an empty session
+    site.pages[session_url('MOYN')] = moyn_page
+    site.calls.clear()
+    info = crawl(site, tmp_path)
+    assert session_url('MOYN') in site.requested('GET') and session_url('MOWP') not in site.requested()
+    assert [(s['session_info']['id'], s['paper_count']) for s in index_sessions(tmp_path)] == \
+           [('MOWP', 1), ('MOYN', 3), ('TUBN', 3)]
+    assert (info['total_papers'], info['downloaded_papers']) == (7, 4)
+
+
+def test_journal_of_another_selection_is_not_resumed(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    partial = {'papers': ['MOYN01'], 'download': True}
+    journal = CrawlJournal(path)
+    journal.begin(['MOYN'], selection=partial)
+    journal.record_session(SESSION, 'hash', {'presentation': 0, 'paper': 1, 'poster': 0})
+    journal.record_file(pdf_url('MOYN01'), tmp_path / "MOYN01.pdf")
+    journal.close()
+
+    state = CrawlJournal(path).load()
+    assert list(state['sessions']) == ['MOYN'] and state['selection'] == partial and not state['complete']
+
+    # A complete run does not pick up the sessions of the partial one, and starts a new journal
+    journal = CrawlJournal(path)
+    assert journal.begin(['MOYN'], resume=True, selection=None)['sessions'] == {}
+    journal.close()
+    assert CrawlJournal(path).load()['sessions'] == {}
+
+
+def test_journal_resumes_the_same_selection_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "crawl_journal.jsonl"
+    journal = CrawlJournal(path)
+    journal.begin(['MOYN'])
+    journal.record_session(SESSION, 'hash', {'presentation': 0, 'paper': 0, 'poster': 0})
+    journal.record_file(pdf_url('MOYN01'), tmp_path / "MOYN01.pdf")
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "file_done", "url": "https://meo')
+
+    journal = CrawlJournal(path)
+    state = journal.begin(['MOYN'], resume=True)
+    assert list(state['sessions']) == ['MOYN']
+    assert state['files'] == {str(tmp_path / "MOYN01.pdf")}
+    journal.finish()
+    assert CrawlJournal(path).load()['complete']
+
+    # resume=False starts over even from an unfinished journal
+    journal = CrawlJournal(path)
+    journal.begin(['MOYN'])
+    journal.record_session(SESSION, 'hash', {})
+    journal.close()
+    journal = CrawlJournal(path)
+    assert journal.begin(['MOYN'], resume=False)['sessions'] == {}
+    journal.close()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the PDF download manager
+
+Author: Ming Liu
+Description: Downloads from the stand-in site: a transfer broken off mid-stream
+             resumes its '.part' file with a Range request, a changed file starts
+             over, files are requested without a content encoding so their
+             length is checked against the bytes on disk, error pages and
+             truncated bodies never reach the final path, and the SHA-256
+             manifest detects files damaged on disk.
+"""
+
+import gzip
+import json
+import logging
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from download_manager import DownloadManager, DownloadManifest  # noqa: E402
+from fake_site import FakeSite, pdf_body, pdf_url  # noqa: E402
+from transport import HostRateLimiter, TransportResponse  # noqa: E402
+
+URL = pdf_url('MOYN01')
+BODY = pdf_body('MOYN01')
+
+
+class BrokenStream(TransportResponse):
+    """Response whose connection drops after the first ``keep`` bytes."""
+
+    def __init__(self, response, keep):
+        super().__init__(response.status_code, dict(response.headers), response.content, response.url)
+        self.keep = keep
+
+    def iter_content(self, chunk_size=8192):
+        yield self.content[:self.keep]
+        raise requests.exceptions.ChunkedEncodingError("connection broken")
+
+
+class DroppingSite(FakeSite):
+    """Stand-in site dropping the connection of its first ``drops`` PDF transfers after ``keep`` bytes."""
+
+    def __init__(self, pages, drops=1, keep=200):
+        super().__init__(pages)
+        self.drops = drops
+        self.keep = keep
+
+    def request(self, method, url, headers=None, timeout=30, stream=False):
+        response = super().request(method, url, headers=headers, timeout=timeout, stream=stream)
+        if self.drops and response.status_code in (200, 206):
+            self.drops -= 1
+            return BrokenStream(response, self.keep)
+        return response
+
+
+class GzipSite(FakeSite):
+    """Stand-in site gzip-encoding its transfers unless asked for the identity encoding, like a
+    server answering the transport's default 'Accept-Encoding: gzip, deflate'."""
+
+    def request(self, method, url, headers=None, timeout=30, stream=False):
+        response = super().request(method, url, headers=headers, timeout=timeout, stream=stream)
+        accept = {key.lower(): value for key, value in (headers or {}).items()}.get('accept-encoding', 'gzip')
+        if 'gzip' not in accept or response.status_code != 200:
+            return response
+        # The transport decodes the body but passes on the length of the encoded transfer
+        encoded = dict(response.headers, **{'Content-Encoding': 'gzip',
+                                            'Content-Length': str(len(gzip.compress(response.content)))})
+        return TransportResponse(200, encoded, response.content, url)
+
+
+def make_manager(site, tmp_path):
+    manifest = DownloadManifest(tmp_path / "download_manifest.json", tmp_path)
+    limiter = HostRateLimiter(0, 2, max_retries=2, backoff_base=0, backoff_cap=0)
+    return DownloadManager(site, limiter, manifest, logging.getLogger('test_download_manager'))
+
+
+def test_broken_transfer_resumes_with_a_range_request(tmp_path):
+    site = DroppingSite({URL: BODY})
+    manager = make_manager(site, tmp_path)
+    target = tmp_path / "MOYN01.pdf"
+
+    result = manager.download(URL, target)
+    assert result['status'] == 'downloaded' and result['resumed']
+    assert target.read_bytes() == BODY
+    assert result['bytes'] == len(BODY) - 200
+    first, second = [headers for _, _, headers in site.calls]
+    assert 'range' not in first
+    assert second['range'] == "bytes=200-" and second['if-range'] == site.etag(URL)
+    assert not target.with_name("MOYN01.pdf.part").exists()
+    assert manager.manifest.get(target)['size'] == len(BODY)
+
+
+def test_files_are_requested_without_content_encoding(tmp_path):
+    site = GzipSite({URL: BODY})
+    result = make_manager(site, tmp_path).download(URL, tmp_path / "MOYN01.pdf")
+
+    assert result['status'] == 'downloaded'
+    assert (tmp_path / "MOYN01.pdf").read_bytes() == BODY
+    assert site.calls[0][2]['accept-encoding'] == 'identity'
+
+
+def test_partial_file_of_a_changed_pdf_starts_over(tmp_path):
+    target = tmp_path / "MOYN01.pdf"
+    target.with_name("MOYN01.pdf.part").write_bytes(b"%PDF-1.4\n% old version")
+    target.with_name("MOYN01.pdf.part.json").write_text(json.dumps({'url': URL, 'etag': '"old"'}), encoding='utf-8')
+    site = FakeSite({URL: BODY})
+
+    result = make_manager(site, tmp_path).download(URL, target)
+    # The server ignores the Range when If-Range no longer matches and sends the whole file
+    assert result['status'] == 'downloaded' and not result['resumed']
+    assert target.read_bytes() == BODY
+
+
+def test_error_pages_and_truncated_bodies_are_rejected(tmp_path):
+    html = b"<html><body>" + b"Proceedings maintenance " * 20 + b"</body></html>"
+    site = FakeSite({URL: html, pdf_url('MOYN03'): b"%PDF-1.4 short"})
+    manager = make_manager(site, tmp_path)
+
+    result = manager.download(URL, tmp_path / "MOYN01.pdf")
+    assert (result['status'], result['category']) == ('failed', 'not_pdf')
+    assert result['error'].startswith("not a PDF")
+    assert not (tmp_path / "MOYN01.pdf").exists()
+    assert not list(tmp_path.glob("*.part*"))
+
+    result = manager.download(pdf_url('MOYN03'), tmp_path / "MOYN03.pdf")
+    assert (result['status'], result['category']) == ('failed', 'too_small')
+
+    # Every attempt is broken off: the partial file is kept for the next run to resume
+    site = DroppingSite({URL: BODY}, drops=3, keep=100)
+    result = make_manager(site, tmp_path).download(URL, tmp_path / "MOYN01.pdf")
+    assert (result['status'], result['category']) == ('failed', 'connection')
+    assert not (tmp_path / "MOYN01.pdf").exists()
+    assert (tmp_path / "MOYN01.pdf.part").read_bytes() == BODY[:300]
+
+
+def test_manifest_detects_damaged_files(tmp_path):
+    site = FakeSite({URL: BODY, pdf_url('MOYN03'): pdf_body('MOYN03')})
+    manager = make_manager(site, tmp_path)
+    for paper_id in ('MOYN01', 'MOYN03'):
+        assert manager.download(pdf_url(paper_id), tmp_path / f"{paper_id}.pdf")['status'] == 'downloaded'
+    manager.manifest.save()
+
+    manifest = DownloadManifest(tmp_path / "download_manifest.json", tmp_path)
+    assert manifest.verify() == []
+    assert manifest.is_intact(tmp_path / "MOYN01.pdf")
+
+    # Same size, different content: only a re-hash notices
+    (tmp_path / "MOYN01.pdf").write_bytes(BODY.replace(b"version 1", b"version 9"))
+    (tmp_path / "MOYN03.pdf").write_bytes(pdf_body('MOYN03')[:150])
+    assert manifest.verify() == ["MOYN01.pdf", "MOYN03.pdf"]
+    assert not manifest.is_intact(tmp_path / "MOYN03.pdf")
+
+    # Files from before the manifest are accepted only if they look like a complete PDF
+    (tmp_path / "MOYN02.pdf").write_bytes(pdf_body('MOYN02'))
+    (tmp_path / "TUBN01.pdf").write_bytes(pdf_body('TUBN01')[:-8])
+    assert manifest.is_intact(tmp_path / "MOYN02.pdf")
+    assert manifest.get(tmp_path / "MOYN02.pdf")['size'] == len(pdf_body('MOYN02'))
+    assert not manifest.is_intact(tmp_path / "TUBN01.pdf")
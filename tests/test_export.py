@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming master file export
+
+Author: Ming Liu
+Description: Columnar export across several record batches, the final report,
+             the offline rebuild of the master files from all saved sessions and
+             the optional outputs of a default and a 'full' profile run.
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from export import StreamingExporter  # noqa: E402
+from fake_site import make_scraper  # noqa: E402
+from records import Paper, Session  # noqa: E402
+
+
+def export_sessions(output_dir: Path, sessions: int = 3, papers: int = 10) -> StreamingExporter:
+    """Stream synthetic sessions (every second paper has a PDF) to an exporter."""
+    exporter = StreamingExporter(output_dir)
+    exporter.open()
+    for s in range(sessions):
+        exporter.write_session({
+            'session_info': Session(f"S{s}", f"S{s} - Session {s}", f"https://example.org/{s}"),
+            'papers': [Paper(f"S{s}{i:03d}", f"Paper {i}", ['A. Author'], [f"Lab {i % 4}"], paper_available=i % 2 == 0)
+                       for i in range(papers)]
+        })
+    return exporter
+
+
+def test_columnar_export_spans_several_batches(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    exporter = export_sessions(tmp_path)
+    try:
+        paths = exporter.write_columnar(('parquet', 'arrow'), batch_size=7)
+    finally:
+        exporter.close()
+
+    assert [path.name for path in paths] == ['NAPAC2025_All_Papers.parquet', 'NAPAC2025_All_Papers.arrow']
+    assert not list(tmp_path.glob('*.tmp'))
+    parquet = pq.read_table(tmp_path / 'NAPAC2025_All_Papers.parquet')
+    with pa.ipc.open_file(tmp_path / 'NAPAC2025_All_Papers.arrow') as reader:
+        assert reader.num_record_batches == 5
+        arrow = reader.read_all()
+    assert parquet.num_rows == arrow.num_rows == 30
+    assert parquet.column('session_id').to_pylist() == arrow.column('session_id').to_pylist()
+    assert arrow.column('paper_id').to_pylist()[9:11] == ['S0009', 'S1000']
+
+
+
+def test_export_saved_keeps_every_session(tmp_path, monkeypatch):
+    from scraper import main
+    exporter = export_sessions(tmp_path)
+    try:
+        exporter.finalize({'sessions_processed': 3, 'total_papers': 30, 'downloaded_presentations': 0,
+                           'downloaded_papers': 0, 'downloaded_posters': 0, 'errors': 0})
+    finally:
+        exporter.close()
+
+    scraper = make_scraper(tmp_path)
+    assert scraper.export_saved()['total_papers'] == 30
+    assert [session['session_info']['id'] for session in scraper.load_saved_sessions()] == ['S0', 'S1', 'S2']
+
+    # A selection would rewrite the master files with the subset only
+    monkeypatch.setattr(sys, 'argv', ['scraper.py', '--output-dir', str(tmp_path), 'export', '--sessions', 'S0'])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
+
+
+def test_report_marks_available_papers(tmp_path):
+    exporter = export_sessions(tmp_path, sessions=1, papers=2)
+    try:
+        exporter.finalize({'sessions_processed': 1, 'total_papers': 2, 'downloaded_presentations': 0,
+                           'downloaded_papers': 0, 'downloaded_posters': 0, 'errors': 0}, pretty_index=False)
+    finally:
+        exporter.close()
+
+    report = (tmp_path / 'NAPAC2025_Final_Report.txt').read_text(encoding='utf-8')
+    assert "[PDF] S0000: Paper 0" in report
+    assert "[---] S0001: Paper 1" in report
+
+
+def test_default_run_skips_optional_outputs(tmp_path, caplog):
+    with caplog.at_level(logging.WARNING):
+        make_scraper(tmp_path).run(resume=False, download=False)
+
+    has_pyarrow = importlib.util.find_spec('pyarrow') is not None
+    assert (tmp_path / "NAPAC2025_All_Papers.parquet").exists() == has_pyarrow
+    assert 'pyarrow' not in caplog.text
+    assert not (tmp_path / "NAPAC2025_Catalogue.sqlite").exists()
+    assert not (tmp_path / "data_bundle").exists()
+    assert not (tmp_path / "NAPAC2025_Author_Index.json").exists()
+
+
+def test_full_profile_writes_optional_outputs(tmp_path):
+    make_scraper(tmp_path, output_profile='full', columnar_formats=()).run(resume=False, download=False)
+    assert (tmp_path / "NAPAC2025_Catalogue.sqlite").exists()
+    assert (tmp_path / "data_bundle" / "manifest.json").exists()
+    assert (tmp_path / "NAPAC2025_Author_Index.json").exists()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the full-text index of the downloaded PDFs
+
+Author: Ming Liu
+Description: Small generated PDFs are indexed; an update skips files with
+             unchanged size and mtime, re-extracts only files whose hash
+             changed, drops deleted files and records files that cannot be
+             read. Hardlinked copies of one file are extracted once.
+"""
+
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from catalogue import fts5_available  # noqa: E402
+from fulltext import open_index, search_fulltext, update_fulltext_index  # noqa: E402
+
+pytest.importorskip('pypdf')
+pytestmark = pytest.mark.skipif(not fts5_available(), reason="SQLite without FTS5")
+
+
+def make_pdf(text):
+    """One-page PDF showing ``text`` in Helvetica."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode('latin-1')
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>",
+               b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+               b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+               b"/Resources << /Font << /F1 5 0 R >> >> >>",
+               b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    pdf, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+def write_pdf(output_dir, session_dir, paper_id, text):
+    path = output_dir / "Papers" / session_dir / f"{paper_id}.pdf"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(make_pdf(text))
+    return path
+
+
+def update(output_dir):
+    return update_fulltext_index(output_dir, workers=1)
+
+
+def documents(output_dir):
+    conn = sqlite3.connect(output_dir / "NAPAC2025_Fulltext.sqlite")
+    try:
+        return {row[0]: row[1:] for row in conn.execute("SELECT paper_id, pages, error FROM documents")}
+    finally:
+        conn.close()
+
+
+def found(output_dir, text):
+    conn = open_index(output_dir / "NAPAC2025_Fulltext.sqlite")
+    try:
+        return sorted(row[3] for row in search_fulltext(conn, text))
+    finally:
+        conn.close()
+
+
+def test_update_skips_unchanged_files_and_reextracts_changed_ones(tmp_path):
+    write_pdf(tmp_path, "MOP - Posters", 'MOP001', "Beam loss monitor")
+    touched = write_pdf(tmp_path, "MOP - Posters", 'MOP002', "Cavity tuning")
+    changed = write_pdf(tmp_path, "MOP - Posters", 'MOP003', "Cryomodule test")
+    deleted = write_pdf(tmp_path, "MOP - Posters", 'MOP004', "Injector laser")
+    counts = update(tmp_path)
+    assert (counts['files'], counts['extracted'], counts['failed']) == (4, 4, 0)
+    assert found(tmp_path, "cavity") == ['MOP002']
+
+    # Same content with a new mtime is re-hashed but not re-extracted
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    changed.write_bytes(make_pdf("Cryomodule performance"))
+    deleted.unlink()
+    counts = update(tmp_path)
+    assert counts == {'files': 3, 'skipped': 1, 'extracted': 1, 'duplicates': 0, 'unchanged': 1, 'failed': 0,
+                      'removed': 1}
+    assert found(tmp_path, "cryomodule performance") == ['MOP003']
+    assert found(tmp_path, "injector") == []
+    assert set(documents(tmp_path)) == {'MOP001', 'MOP002', 'MOP003'}
+
+    counts = update(tmp_path)
+    assert counts['skipped'] == 3 and counts['extracted'] == counts['unchanged'] == 0
+
+
+def test_unreadable_file_is_recorded_as_failed(tmp_path):
+    write_pdf(tmp_path, "MOP - Posters", 'MOP001', "Beam loss monitor")
+    broken = tmp_path / "Papers" / "MOP - Posters" / "MOP002.pdf"
+    broken.write_bytes(b"<html>Not found</html>")
+
+    counts = update(tmp_path)
+    assert (counts['extracted'], counts['failed']) == (1, 1)
+    pages, error = documents(tmp_path)['MOP002']
+    assert pages is None and error
+
+    # A failed file is not retried until it changes
+    assert update(tmp_path)['skipped'] == 2
+    broken.write_bytes(make_pdf("Recovered poster"))
+    counts = update(tmp_path)
+    assert (counts['extracted'], counts['failed']) == (1, 0)
+    assert documents(tmp_path)['MOP002'] == (1, None)
+
+
+def test_hardlinked_copies_are_extracted_once(tmp_path):
+    original = write_pdf(tmp_path, "MOYN - Opening", 'MOYN01', "Commissioning of the linac")
+    first_view = tmp_path / "Papers" / "TUBN - Orals" / "TUBN01.pdf"
+    first_view.parent.mkdir(parents=True)
+    os.link(original, first_view)
+
+    counts = update(tmp_path)
+    assert (counts['extracted'], counts['duplicates']) == (1, 1)
+    assert found(tmp_path, "linac") == ['MOYN01', 'TUBN01']
+
+    # A view added later reuses the indexed text
+    second_view = tmp_path / "Papers" / "SUP - Student Posters" / "SUP001.pdf"
+    second_view.parent.mkdir(parents=True)
+    os.link(original, second_view)
+    counts = update(tmp_path)
+    assert (counts['extracted'], counts['duplicates'], counts['skipped']) == (0, 1, 2)
+    assert found(tmp_path, "linac") == ['MOYN01', 'SUP001', 'TUBN01']
+    assert documents(tmp_path)['SUP001'] == (1, None)
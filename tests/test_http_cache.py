@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the conditional-GET HTTP cache
+
+Author: Ming Liu
+Description: Validators and conditional headers, least-recently-used eviction,
+             and re-runs against the stand-in site: unchanged pages and PDFs are
+             answered with 304 and served from the cache or the disk, while a
+             PDF updated on the site is downloaded again.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import http_cache  # noqa: E402
+from fake_site import BASE_URL, FakeSite, index_sessions, make_scraper, pdf_body, pdf_url, site_pages  # noqa: E402
+from http_cache import HTTPCache  # noqa: E402
+
+URL = BASE_URL + "session/1164-moyn/index.html"
+LAST_MODIFIED = "Wed, 20 Aug 2025 10:00:00 GMT"
+
+
+def test_conditional_headers(tmp_path):
+    cache = HTTPCache(tmp_path / "cache")
+    assert cache.conditional_headers(URL) == {}
+    assert cache.conditional_headers(URL, fallback_mtime=0) == {'If-Modified-Since': "Thu, 01 Jan 1970 00:00:00 GMT"}
+
+    cache.store(URL, {'ETag': '"v1"', 'Last-Modified': LAST_MODIFIED}, b'<html></html>', encoding='utf-8')
+    assert cache.conditional_headers(URL, fallback_mtime=0) == {'If-None-Match': '"v1"',
+                                                                'If-Modified-Since': LAST_MODIFIED}
+    assert cache.body(URL) == b'<html></html>'
+    assert cache.lookup(URL)['encoding'] == 'utf-8'
+
+    # Validators only (PDFs): nothing to serve, but the request is still conditional
+    cache.store(URL, {'etag': '"v2"'})
+    assert cache.body(URL) is None
+    assert cache.conditional_headers(URL) == {'If-None-Match': '"v2"'}
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache = HTTPCache(tmp_path / "cache")
+    cache.store(URL, {'Content-Type': 'text/html'}, b'<html></html>')
+    assert cache.lookup(URL) is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path, monkeypatch):
+    clock = itertools.count(1000)
+    monkeypatch.setattr(http_cache, 'time', SimpleNamespace(time=lambda: next(clock)))
+    cache = HTTPCache(tmp_path / "cache", max_entries=2)
+    urls = [f"{BASE_URL}session/{n}/index.html" for n in range(3)]
+    for url in urls:
+        cache.store(url, {'ETag': '"v1"'}, b'x' * 100)
+    # Reading the oldest entry makes the second one the least recently used
+    cache.body(urls[0])
+    assert cache.evict() == 1
+    assert [cache.lookup(url) is not None for url in urls] == [True, False, True]
+    assert len(list((tmp_path / "cache").glob("*.body"))) == 2
+
+    cache.max_entries = None
+    cache.max_bytes = 1
+    assert cache.evict() == 2
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def crawl(site, output_dir):
+    make_scraper(output_dir, site, use_http_cache=True).run(resume=False)
+    return index_sessions(output_dir)
+
+
+def test_rerun_revalidates_pages_and_pdfs(tmp_path):
+    site = FakeSite(site_pages())
+    first = crawl(site, tmp_path)
+    site.calls.clear()
+
+    # MOYN01 was corrected after the conference
+    site.pages[pdf_url('MOYN01')] = pdf_body('MOYN01', version=2)
+    assert crawl(site, tmp_path) == first
+
+    gets = [(url, headers) for method, url, headers in site.calls if method == 'GET']
+    assert gets and all('if-none-match' in headers for url, headers in gets)
+    refreshed = [url for url, headers in gets if headers['if-none-match'] != site.etag(url)]
+    assert refreshed == [pdf_url('MOYN01')]
+    paper = tmp_path / "Papers" / "MOYN - Photon Sources and Electron Accelerators (Invited)" / "MOYN01.pdf"
+    assert paper.read_bytes() == pdf_body('MOYN01', version=2)
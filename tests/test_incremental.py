@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for incremental re-scrapes
+
+Author: Ming Liu
+Description: Runs against the stand-in site: a session whose page is unchanged is
+             neither re-parsed nor re-saved, but its files still go through the
+             download step, so files that failed or went missing are repaired.
+             A session page that fails to load is reported as failed, not as
+             removed papers. Output profiles without papers_data.json cannot run
+             incrementally.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import FakeSite, make_scraper, pdf_body, pdf_url, session_url, site_pages  # noqa: E402
+from scraper import main  # noqa: E402
+from transport import HostRateLimiter  # noqa: E402
+
+
+def crawl(site, output_dir, output_profile='standard', **kwargs):
+    # Without retries, a 404 fails the file at once
+    scraper = make_scraper(output_dir, site, rate_limiter=HostRateLimiter(0, 4, max_retries=0),
+                           output_profile=output_profile)
+    scraper.run(resume=False, **kwargs)
+    return scraper
+
+
+def test_unchanged_session_retries_failed_and_missing_files(tmp_path):
+    site = FakeSite(site_pages(pdfs=('MOYN01', 'TUBN01', 'TUBN03')))
+    crawl(site, tmp_path)
+    papers = tmp_path / "Papers" / "MOYN - Photon Sources and Electron Accelerators (Invited)"
+    assert sorted(path.name for path in papers.glob("*.pdf")) == ["MOYN01.pdf"]
+    saved = tmp_path / "Sessions" / "MOYN - Photon Sources and Electron Accelerators (Invited)" / "papers_data.json"
+    saved_mtime = saved.stat().st_mtime_ns
+
+    # MOYN03 failed with 404 and is published now; MOYN01 was deleted since
+    site.pages[pdf_url('MOYN03')] = pdf_body('MOYN03')
+    (papers / "MOYN01.pdf").unlink()
+    site.calls.clear()
+    scraper = crawl(site, tmp_path, incremental=True)
+
+    assert scraper.unchanged_sessions == {'MOWP', 'MOYN', 'TUBN'}
+    assert sorted(path.name for path in papers.glob("*.pdf")) == ["MOYN01.pdf", "MOYN03.pdf"]
+    assert (papers / "MOYN03.pdf").read_bytes() == pdf_body('MOYN03')
+    # Only the failed and the deleted file are fetched, and the unchanged session is not re-saved
+    assert sorted(url for url in site.requested('GET') if url.endswith('.pdf')) == [pdf_url('MOYN01'),
+                                                                                     pdf_url('MOYN03')]
+    assert saved.stat().st_mtime_ns == saved_mtime
+
+
+def changelog(output_dir):
+    return json.loads((output_dir / "NAPAC2025_Changelog.json").read_text(encoding='utf-8'))
+
+
+def test_failed_session_page_is_not_reported_as_removed(tmp_path):
+    site = FakeSite(site_pages())
+    crawl(site, tmp_path)
+    moyn_page = site.pages.pop(session_url('MOYN'))
+    scraper = crawl(site, tmp_path, incremental=True)
+
+    log = changelog(tmp_path)
+    assert (log['added'], log['removed'], log['failed_sessions']) == ([], [], ['MOYN'])
+    assert scraper.stats['errors'] == 1
+    state = json.loads((tmp_path / "incremental_state.json").read_text(encoding='utf-8'))['sessions']
+    assert sorted(state['MOYN']['papers']) == ['MOYN01', 'MOYN02', 'MOYN03']
+
+    # Once the page is back, the session is unchanged: nothing was removed, so nothing is added
+    site.pages[session_url('MOYN')] = moyn_page
+    scraper = crawl(site, tmp_path, incremental=True)
+    log = changelog(tmp_path)
+    assert (log['added'], log['removed'], log['failed_sessions']) == ([], [], [])
+    assert 'MOYN' in scraper.unchanged_sessions
+
+
+def test_minimal_profile_rejects_incremental_runs(tmp_path, monkeypatch):
+    site = FakeSite(site_pages())
+    with pytest.raises(ValueError, match="papers_data.json"):
+        crawl(site, tmp_path, output_profile='minimal', incremental=True)
+    assert site.calls == []
+
+    monkeypatch.setattr(sys, 'argv', ['scraper.py', '--output-dir', str(tmp_path), '--output-profile', 'minimal',
+                                      'scrape', '--incremental'])
+    with pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the site layouts
+
+Author: Ming Liu
+Description: The classic JACoW layout on a saved-format proceedings site
+             (tests/fixtures/jacow_classic: session frame, tablerow / paptitle /
+             pappage rows and author_cl spans), parsed directly and crawled
+             together with a meow site by the multi-conference crawler.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import BASE_URL, FakeSite, pdf_body, site_pages  # noqa: E402
+from layouts import JacowClassicLayout, detect_layout  # noqa: E402
+from multi_crawl import MultiConferenceCrawler  # noqa: E402
+from scraper import NAPAC2025Scraper  # noqa: E402
+
+JACOW_URL = "https://proceedings.jacow.org/srf2023/"
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "jacow_classic"
+OFFLINE = dict(use_http_cache=False, collect_metrics=False)
+
+
+def jacow_pages():
+    pages = {f"{JACOW_URL}html/{page.name}": page.read_bytes() for page in FIXTURES.glob("*.htm")}
+    for path in ("papers/thtut01.pdf", "talks/thtut01_talk.pdf", "papers/mopmb001.pdf",
+                 "posters/mopmb001_poster.pdf"):
+        pages[JACOW_URL + path] = pdf_body(path)
+    return pages
+
+
+def parse(scraper, name):
+    return scraper.parser.parse((FIXTURES / name).read_text(encoding='utf-8'))
+
+
+def test_classic_session_list_and_papers():
+    scraper = NAPAC2025Scraper(base_url=JACOW_URL, conference="SRF2023", layout='jacow', **OFFLINE)
+    layout = scraper.layout
+    assert isinstance(layout, JacowClassicLayout) and detect_layout(JACOW_URL) == 'jacow'
+
+    sessions = layout.parse_session_list(parse(scraper, "sessi0n1.htm"), JACOW_URL)
+    assert [(s['id'], s['name'], s['url']) for s in sessions] == [
+        ('THTUT', "Tutorial: SRF Cavity Processing", f"{JACOW_URL}html/thtut.htm"),
+        ('MOPMB', "Monday Poster Session", f"{JACOW_URL}html/mopmb.htm"),
+    ]
+
+    papers = layout.extract_papers(scraper, parse(scraper, "thtut.htm"), sessions[0])
+    assert [paper['paper_id'] for paper in papers] == ['THTUT01', 'THTUT02']
+    first, second = papers
+    # Titles are whitespace-normalized; the page number is the text of the page cell's link
+    assert first['title'] == "Medium Temperature Baking of Nb3Sn-Coated Cavities"
+    assert first['page_number'] == '712'
+    assert first['authors'] == ['S. Posen', 'G. Eremeev', 'D. Bafia']
+    assert first['institutions'] == ["Fermi National Accelerator Laboratory, Batavia, Illinois, USA",
+                                     "Argonne National Laboratory, Lemont, Illinois, USA"]
+    assert first['abstract'].startswith("Baking at 300 C")
+    assert first['doi'] == "https://doi.org/10.18429/JACoW-SRF2023-THTUT01"
+    assert first['paper_url'] == f"{JACOW_URL}papers/thtut01.pdf"
+    assert first['presentation_url'] == f"{JACOW_URL}talks/thtut01_talk.pdf"
+    assert first['presentation_available'] and not first['paper_available']
+    # A talk without a paper has no page number and no PDF links
+    assert (second['page_number'], second['paper_url'], second['presentation_url']) == ('', '', '')
+    assert second['authors'] == ['F. Furuta']
+
+
+def test_multi_crawl_shares_the_retry_budget(tmp_path):
+    site = FakeSite({**site_pages(), **jacow_pages()}, flaky=[f"{JACOW_URL}html/mopmb.htm"])
+    conferences = [
+        {'name': "NAPAC2025", 'base_url': BASE_URL, 'layout': 'meow', 'output_dir': str(tmp_path / "napac")},
+        {'name': "SRF2023", 'base_url': JACOW_URL, 'layout': 'jacow', 'output_dir': str(tmp_path / "srf")},
+    ]
+    crawler = MultiConferenceCrawler(conferences, requests_per_second=0, max_retries=0, transport=site, **OFFLINE)
+    assert crawler.rate_limiter.max_retries == 0
+    results = crawler.run(resume=False)
+    assert {name: result['status'] for name, result in results.items()} == \
+           {'NAPAC2025': 'completed', 'SRF2023': 'completed'}
+
+    # Without retries the throttled session page is given up after one request and left out of the run
+    assert site.requested('GET').count(f"{JACOW_URL}html/mopmb.htm") == 1
+    index = json.loads((tmp_path / "srf" / "SRF2023_Complete_Index.json").read_text(encoding='utf-8'))
+    assert [(s['session_info']['id'], [p['paper_id'] for p in s['papers']]) for s in index['sessions']] == \
+           [('THTUT', ['THTUT01', 'THTUT02'])]
+    assert sorted(path.name for path in (tmp_path / "srf").rglob("*.pdf") if '.pdf_store' not in path.parts) == \
+           ['THTUT01.pdf', 'THTUT01_talk.pdf']
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the run metrics
+
+Author: Ming Liu
+Description: Latency histogram buckets, error categories, the written metrics
+             file and the reset at the start of every run of one scraper.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import BASE_URL, make_scraper  # noqa: E402
+from metrics import HISTOGRAM_BOUNDS_MS, Metrics, error_category  # noqa: E402
+from transport import CircuitOpenError, TransportResponse  # noqa: E402
+
+
+def test_histogram_buckets_include_their_upper_bound():
+    metrics = Metrics()
+    for seconds in (0.0005, 0.001, 0.0015, 0.25, 45.0):
+        metrics.record('fetch_page', seconds)
+    stats = metrics.snapshot()['fetch_page']
+    assert stats['histogram_ms'] == {'<=1': 2, '<=2': 1, '<=500': 1, f">{HISTOGRAM_BOUNDS_MS[-1]}": 1}
+    assert stats['count'] == 5
+    assert stats['min_ms'] == 0.5 and stats['max_ms'] == 45000.0
+    assert stats['p50_ms'] == 1.5
+
+
+def test_error_categories():
+    response = TransportResponse(503, {}, b'', BASE_URL)
+    assert error_category(None) is None
+    assert error_category('not_pdf') == 'not_pdf'
+    assert error_category(404) == 'http_404'
+    assert error_category(requests.HTTPError(response=response)) == 'http_503'
+    assert error_category(requests.Timeout()) == 'timeout'
+    assert error_category(CircuitOpenError()) == 'circuit_open'
+    assert error_category(requests.ConnectionError()) == 'connection'
+    assert error_category(FileNotFoundError()) == 'io'
+    assert error_category(ValueError()) == 'ValueError'
+
+
+def test_timer_records_escaping_exceptions_by_category():
+    metrics = Metrics()
+    with pytest.raises(requests.Timeout):
+        with metrics.timer('probe_pdf'):
+            raise requests.Timeout()
+    with metrics.timer('probe_pdf') as span:
+        span.error = 'not_pdf'
+        span.bytes = 10
+    with metrics.timer('probe_pdf'):
+        pass
+    stats = metrics.snapshot()['probe_pdf']
+    assert (stats['count'], stats['errors'], stats['bytes']) == (3, 2, 10)
+    assert stats['error_categories'] == {'not_pdf': 1, 'timeout': 1}
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    with metrics.timer('download'):
+        pass
+    metrics.record('download', 1.0)
+    assert metrics.snapshot() == {}
+
+
+def test_written_metrics_file(tmp_path):
+    metrics = Metrics()
+    metrics.record('download', 0.004, nbytes=2048, error=404)
+    report = metrics.write(tmp_path / "Metrics.json", extra={'stats': {'errors': 1}})
+    written = json.loads((tmp_path / "Metrics.json").read_text(encoding='utf-8'))
+    assert written == report
+    assert written['histogram_bounds_ms'] == list(HISTOGRAM_BOUNDS_MS)
+    assert written['stats'] == {'errors': 1}
+    assert written['stages']['download']['bytes'] == 2048
+    assert written['stages']['download']['error_categories'] == {'http_404': 1}
+    assert written['stages']['download']['histogram_ms'] == {'<=5': 1}
+    assert not (tmp_path / "Metrics.json.tmp").exists()
+
+
+def test_reset_drops_measurements_and_restarts_the_clock(tmp_path):
+    metrics = Metrics()
+    metrics.record('download', 1.0)
+    metrics.started -= 3600
+    metrics.reset()
+    report = metrics.write(tmp_path / "Metrics.json")
+    assert report['stages'] == {}
+    assert report['elapsed_seconds'] < 3600
+
+
+def test_each_run_writes_its_own_metrics(tmp_path):
+    scraper = make_scraper(tmp_path, collect_metrics=True)
+    metrics_file = tmp_path / "NAPAC2025_Metrics.json"
+    counts = []
+    for _ in range(2):
+        scraper.run(resume=False, download=False)
+        counts.append(json.loads(metrics_file.read_text(encoding='utf-8'))['stages']['fetch_page']['count'])
+    assert counts[0] == counts[1] > 0
+
+    scraper.metrics.started -= 3600
+    scraper.export_saved()
+    written = json.loads(metrics_file.read_text(encoding='utf-8'))
+    assert 'fetch_page' not in written['stages']
+    assert written['elapsed_seconds'] < 3600
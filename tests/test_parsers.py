@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the session page parsers
+
+Author: Ming Liu
+Description: NAPAC2025 session pages (tests/fixtures/session_pages) parsed by
+             the single-pass structural parser and by the original regex
+             parser. The fixture pages were rebuilt from the page text dumps
+             (NAPAC2025_Data/Debug/*_page_text.txt) the original scraper saved,
+             which they reproduce exactly, and the regex parser returns
+             the records of NAPAC2025_Data/NAPAC2025_Complete_Index.json on them.
+             Every difference between the parsers must be a known defect of the
+             regex parser.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+from bench_parser import anchor_ids, classify_differences, make_parser, parity_problems, read_page, saved_pages  # noqa: E402
+
+PAGES = saved_pages(Path(__file__).resolve().parent / "fixtures" / "session_pages")
+RECORDED = ROOT / "NAPAC2025_Data"
+# Differences between the parsers on the fixture pages, by regex parser defect
+EXPECTED_DEFECTS = {
+    'FRYD': {'missed': ['FRYD01', 'FRYD02', 'FRYD03', 'FRYD04']},
+    'MOWP': {'missed': ['MOWP01']},
+    'MOYN': {'phantom': ['HEPS26'], 'missed': ['MOYN02'], 'title': ['MOYN01', 'MOYN03'],
+             'details': ['MOYN01', 'MOYN03']},
+    'SUP': {'missed': ['SUP008', 'SUP012', 'SUP016', 'SUP017', 'SUP026', 'SUP032', 'SUP034', 'SUP038', 'SUP058',
+                       'SUP059', 'SUP061', 'SUP062', 'SUP069', 'SUP074', 'SUP079'],
+            'title': ['SUP021', 'SUP022', 'SUP028', 'SUP042', 'SUP043', 'SUP070']},
+    'THXN': {'phantom': ['FRIB894'], 'title': ['THXN01'], 'details': ['THXN01']},
+    'TUBN': {'phantom': ['AWA314'], 'missed': ['TUBN02'], 'title': ['TUBN01', 'TUBN03'],
+             'details': ['TUBN01', 'TUBN03']},
+    'TUCD': {'phantom': ['FRIB327'], 'missed': ['TUCD01', 'TUCD02'], 'title': ['TUCD03'], 'details': ['TUCD03']},
+}
+RECORD_FIELDS = ('paper_id', 'title', 'authors', 'institutions', 'abstract', 'doi', 'paper_url', 'page_number')
+
+
+def parse(page):
+    scraper = make_parser()
+    session_id, html = read_page(page)
+    return scraper, session_id, scraper.parser.parse(html)
+
+
+def page(session_id):
+    return next(page for page in PAGES if read_page(page)[0] == session_id)
+
+
+@pytest.mark.parametrize('page', PAGES, ids=lambda page: page.name)
+def test_fixture_page_reproduces_recorded_page(page):
+    scraper, session_id, doc = parse(page)
+    assert doc.text() == (RECORDED / "Debug" / f"{session_id}_page_text.txt").read_text(encoding='utf-8')
+
+    index = json.loads((RECORDED / "NAPAC2025_Complete_Index.json").read_text(encoding='utf-8'))
+    recorded = next(s['papers'] for s in index['sessions'] if s['session_info']['id'] == session_id)
+    legacy = scraper.extract_papers_from_session_regex(doc, session_id)
+    assert [[paper[k] for k in RECORD_FIELDS] for paper in legacy] == \
+           [[paper[k] for k in RECORD_FIELDS] for paper in recorded]
+
+
+@pytest.mark.parametrize('page', PAGES, ids=lambda page: page.name)
+def test_parsers_differ_only_by_known_regex_defects(page):
+    scraper, session_id, doc = parse(page)
+    structural = [paper.to_dict() for paper in scraper.extract_papers_from_session(doc, session_id)]
+    legacy = [paper.to_dict() for paper in scraper.extract_papers_from_session_regex(doc, session_id)]
+
+    # The structural parser finds every paper block of the page, in page order
+    assert [paper['paper_id'] for paper in structural] == anchor_ids(doc)
+    defects, unexplained = classify_differences(structural, legacy, anchor_ids(doc))
+    assert unexplained == []
+    assert {kind: ids for kind, ids in defects.items() if ids} == EXPECTED_DEFECTS[session_id]
+
+
+def test_fixture_pages_present():
+    assert sorted(read_page(page)[0] for page in PAGES) == sorted(EXPECTED_DEFECTS)
+
+
+def test_title_and_page_number_come_from_the_header():
+    scraper, session_id, doc = parse(page('MOYN'))
+    papers = {paper['paper_id']: paper for paper in scraper.extract_papers_from_session(doc, session_id)}
+
+    assert papers['MOYN03']['title'] == "Commissioning of the HEPS"
+    assert papers['MOYN03']['page_number'] == '26'
+    assert papers['MOYN03']['abstract'].startswith("The High Energy Photon Source (HEPS)")
+    assert papers['MOYN03']['institutions'][-1] == "University of Chinese Academy of Sciences"
+    # A talk without a paper has no page number
+    assert papers['MOYN02']['title'] == "Advances in beam physics and technology for ultrafast electron diffraction"
+    assert papers['MOYN02']['page_number'] == ''
+
+
+def test_cross_listed_paper_uses_primary_code():
+    scraper, session_id, doc = parse(page('SUP'))
+    papers = {paper['paper_id']: paper for paper in scraper.extract_papers_from_session(doc, session_id)}
+
+    assert papers['SUP001']['paper_url'] == "https://meow.elettra.eu/97/pdf/TUP080.pdf"
+    assert papers['SUP001']['doi'] == "https://doi.org/10.18429/JACoW-NAPAC2025-TUP080"
+    assert papers['SUP001']['authors'] == ['H. Alamprese']
+    assert papers['SUP021']['title'] == "DESIGN OF AN OPTICAL AMPLIFIER FOR AMPLIFIED OSC IN IOTA FACILITY AT FERMILAB"
+    assert papers['SUP021']['paper_url'] == "https://meow.elettra.eu/97/pdf/WEP021.pdf"
+    # Titles starting with a digit are found as well
+    assert papers['SUP008']['title'] == "3D Theory of the Ion Channel Laser"
+
+
+def test_parity_check_counts_one_sided_papers():
+    paper = {'paper_id': 'MOP001', 'title': 'A title'}
+    assert parity_problems([paper], [paper]) == []
+    assert parity_problems([], [paper]) == ["regex only (1 IDs): MOP001"]
+    assert parity_problems([paper], []) == ["structural only (1 IDs): MOP001"]
+
+
+def test_regex_only_paper_with_a_block_is_unexplained():
+    paper = {'paper_id': 'MOP001', 'title': 'A title', 'abstract': '', 'authors': [], 'institutions': []}
+    defects, unexplained = classify_differences([], [paper], ['MOP001'])
+    assert unexplained == ["MOP001: found by the regex parser only"]
+    defects, unexplained = classify_differences([], [paper], [])
+    assert defects['phantom'] == ['MOP001'] and unexplained == []
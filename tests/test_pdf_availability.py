@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the batched PDF availability stage
+
+Author: Ming Liu
+Description: Parsing sends no requests. PDFs linked from a session page or
+             confirmed by the availability manifest are not probed; the other
+             candidate URLs of a session are deduplicated and probed in one batch
+             of HEAD requests, URLs probed for an earlier session are not probed
+             again, and only confirmed PDFs are cached.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import BASE_URL, PUBLISHED, FakeSite, index_sessions, make_scraper, pdf_url, site_pages  # noqa: E402
+
+UNLINKED = ('MOWP01', 'MOYN02', 'TUBN02')
+
+
+def availability(output_dir):
+    return {paper['paper_id']: paper['paper_available'] for session in index_sessions(output_dir)
+            for paper in session['papers']}
+
+
+def test_parsing_sends_no_probes(tmp_path):
+    site = FakeSite(site_pages())
+    scraper = make_scraper(tmp_path, site)
+    session = scraper.select_sessions(['MOYN'])[0]
+    papers = scraper.scrape_session(session)
+    assert [paper['paper_id'] for paper in papers] == ['MOYN01', 'MOYN02', 'MOYN03']
+    assert site.requested() == [BASE_URL + "html/session_list.html", session['url']]
+    # The published papers are linked from the page, so they need no probe later
+    assert scraper.linked_pdf_urls == {pdf_url('MOYN01'), pdf_url('MOYN03')}
+
+
+def test_only_unknown_urls_are_probed_in_one_batch_per_session(tmp_path):
+    # MOYN02 is published although its session page does not link it yet
+    site = FakeSite(site_pages(pdfs=PUBLISHED + ('MOYN02',)))
+    make_scraper(tmp_path, site).run(resume=False, download=False)
+
+    assert site.batches == [[('HEAD', pdf_url(paper_id))] for paper_id in UNLINKED]
+    assert site.requested('HEAD') == [pdf_url(paper_id) for paper_id in UNLINKED]
+    assert availability(tmp_path) == {'MOWP01': False, 'MOYN01': True, 'MOYN02': True, 'MOYN03': True,
+                                      'TUBN01': True, 'TUBN02': False, 'TUBN03': True}
+    manifest = json.loads((tmp_path / "pdf_availability.json").read_text(encoding='utf-8'))
+    assert sorted(manifest) == sorted(pdf_url(paper_id) for paper_id in PUBLISHED + ('MOYN02',))
+
+    # The next run probes only the URLs that were not confirmed
+    site.calls.clear()
+    site.batches.clear()
+    make_scraper(tmp_path, site).run(resume=False, download=False)
+    assert site.batches == [[('HEAD', pdf_url('MOWP01'))], [('HEAD', pdf_url('TUBN02'))]]
+
+
+def test_cross_listed_papers_share_one_probe(tmp_path):
+    site = FakeSite({pdf_url('TUP080'): b'%PDF-1.4'})
+    scraper = make_scraper(tmp_path, site)
+    # SUP001 is a cross-listing of TUP080 and shares its PDF; TUP099 is not published
+    papers = [{'paper_id': paper_id, 'paper_url': pdf_url(code), 'paper_available': False}
+              for paper_id, code in (('SUP001', 'TUP080'), ('TUP080', 'TUP080'), ('TUP099', 'TUP099'))]
+    papers.append({'paper_id': 'MOWP01', 'paper_url': '', 'paper_available': False})
+    scraper.resolve_pdf_availability(papers)
+    assert site.batches == [[('HEAD', pdf_url('TUP080')), ('HEAD', pdf_url('TUP099'))]]
+    assert [paper['paper_available'] for paper in papers] == [True, True, False, False]
+
+    # A later session of the same run reuses both answers without probing again
+    later = [{'paper_id': paper_id, 'paper_url': pdf_url(code), 'paper_available': False}
+             for paper_id, code in (('SUP002', 'TUP080'), ('SUP003', 'TUP099'))]
+    scraper.resolve_pdf_availability(later)
+    assert len(site.batches) == 1
+    assert [paper['paper_available'] for paper in later] == [True, False]
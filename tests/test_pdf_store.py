@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the content-addressed PDF store
+
+Author: Ming Liu
+Description: A paper listed by two sessions is fetched once and hardlinked into
+             both session folders, an updated file replaces its blob and the
+             superseded blob is pruned, and symlinked views keep their blobs.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fake_site import SESSIONS, FakeSite, make_scraper, pdf_body, pdf_url, session_url, site_pages  # noqa: E402
+from download_manager import sha256_file  # noqa: E402
+from pdf_store import PdfStore  # noqa: E402
+
+
+def shared_site():
+    """Stand-in site listing TUBN01 as a cross-listing of MOYN01, whose PDF it shares."""
+    pages = site_pages()
+    pages[session_url('TUBN')] = pages[session_url('TUBN')].replace(
+        b'<a href="../../pdf/TUBN01.pdf"></a></div>',
+        b'<a href="../../pdf/MOYN01.pdf"></a></div><div class=\'contrib-subheader\'>'
+        b'<a data-href="session/1164-moyn/index.html#moyn01">MOYN01</a>use link to access more material '
+        b'from this paper\'s primary code</div>')
+    return FakeSite(pages)
+
+
+def crawl(output_dir, site, **options):
+    scraper = make_scraper(output_dir, site, pdf_store=True, **options)
+    scraper.run(resume=False)
+    return scraper
+
+
+def paper_path(output_dir, session_id, paper_id):
+    name = next(name for _, sid, name in SESSIONS if sid == session_id)
+    return output_dir / "Papers" / f"{session_id} - {name}" / f"{paper_id}.pdf"
+
+
+def test_shared_paper_is_fetched_once_and_hardlinked(tmp_path):
+    site = shared_site()
+    scraper = crawl(tmp_path, site)
+
+    assert site.requested('GET').count(pdf_url('MOYN01')) == 1
+    assert scraper.pdf_store.stats['shared_views'] == 1
+    moyn01, tubn01 = paper_path(tmp_path, 'MOYN', 'MOYN01'), paper_path(tmp_path, 'TUBN', 'TUBN01')
+    assert os.path.samefile(moyn01, tubn01)
+    blob = scraper.pdf_store.blob_path(sha256_file(moyn01))
+    assert os.path.samefile(blob, moyn01)
+    assert blob.stat().st_nlink == 3
+    assert moyn01.read_bytes() == pdf_body('MOYN01')
+
+
+def test_updated_file_replaces_its_blob_and_prunes_the_old_one(tmp_path):
+    site = shared_site()
+    crawl(tmp_path, site, use_http_cache=True)
+    blobs = tmp_path / ".pdf_store" / "blobs"
+    old_blob = next(path for path in blobs.glob('*/*.pdf') if path.read_bytes() == pdf_body('MOYN01'))
+
+    site.pages[pdf_url('MOYN01')] = pdf_body('MOYN01', version=2)
+    scraper = crawl(tmp_path, site, use_http_cache=True)
+
+    assert not old_blob.exists()
+    assert len(list(blobs.glob('*/*.pdf'))) == len(scraper.pdf_store.entries)
+    for view in (paper_path(tmp_path, 'MOYN', 'MOYN01'), paper_path(tmp_path, 'TUBN', 'TUBN01')):
+        assert view.read_bytes() == pdf_body('MOYN01', version=2)
+    assert scraper.download_manifest.is_intact(paper_path(tmp_path, 'TUBN', 'TUBN01'))
+
+
+def test_symlinked_views_keep_unreferenced_blobs(tmp_path):
+    store = PdfStore(tmp_path / ".pdf_store", link_mode='symlink')
+    for version in (1, 2):
+        download = tmp_path / "incoming.pdf"
+        download.write_bytes(pdf_body('MOYN01', version))
+        entry = store.ingest('MOYN01.pdf', pdf_url('MOYN01'), download, sha256_file(download), download.stat().st_size)
+        view = tmp_path / "Papers" / f"view{version}.pdf"
+        assert store.link(entry, view) == 'symlink'
+        assert store.link(entry, view) == 'existing'
+
+    # The first view still points at the superseded blob
+    assert store.prune() == 0
+    assert (tmp_path / "Papers" / "view1.pdf").read_bytes() == pdf_body('MOYN01', 1)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the records and JSON serializers
+
+Author: Ming Liu
+Description: Every installed serializer writes the same bytes as the standard
+             library one, single-line and pretty-printed, and reads its own
+             output back to the same data.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from records import SERIALIZERS, Paper, Session, create_serializer  # noqa: E402
+
+INSTALLED = [name for name in SERIALIZERS if importlib.util.find_spec(name)]
+
+
+def session_data():
+    paper = Paper('MOYN01', 'Commissioning of the "HEPS" \\ Ø-ring', authors=['Hans-Jürgen Müller', 'A. Smith'],
+                  institutions=['Institute of High Energy Physics'], paper_url='https://example.org/pdf/MOYN01.pdf',
+                  doi='https://doi.org/10.18429/JACoW-NAPAC2025-MOYN01', page_number='26', paper_available=True)
+    return {
+        'session_info': Session('MOYN', 'MOYN - Opening Session', 'https://example.org/session/moyn/'),
+        'schema_version': 1,
+        'papers': [paper, Paper('MOYN02', 'Ta\tb\nline and emoji \U0001F680')],
+        'empty': {'list': [], 'dict': {}, 'none': None},
+    }
+
+
+@pytest.mark.parametrize('indent', [False, True], ids=['single-line', 'indented'])
+@pytest.mark.parametrize('name', INSTALLED)
+def test_serializers_write_identical_json(name, indent):
+    data = session_data()
+    expected = create_serializer('json').dumps(data, indent=indent)
+    assert create_serializer(name).dumps(data, indent=indent) == expected
+
+
+@pytest.mark.parametrize('name', INSTALLED)
+def test_serializer_round_trip(name):
+    serializer = create_serializer(name)
+    data = session_data()
+    plain = {**data, 'session_info': data['session_info'].to_dict(),
+             'papers': [paper.to_dict() for paper in data['papers']]}
+    for indent in (False, True):
+        text = serializer.dumps(data, indent=indent)
+        assert serializer.loads(text) == plain
+        assert serializer.loads(text.encode('utf-8')) == plain
+    assert Paper.from_dict(serializer.loads(serializer.dumps(data['papers'][0]))) == data['papers'][0]
+
+
+def test_single_line_output_has_no_spaces_after_separators():
+    assert create_serializer('json').dumps({'a': [1, 2], 'b': 'c, d: e'}) == '{"a":[1,2],"b":"c, d: e"}'
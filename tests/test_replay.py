@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the record / replay transports
+
+Author: Ming Liu
+Description: A fake site serving the fixture session pages is recorded once and
+             replayed without network access: transient 503s must not be archived,
+             a re-recording must replace stale entries, and a replayed scraper run
+             (from Python or the command line) must reproduce the recorded run.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+from bench_pipeline import MockProceedingsServer  # noqa: E402
+from fake_site import BASE_URL, SESSION_LIST, FakeSite, index_sessions, make_scraper, site_pages  # noqa: E402
+from replay import RecordingTransport, ReplayTransport  # noqa: E402
+from scraper import main  # noqa: E402
+from transport import HostRateLimiter  # noqa: E402
+
+
+def test_retryable_response_is_not_recorded(tmp_path):
+    url = BASE_URL + "html/session_list.html"
+    archive = tmp_path / "corpus.zip"
+    recorder = RecordingTransport(FakeSite(site_pages(), flaky=[url]), archive)
+    limiter = HostRateLimiter(0, 1, backoff_base=0, backoff_cap=0)
+    response = limiter.request(recorder, 'GET', url)
+    recorder.close()
+    assert response.status_code == 200
+
+    replay = ReplayTransport(archive)
+    try:
+        replayed = replay.request('GET', url)
+        assert replayed.status_code == 200
+        assert replayed.content == SESSION_LIST.encode('utf-8')
+    finally:
+        replay.close()
+
+
+def test_rerecording_replaces_stale_entries(tmp_path):
+    url = BASE_URL + "html/session_list.html"
+    archive = tmp_path / "corpus.zip"
+    for body in (b'old listing', b'new listing'):
+        recorder = RecordingTransport(FakeSite({url: body}), archive)
+        recorder.request('GET', url)
+        recorder.close()
+
+    replay = ReplayTransport(archive)
+    try:
+        assert replay.request('GET', url).content == b'new listing'
+        # The archive is compacted: one metadata and one body entry per request
+        assert len(replay._zip.namelist()) == 2
+    finally:
+        replay.close()
+
+
+def test_missing_entry_replays_as_404(tmp_path):
+    archive = tmp_path / "corpus.zip"
+    recorder = RecordingTransport(FakeSite(site_pages()), archive)
+    recorder.request('GET', BASE_URL + "html/session_list.html")
+    recorder.close()
+
+    replay = ReplayTransport(archive)
+    try:
+        response = replay.request('GET', BASE_URL + "pdf/MOYN02.pdf")
+        assert response.status_code == 404
+        assert response.headers['X-Replay'] == 'missing'
+    finally:
+        replay.close()
+
+
+def crawl(output_dir, site=None, **options):
+    make_scraper(output_dir, site, **options).run(resume=False, download=False)
+    return index_sessions(output_dir)
+
+
+def test_replayed_run_matches_recorded_run(tmp_path):
+    archive = tmp_path / "corpus.zip"
+    site = FakeSite(site_pages(), flaky=[BASE_URL + "session/1173-tubn/index.html"])
+    limiter = HostRateLimiter(0, 1, backoff_base=0, backoff_cap=0)
+    recorded = crawl(tmp_path / "recorded", site, rate_limiter=limiter, record_archive=str(archive))
+    assert [(session['session_info']['id'], [paper['paper_id'] for paper in session['papers']])
+            for session in recorded] == [('MOWP', ['MOWP01']), ('MOYN', ['MOYN01', 'MOYN02', 'MOYN03']),
+                                         ('TUBN', ['TUBN01', 'TUBN02', 'TUBN03'])]
+
+    calls = len(site.calls)
+    assert crawl(tmp_path / "replayed", replay_archive=str(archive)) == recorded
+    assert len(site.calls) == calls
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['scraper.py', '--log-file', '', '--quiet', '--requests-per-second', '0',
+                                      *args])
+    return main()
+
+
+def test_cli_records_and_replays_a_run(tmp_path, monkeypatch):
+    archive = tmp_path / "corpus.zip"
+    with MockProceedingsServer() as server:
+        base_url = server.root_url + "97/"
+        for url, body in site_pages().items():
+            server.pages[url.replace(BASE_URL, "/97/")] = body
+        assert run_cli(monkeypatch, '--base-url', base_url, '--output-dir', str(tmp_path / "recorded"),
+                       '--record', str(archive), '--record-pdfs', 'scrape', '--no-resume') == 0
+
+    # The server is gone: the replayed run reads every page and PDF from the archive
+    assert run_cli(monkeypatch, '--base-url', base_url, '--output-dir', str(tmp_path / "replayed"),
+                   '--replay', str(archive), 'scrape', '--no-resume') == 0
+
+    def outputs(output_dir):
+        pdfs = sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob("*.pdf"))
+        return index_sessions(output_dir), pdfs
+
+    recorded, recorded_pdfs = outputs(tmp_path / "recorded")
+    assert [session['session_info']['id'] for session in recorded] == ['MOWP', 'MOYN', 'TUBN']
+    assert recorded_pdfs
+    assert outputs(tmp_path / "replayed") == (recorded, recorded_pdfs)
+
+
+def test_cli_rejects_record_pdfs_without_record(monkeypatch):
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, '--record-pdfs', 'discover')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the per-host request scheduler
+
+Author: Ming Liu
+Description: Circuit breaker probes that end in an unexpected exception, and the
+             async transport's per-host concurrency under the AIMD limit.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from transport import AsyncHTTPTransport, CircuitOpenError, HostRateLimiter, TransportResponse  # noqa: E402
+
+URL = "https://meow.example.org/97/pdf/MOP001.pdf"
+
+
+def test_failed_probe_exception_reopens_circuit():
+    limiter = HostRateLimiter(0, 2, failure_threshold=1, recovery_time=3600)
+    limiter.feedback(URL, error=ConnectionError("refused"))
+    with pytest.raises(CircuitOpenError):
+        limiter.check_circuit(URL)
+
+    # The cooldown is over: one probe is let through and fails with a non-request exception
+    limiter.recovery_time = 0
+    with pytest.raises(ValueError):
+        with limiter.slot(URL):
+            raise ValueError("unexpected")
+    assert limiter.snapshot()['meow.example.org']['circuit'] == 'open'
+
+    # The circuit does not stay stuck probing: the next probe closes it
+    with limiter.slot(URL):
+        pass
+    limiter.feedback(URL, response=TransportResponse(200, {}, b'', URL))
+    assert limiter.snapshot()['meow.example.org']['circuit'] == 'closed'
+
+
+def test_async_requests_respect_aimd_limit():
+    httpx = pytest.importorskip('httpx')
+    active = {'now': 0, 'max': 0}
+
+    class Body(httpx.AsyncByteStream):
+        # Streamed like a network response, so httpx records the elapsed time on close
+        async def __aiter__(self):
+            yield b'slow down'
+
+    async def handler(request):
+        active['now'] += 1
+        active['max'] = max(active['max'], active['now'])
+        await asyncio.sleep(0.3)
+        active['now'] -= 1
+        return httpx.Response(429, stream=Body())
+
+    limiter = HostRateLimiter(0, 4, max_retries=0)
+    # Throttling halves the host's concurrency limit from 4 to 2 (and paces requests 50 ms apart)
+    limiter.feedback(URL, response=TransportResponse(429, {}, b'', URL))
+    transport = AsyncHTTPTransport(max_connections=8, http2=False)
+    try:
+        transport._run(transport._client.aclose())
+        transport._client = transport._run(_mock_client(httpx, handler))
+        results = transport.request_many([('GET', f"{URL}?n={n}", {}) for n in range(8)], limiter=limiter)
+    finally:
+        transport.close()
+
+    assert [result.status_code for result in results] == [429] * 8
+    assert active['max'] <= 2
+    assert limiter.snapshot()['meow.example.org']['concurrency'] <= 2
+
+
+async def _mock_client(httpx, handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
@@ -0,0 +1,772 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP Transport Layer for the NAPAC2025 Scraper
+
+Author: Ming Liu
+Description: Pluggable HTTP transports used by the scraper for every network call.
+             The default transport wraps a synchronous requests.Session; an optional
+             asyncio transport (built on httpx, HTTP/2 when the 'h2' package is
+             installed) multiplexes batches of HEAD checks and downloads over a few
+             pooled keep-alive connections.
+
+Every request is scheduled by HostRateLimiter, an adaptive per-host budget
+(token bucket, AIMD concurrency, Retry-After, jittered retries and a circuit
+breaker).
+
+Both transports return objects exposing the requests.Response subset used by the
+scraper (status_code, headers, text, content, iter_content, raise_for_status) and
+raise requests exceptions, so callers do not depend on the backend in use.
+"""
+
+import asyncio
+import email.utils
+import importlib.util
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# A batch request: (method, url, extra keyword arguments for Transport.request)
+RequestSpec = Tuple[str, str, Dict[str, Any]]
+
+
+# Statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+# Statuses telling the client to slow down
+THROTTLE_STATUS = frozenset({429, 503})
+# Adaptive budget bounds: request interval after throttling (seconds) and the minimum
+# time between two multiplicative decreases
+MIN_THROTTLED_INTERVAL = 0.05
+MAX_THROTTLED_INTERVAL = 5.0
+DECREASE_WINDOW = 1.0
+# Seconds between re-checks of a host's free slots by async requests waiting for one
+SLOT_POLL_INTERVAL = 0.05
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without contacting a host whose circuit breaker is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable(outcome: Union[Any, Exception]) -> bool:
+    """True for timeouts, connection errors and throttling / transient 5xx responses; never for 404 and friends."""
+    if isinstance(outcome, CircuitOpenError):
+        return False
+    if isinstance(outcome, (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(outcome, Exception):
+        return False
+    return outcome.status_code in RETRYABLE_STATUS
+
+
+class HostRateLimiter:
+    """
+    Adaptive per-host request scheduler shared by all worker threads.
+
+    Each host gets:
+    - a token bucket pacing request starts (``requests_per_second``, ``burst``)
+    - an AIMD concurrency limit between 1 and ``max_in_flight``: it grows by one
+      slot per window of successful requests and is halved when responses slow
+      down sharply or the server answers 429/503
+    - a pause honouring Retry-After headers; throttling also halves the request
+      rate, which recovers gradually to the configured budget
+    - a circuit breaker that stops contacting a host after repeated connection
+      failures or 5xx responses and lets a single probe through after a cooldown
+
+    ``request`` sends a request within this budget and retries retryable errors
+    with jittered exponential backoff. Individual hosts can be given their own
+    budget with ``set_host_limit``.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0, max_in_flight: int = 4, burst: int = 1,
+                 max_retries: int = 3, backoff_base: float = 1.0, backoff_cap: float = 30.0,
+                 max_retry_after: float = 120.0, failure_threshold: int = 5, recovery_time: float = 30.0,
+                 latency_factor: float = 3.0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_second: Maximum request start rate per host (<= 0 disables pacing)
+            max_in_flight: Maximum concurrent requests per host
+            burst: Token bucket size (requests that may start back to back after an idle period)
+            max_retries: Retries of a retryable error before giving up
+            backoff_base: Base delay of the exponential backoff in seconds
+            backoff_cap: Maximum backoff delay in seconds
+            max_retry_after: Longest Retry-After delay honoured by a retry (longer ones fail the request)
+            failure_threshold: Consecutive failures that open a host's circuit breaker
+            recovery_time: Seconds an open circuit waits before letting a probe request through
+            latency_factor: Latency above this multiple of the host's baseline counts as congestion
+        """
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.max_in_flight = max(1, max_in_flight)
+        self.burst = max(1, burst)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_after = max_retry_after
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_time = recovery_time
+        self.latency_factor = latency_factor
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+        self._host_limits: Dict[str, Tuple[float, int]] = {}
+
+    def set_host_limit(self, host: str, requests_per_second: float, max_in_flight: int):
+        """
+        Give one host its own budget; call before the first request to that host.
+
+        Args:
+            host: Host name with optional port, as in the URL (e.g. 'proceedings.jacow.org')
+            requests_per_second: Maximum request start rate for this host (<= 0 disables pacing)
+            max_in_flight: Maximum concurrent requests to this host
+        """
+        with self._lock:
+            self._host_limits[host] = (1.0 / requests_per_second if requests_per_second > 0 else 0.0,
+                                       max(1, max_in_flight))
+            self._hosts.pop(host, None)
+
+    def host_max_in_flight(self, url: str) -> int:
+        """Maximum concurrent requests to the host of ``url``."""
+        with self._lock:
+            return self._host_limits.get(urlparse(url).netloc, (0.0, self.max_in_flight))[1]
+
+    def _host_state(self, host: str) -> Dict[str, Any]:
+        with self._lock:
+            if host not in self._hosts:
+                min_interval, max_in_flight = self._host_limits.get(host, (self.min_interval, self.max_in_flight))
+                self._hosts[host] = {
+                    'host': host,
+                    'condition': threading.Condition(self._lock),
+                    'min_interval': min_interval,   # configured budget
+                    'interval': min_interval,       # current (possibly throttled) budget
+                    'theoretical_arrival': 0.0,     # token bucket state (GCRA form)
+                    'paused_until': 0.0,
+                    'max_in_flight': max_in_flight,
+                    'limit': float(max_in_flight),  # AIMD concurrency limit
+                    'in_flight': 0,
+                    'latency': None,                # EWMA of response latency
+                    'baseline': None,               # slowly rising minimum latency
+                    'last_decrease': 0.0,
+                    'failures': 0,
+                    'circuit': 'closed',
+                    'opened_at': 0.0,
+                    'probing': False,
+                    'counters': {'requests': 0, 'retries': 0, 'throttled': 0, 'errors': 0, 'circuit_opened': 0}
+                }
+            return self._hosts[host]
+
+    def reserve(self, url: str) -> float:
+        """
+        Take a token for a request to the host of ``url``.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Seconds the caller must wait before starting the request
+        """
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            now = time.monotonic()
+            interval = state['interval']
+            # A full bucket lets 'burst' requests start back to back
+            start = max(now, state['paused_until'], state['theoretical_arrival'] - (self.burst - 1) * interval)
+            state['theoretical_arrival'] = max(state['theoretical_arrival'], start) + interval
+            state['counters']['requests'] += 1
+        return start - now
+
+    def check_circuit(self, url: str):
+        """
+        Raise CircuitOpenError if the host's circuit is open; after the cooldown one probe is let through.
+
+        Args:
+            url: URL about to be requested
+        """
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            self._admit(state)
+
+    def _admit(self, state: Dict[str, Any]) -> bool:
+        # Called with the lock held; True if the request is the half-open circuit's probe
+        if state['circuit'] == 'closed':
+            return False
+        if state['circuit'] == 'open' and time.monotonic() - state['opened_at'] >= self.recovery_time:
+            state['circuit'] = 'half-open'
+        if state['circuit'] == 'half-open' and not state['probing']:
+            state['probing'] = True
+            return True
+        raise CircuitOpenError(f"Circuit open for {state['host']} after {state['failures']} consecutive failures")
+
+    def _abandon(self, state: Dict[str, Any], probe: bool):
+        # Called with the lock held when a request ends without feedback (e.g. an unexpected
+        # exception): its slot is freed and an unanswered probe counts as failed
+        state['in_flight'] -= 1
+        if probe and state['probing']:
+            state['probing'] = False
+            if state['circuit'] == 'half-open':
+                state['circuit'] = 'open'
+                state['opened_at'] = time.monotonic()
+                state['counters']['circuit_opened'] += 1
+        state['condition'].notify_all()
+
+    def try_acquire(self, url: str) -> Tuple[bool, bool]:
+        """
+        Take a request slot for the host of ``url`` without waiting.
+
+        Free the slot with ``release`` once the outcome was reported with ``feedback``.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            (acquired, probe): whether a slot under the host's current concurrency limit
+            was free, and whether the request is the half-open circuit's probe
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            if state['in_flight'] >= max(1, int(state['limit'])):
+                return False, False
+            probe = self._admit(state)
+            state['in_flight'] += 1
+            return True, probe
+
+    def release(self, url: str, probe: bool = False, completed: bool = True):
+        """
+        Free a slot taken with ``try_acquire``.
+
+        Args:
+            url: Requested URL
+            probe: The request was the half-open circuit's probe
+            completed: False if the request ended without ``feedback``; an unanswered probe then
+                       counts as failed instead of keeping the circuit half-open
+        """
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            if completed:
+                state['in_flight'] -= 1
+                state['condition'].notify_all()
+            else:
+                self._abandon(state, probe)
+
+    @contextmanager
+    def slot(self, url: str):
+        """
+        Hold a request slot for the host of ``url`` for the duration of the block.
+
+        Waits for a free slot under the host's current concurrency limit and for a
+        token of its rate budget. Report the outcome with ``feedback``.
+
+        Args:
+            url: URL about to be requested
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            while state['in_flight'] >= max(1, int(state['limit'])):
+                state['condition'].wait()
+            probe = self._admit(state)
+            state['in_flight'] += 1
+        try:
+            delay = self.reserve(url)
+            if delay > 0:
+                time.sleep(delay)
+            yield
+        except BaseException:
+            # Any exception, not only request errors, must not leave the circuit probing forever;
+            # a probe whose outcome was already reported is not affected
+            with self._lock:
+                self._abandon(state, probe)
+            raise
+        else:
+            with self._lock:
+                state['in_flight'] -= 1
+                state['condition'].notify_all()
+
+    def feedback(self, url: str, response=None, error: Optional[Exception] = None,
+                 latency: Optional[float] = None):
+        """
+        Adapt the host's budget to the outcome of a request.
+
+        Args:
+            url: Requested URL
+            response: Response received (None on error)
+            error: Exception raised instead of a response
+            latency: Seconds until the response headers arrived
+        """
+        state = self._host_state(urlparse(url).netloc)
+        status = response.status_code if response is not None else None
+        retry_after = parse_retry_after(response.headers.get('retry-after')) if response is not None else None
+        failed = error is not None or (status is not None and status >= 500)
+        with self._lock:
+            now = time.monotonic()
+            if state['probing']:
+                state['probing'] = False
+                if state['circuit'] == 'half-open' and not failed:
+                    state['circuit'] = 'closed'
+                    state['failures'] = 0
+
+            if failed:
+                state['counters']['errors'] += 1
+                state['failures'] += 1
+                if state['circuit'] == 'half-open' or state['failures'] >= self.failure_threshold:
+                    if state['circuit'] != 'open':
+                        state['counters']['circuit_opened'] += 1
+                    state['circuit'] = 'open'
+                    state['opened_at'] = now
+            else:
+                state['failures'] = 0
+
+            if status in THROTTLE_STATUS:
+                # Multiplicative decrease of both concurrency and rate, once per decrease window
+                # so a burst of throttled responses to requests already in flight counts once
+                state['counters']['throttled'] += 1
+                if now - state['last_decrease'] > DECREASE_WINDOW:
+                    state['limit'] = max(1.0, state['limit'] / 2)
+                    state['interval'] = min(max(state['interval'] * 2, MIN_THROTTLED_INTERVAL), MAX_THROTTLED_INTERVAL)
+                    state['last_decrease'] = now
+                if retry_after:
+                    state['paused_until'] = max(state['paused_until'], now + min(retry_after, self.max_retry_after))
+            elif not failed and status is not None:
+                congested = False
+                if latency is not None:
+                    state['latency'] = latency if state['latency'] is None else 0.8 * state['latency'] + 0.2 * latency
+                    baseline = state['baseline']
+                    state['baseline'] = latency if baseline is None else min(latency, baseline * 1.01)
+                    congested = state['latency'] > self.latency_factor * state['baseline'] and state['latency'] > 0.05
+                if congested and now - state['last_decrease'] > DECREASE_WINDOW:
+                    state['limit'] = max(1.0, state['limit'] / 2)
+                    state['last_decrease'] = now
+                elif not congested:
+                    # Additive increase: about one more slot per window of successful requests
+                    state['limit'] = min(float(state['max_in_flight']), state['limit'] + 1 / state['limit'])
+                    if state['interval'] > state['min_interval']:
+                        state['interval'] = max(state['min_interval'], state['interval'] * 0.9)
+                        if state['interval'] < 0.01:
+                            state['interval'] = state['min_interval']
+            state['condition'].notify_all()
+
+    def retry_delay(self, url: str, attempt: int, response=None) -> Optional[float]:
+        """
+        Delay before retrying a request, or None if it should not be retried.
+
+        Uses the response's Retry-After header when present, otherwise exponential
+        backoff with jitter (half fixed, half random).
+
+        Args:
+            url: Requested URL
+            attempt: Zero-based number of the failed attempt
+            response: Response of the failed attempt, if any
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        if attempt >= self.max_retries:
+            return None
+        retry_after = parse_retry_after(response.headers.get('retry-after')) if response is not None else None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = retry_after + random.uniform(0, self.backoff_base / 2)
+        else:
+            backoff = min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+        state = self._host_state(urlparse(url).netloc)
+        with self._lock:
+            state['counters']['retries'] += 1
+        return delay
+
+    def request(self, transport: 'Transport', method: str, url: str, **kwargs):
+        """
+        Send a request within the host's budget, retrying retryable errors.
+
+        Args:
+            transport: Transport performing the request
+            method: HTTP method
+            url: URL to request
+            **kwargs: Extra arguments passed to Transport.request
+
+        Returns:
+            Response of the last attempt (may have a retryable error status if retries ran out)
+
+        Raises:
+            requests.RequestException: Non-retryable errors, or the last error once retries ran out
+        """
+        attempt = 0
+        while True:
+            start = None
+            try:
+                with self.slot(url):
+                    start = time.monotonic()
+                    response = transport.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                if start is None:
+                    raise  # circuit open: the host was not contacted
+                self.feedback(url, error=e)
+                delay = self.retry_delay(url, attempt) if is_retryable(e) else None
+                if delay is None:
+                    raise
+                self._log_retry(method, url, attempt, delay, e)
+            else:
+                self.feedback(url, response=response, latency=time.monotonic() - start)
+                delay = self.retry_delay(url, attempt, response) if is_retryable(response) else None
+                if delay is None:
+                    return response
+                response.close()
+                self._log_retry(method, url, attempt, delay, f"HTTP {response.status_code}")
+            time.sleep(delay)
+            attempt += 1
+
+    def _log_retry(self, method: str, url: str, attempt: int, delay: float, reason: Any):
+        logging.getLogger(__name__).warning(f"Retrying {method} {url} in {delay:.1f}s "
+                                            f"(attempt {attempt + 1}/{self.max_retries}): {reason}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current budget and counters of every host."""
+        with self._lock:
+            return {host: {
+                'concurrency': int(state['limit']),
+                'requests_per_second': round(1 / state['interval'], 2) if state['interval'] else None,
+                'latency': round(state['latency'], 4) if state['latency'] is not None else None,
+                'circuit': state['circuit'],
+                **state['counters']
+            } for host, state in self._hosts.items()}
+
+
+class TransportResponse:
+    """Fully buffered HTTP response with the requests.Response interface used by the scraper."""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, url: str,
+                 http_version: str = 'HTTP/1.1', encoding: Optional[str] = None,
+                 elapsed: Optional[timedelta] = None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.http_version = http_version
+        self._encoding = encoding
+        # Time until the response arrived, like requests.Response.elapsed
+        self.elapsed = elapsed or timedelta(0)
+
+    @property
+    def encoding(self) -> str:
+        if self._encoding:
+            return self._encoding
+        content_type = self.headers.get('content-type', '')
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+    def iter_content(self, chunk_size: int = 8192):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self):
+        pass
+
+
+class Transport:
+    """Base class for HTTP transports."""
+
+    name = 'base'
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30, stream: bool = False):
+        """
+        Perform a single HTTP request.
+
+        Args:
+            method: HTTP method ('GET', 'HEAD', ...)
+            url: URL to request
+            headers: Extra request headers
+            timeout: Timeout in seconds
+            stream: Whether the body will be consumed with iter_content
+
+        Returns:
+            Response object (requests.Response or TransportResponse)
+        """
+        raise NotImplementedError
+
+    def request_many(self, specs: List[RequestSpec],
+                     limiter: Optional[HostRateLimiter] = None) -> List[Union[Any, Exception]]:
+        """
+        Perform a batch of requests concurrently.
+
+        Args:
+            specs: List of (method, url, kwargs) tuples
+            limiter: Optional per-host rate limiter applied to every request
+
+        Returns:
+            List of responses or exceptions, in the same order as ``specs``
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Persist any buffered state (e.g. a recording archive) at the end of a run."""
+        pass
+
+    def close(self):
+        """Release pooled connections."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """Default synchronous transport backed by a pooled requests.Session."""
+
+    name = 'requests'
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, max_connections: int = 4):
+        """
+        Initialize the transport.
+
+        Args:
+            headers: Default request headers
+            max_connections: Connection pool size per host
+        """
+        self.max_connections = max(1, max_connections)
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # Size the connection pool so parallel workers can reuse keep-alive connections
+        adapter = HTTPAdapter(pool_maxsize=self.max_connections)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30, stream: bool = False):
+        return self.session.request(method, url, headers=headers, timeout=timeout, stream=stream)
+
+    def request_many(self, specs: List[RequestSpec],
+                     limiter: Optional[HostRateLimiter] = None) -> List[Union[Any, Exception]]:
+        def send(spec: RequestSpec):
+            method, url, kwargs = spec
+            try:
+                if limiter:
+                    return limiter.request(self, method, url, **kwargs)
+                return self.request(method, url, **kwargs)
+            except Exception as e:
+                return e
+
+        if limiter:
+            # One worker per request slot of every host in the batch
+            hosts = {urlparse(url).netloc: url for _, url, _ in specs}
+            workers = max(1, sum(limiter.host_max_in_flight(url) for url in hosts.values()))
+        else:
+            workers = self.max_connections
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(send, specs))
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncHTTPTransport(Transport):
+    """
+    asyncio transport built on httpx.AsyncClient.
+
+    The event loop runs in a background thread, so the scraper's synchronous code
+    can call request() directly while request_many() multiplexes whole batches over
+    the shared connection pool (HTTP/2 streams when 'h2' is installed). Response
+    bodies are fully buffered, which is fine for proceedings pages and PDFs.
+    """
+
+    name = 'async'
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, max_connections: int = 4,
+                 http2: bool = True):
+        """
+        Initialize the transport.
+
+        Args:
+            headers: Default request headers
+            max_connections: Maximum pooled connections
+            http2: Negotiate HTTP/2 when the 'h2' package is available
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("The async transport requires httpx: pip install 'httpx[http2]'")
+        if http2 and importlib.util.find_spec('h2') is None:
+            http2 = False
+        # httpx logs every request at INFO level; keep the scraper log readable
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+        self._httpx = httpx
+        self.http2 = http2
+        self.max_connections = max(1, max_connections)
+        self._headers = dict(headers or DEFAULT_HEADERS)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='async-transport', daemon=True)
+        self._thread.start()
+        self._client = self._run(self._create_client())
+        self._host_conditions: Dict[str, asyncio.Condition] = {}
+
+    async def _create_client(self):
+        limits = self._httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections)
+        return self._httpx.AsyncClient(headers=self._headers, limits=limits, http2=self.http2,
+                                       follow_redirects=True)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                    timeout: float = 30, stream: bool = False,
+                    limiter: Optional[HostRateLimiter] = None) -> TransportResponse:
+        if limiter:
+            return await self._send_scheduled(method, url, headers, timeout, stream, limiter)
+
+        try:
+            response = await self._client.request(method, url, headers=headers, timeout=timeout)
+        except self._httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except self._httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return TransportResponse(response.status_code, dict(response.headers), response.content,
+                                 str(response.url), response.http_version, elapsed=response.elapsed)
+
+    async def _send_scheduled(self, method: str, url: str, headers: Optional[Dict[str, str]], timeout: float,
+                              stream: bool, limiter: HostRateLimiter) -> TransportResponse:
+        # Same budget, feedback and retry policy as HostRateLimiter.request, without blocking the event loop
+        host = urlparse(url).netloc
+        condition = self._host_conditions.setdefault(host, asyncio.Condition())
+        attempt = 0
+        while True:
+            # Wait for a slot under the host's AIMD concurrency limit (shared with synchronous callers,
+            # whose releases are not signalled here, hence the periodic re-check)
+            async with condition:
+                while True:
+                    acquired, probe = limiter.try_acquire(url)
+                    if acquired:
+                        break
+                    try:
+                        await asyncio.wait_for(condition.wait(), SLOT_POLL_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+            completed = False
+            try:
+                delay = limiter.reserve(url)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                start = time.monotonic()
+                try:
+                    response = await self._send(method, url, headers, timeout, stream)
+                except requests.RequestException as e:
+                    limiter.feedback(url, error=e)
+                    completed = True
+                    delay = limiter.retry_delay(url, attempt) if is_retryable(e) else None
+                    if delay is None:
+                        raise
+                else:
+                    limiter.feedback(url, response=response, latency=time.monotonic() - start)
+                    completed = True
+                    delay = limiter.retry_delay(url, attempt, response) if is_retryable(response) else None
+                    if delay is None:
+                        return response
+            finally:
+                limiter.release(url, probe, completed)
+                async with condition:
+                    condition.notify_all()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_many(self, specs: List[RequestSpec], limiter: Optional[HostRateLimiter]):
+        return await asyncio.gather(
+            *(self._send(method, url, limiter=limiter, **kwargs) for method, url, kwargs in specs),
+            return_exceptions=True
+        )
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30, stream: bool = False) -> TransportResponse:
+        return self._run(self._send(method, url, headers, timeout, stream))
+
+    def request_many(self, specs: List[RequestSpec],
+                     limiter: Optional[HostRateLimiter] = None) -> List[Union[TransportResponse, Exception]]:
+        return self._run(self._send_many(specs, limiter))
+
+    def close(self):
+        if self._loop.is_running():
+            self._run(self._client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+TRANSPORTS = {
+    RequestsTransport.name: RequestsTransport,
+    AsyncHTTPTransport.name: AsyncHTTPTransport
+}
+
+
+def create_transport(name: str = 'requests', headers: Optional[Dict[str, str]] = None,
+                     max_connections: int = 4) -> Transport:
+    """
+    Create a transport by name.
+
+    Args:
+        name: Transport name ('requests' or 'async')
+        headers: Default request headers
+        max_connections: Connection pool size
+
+    Returns:
+        Transport instance
+    """
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{name}', expected one of: {', '.join(TRANSPORTS)}")
+    return TRANSPORTS[name](headers=headers, max_connections=max_connections)